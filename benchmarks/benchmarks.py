@@ -1,8 +1,12 @@
+import subprocess
+import sys
 from io import StringIO
 
 from benchmarks import snippets
+from rich.cells import cell_len, cell_lens
 from rich.color import Color, ColorSystem
 from rich.console import Console
+from rich.highlighter import ReprHighlighter
 from rich.pretty import Pretty
 from rich.segment import Segment
 from rich.style import Style
@@ -245,3 +249,84 @@ class SegmentSuite:
 
     def test_divide_complex(self):
         list(Segment.divide(self.line, [5, 10, 20, 50, 108, 110, 118]))
+
+
+class CellsSuite:
+    def setup(self):
+        self.lines = [
+            f"{line} {index}"
+            for index, line in enumerate(
+                snippets.LOREM_IPSUM.splitlines() * 100
+            )
+        ]
+        self.unicode_lines = [
+            f"{line} {index}"
+            for index, line in enumerate(
+                snippets.UNICODE_HEAVY_TEXT.splitlines() * 100
+            )
+        ]
+
+    def time_cell_len(self):
+        for line in self.lines:
+            cell_len(line)
+
+    def time_cell_len_unicode_heavy(self):
+        for line in self.unicode_lines:
+            cell_len(line)
+
+    def time_cell_lens(self):
+        cell_lens(self.lines)
+
+
+class TextOverlappingSpansSuite:
+    def setup(self):
+        self.console = Console(
+            file=StringIO(), color_system="truecolor", legacy_windows=False
+        )
+        highlighter = ReprHighlighter()
+        self.text = highlighter(
+            Text.from_markup(
+                "[bold]{}[/bold]".format(
+                    " ".join(
+                        f"[italic]{{'key_{index}': [{index}, {index}.5, None, True]}}[/italic]"
+                        for index in range(200)
+                    )
+                )
+            )
+        )
+        self.nested_text = Text("x" * 2000)
+        for index in range(500):
+            self.nested_text.stylize(
+                f"color({index % 256})", index, 2000 - index * 3
+            )
+
+    def time_render_highlighted(self):
+        list(self.text.render(self.console))
+
+    def time_render_nested(self):
+        list(self.nested_text.render(self.console))
+
+
+class ImportSuite:
+    def timeraw_import_rich(self):
+        return "import rich"
+
+    def timeraw_import_console(self):
+        return "import rich.console"
+
+    def track_import_console_importtime(self):
+        """Cumulative time to import rich.console, as reported by -X importtime."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import rich.console"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in reversed(result.stderr.splitlines()):
+            # Lines are formatted as "import time: <self> | <cumulative> | <module>"
+            _self_time, cumulative, name = line.split("|")
+            if name.strip() == "rich.console":
+                return int(cumulative)
+        return 0
+
+    track_import_console_importtime.unit = "microseconds"
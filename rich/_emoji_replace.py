@@ -1,8 +1,6 @@
 from typing import Callable, Match, Optional
 import re
 
-from ._emoji_codes import EMOJI
-
 
 _ReStringMatch = Match[str]  # regex match object
 _ReSubCallable = Callable[[_ReStringMatch], str]  # Callable invoked by re.sub
@@ -19,6 +17,11 @@ def _emoji_replace(
     ).sub,
 ) -> str:
     """Replace emoji code in text."""
+    if ":" not in text:
+        return text
+    # The emoji table is large, so it is imported on first use
+    from ._emoji_codes import EMOJI
+
     get_emoji = EMOJI.__getitem__
     variants = {"text": "\ufe0e", "emoji": "\ufe0f"}
     get_variant = variants.get
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Iterable, List, Optional, TYPE_CHECKING, Union, Callable
 
 
+from .cells import cell_len, set_cell_size
 from .text import Text, TextType
 
 if TYPE_CHECKING:
@@ -92,6 +93,92 @@ class LogRender:
         output.add_row(*row)
         return output
 
+    def render_plain(
+        self,
+        width: int,
+        message: str,
+        log_time: datetime,
+        time_format: Optional[Union[str, FormatTimeCallable]] = None,
+        level: str = "",
+        path: Optional[str] = None,
+        line_no: Optional[int] = None,
+    ) -> Optional[str]:
+        """Render a log line as plain text, for a console which doesn't write styles.
+
+        The text is the same as rendering the table returned from :meth:`__call__`, but is
+        built from strings. Only messages which fit on a single line may be rendered.
+
+        Args:
+            width (int): Width of the console.
+            message (str): Log message.
+            log_time (datetime): Time of log.
+            time_format (Union[str, FormatTimeCallable], optional): Format of the time, or None for the default.
+            level (str, optional): Level name, padded to the width of the level column.
+            path (str, optional): Path of the file which logged the message.
+            line_no (int, optional): Line number of the log call.
+
+        Returns:
+            Optional[str]: A line of text (with a new line), or None if the message needs
+                to be wrapped, and should be rendered with :meth:`__call__`.
+        """
+        columns: List[str] = []
+        last_time = self._last_time
+        omit_time = False
+        if self.show_time:
+            time_format = time_format or self.time_format
+            if callable(time_format):
+                last_time = time_format(log_time)
+                time_column = last_time.plain
+            else:
+                time_column = log_time.strftime(time_format)
+                if not (
+                    last_time is not None
+                    and last_time.plain == time_column
+                    and not last_time.spans
+                ):
+                    last_time = None
+            omit_time = (
+                last_time is not None
+                and last_time == self._last_time
+                and self.omit_repeated_times
+            )
+            columns.append(
+                " " * len(time_column) if omit_time else time_column
+            )
+        if self.show_level:
+            if self.level_width is not None:
+                if cell_len(level) > self.level_width:
+                    return None
+                level = set_cell_size(level, self.level_width)
+            columns.append(level)
+        path_column: Optional[str] = None
+        if self.show_path and path:
+            path_column = f"{path}:{line_no}" if line_no else path
+        message_width = width - len(columns)
+        for column in columns:
+            message_width -= cell_len(column)
+        if path_column is not None:
+            message_width -= cell_len(path_column) + 1
+        message_length = cell_len(message)
+        if (
+            not message_length
+            or message_length > message_width
+            or message.isspace()
+        ):
+            return None
+        columns.append(message + " " * (message_width - message_length))
+        if path_column is not None:
+            columns.append(path_column)
+        line = " ".join(columns)
+        if not line.isprintable():
+            return None
+        if self.show_time and not omit_time:
+            # Only create a Text when the time changes
+            self._last_time = (
+                Text(time_column) if last_time is None else last_time
+            )
+        return f"{line}\n"
+
 
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
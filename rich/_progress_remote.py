@@ -0,0 +1,251 @@
+import os
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+from types import TracebackType
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+    from .progress import Progress, TaskID
+
+# A batch of messages, each of which is ("advance", TASK ID, STEPS) or ("update", TASK ID, FIELDS)
+Messages = List[Tuple[str, int, Any]]
+
+# Connections from this process to the progress in another process, keyed on (PID, ADDRESS).
+# The PID is part of the key, so that a forked process doesn't share its parent's connection.
+_connections: Dict[Tuple[int, Any], "Connection"] = {}
+_connections_lock = Lock()
+
+
+def _send(address: Any, authkey: bytes, messages: Messages) -> None:
+    """Send messages to a progress in another process.
+
+    Messages are dropped if the progress has stopped, so that a worker doesn't fail because of progress reporting.
+
+    Args:
+        address (Any): Address of the progress' listener.
+        authkey (bytes): Key to authenticate with the listener.
+        messages (Messages): Messages to send.
+    """
+    from multiprocessing.connection import Client
+
+    key = (os.getpid(), address)
+    with _connections_lock:
+        try:
+            connection = _connections.get(key)
+            if connection is None:
+                connection = _connections[key] = Client(
+                    address, authkey=authkey
+                )
+            connection.send(messages)
+        except (OSError, EOFError):
+            connection = _connections.pop(key, None)
+            if connection is not None:
+                connection.close()
+
+
+class RemoteTask:
+    """A handle to update a progress task from another process.
+
+    Advances are sent in batches, at most once every ``update_period`` seconds. Call :meth:`flush`
+    (or use the handle as a context manager) to send the steps advanced since the last batch.
+    Get a remote task from :meth:`~rich.progress.Progress.get_remote_handle`.
+
+    Args:
+        address (Any): Address of the progress' listener.
+        authkey (bytes): Key to authenticate with the listener.
+        task_id (TaskID): Task to update.
+        update_period (float, optional): Minimum time (in seconds) between sending advances. Defaults to 0.1.
+    """
+
+    def __init__(
+        self,
+        address: Any,
+        authkey: bytes,
+        task_id: "TaskID",
+        update_period: float = 0.1,
+    ) -> None:
+        self._address = address
+        self._authkey = authkey
+        self.task_id = task_id
+        self.update_period = update_period
+        self._advance: float = 0
+        self._next_send = monotonic() + update_period
+        self._lock = Lock()
+
+    def __reduce__(self) -> Tuple[Type["RemoteTask"], Tuple[Any, ...]]:
+        # Steps not yet sent stay with this handle
+        return (
+            RemoteTask,
+            (self._address, self._authkey, self.task_id, self.update_period),
+        )
+
+    def __repr__(self) -> str:
+        return f"<RemoteTask task_id={self.task_id!r}>"
+
+    def __enter__(self) -> "RemoteTask":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.flush()
+
+    def advance(self, advance: float = 1) -> None:
+        """Advance the task by a number of steps.
+
+        Args:
+            advance (float): Number of steps to advance. Default is 1.
+        """
+        with self._lock:
+            self._advance += advance
+            if monotonic() < self._next_send:
+                return
+        self.flush()
+
+    def update(self, **fields: Any) -> None:
+        """Update the task, with the same arguments as :meth:`~rich.progress.Progress.update`
+        (other than ``refresh``). Updates are sent immediately.
+
+        Args:
+            **fields (Any): Arguments for :meth:`~rich.progress.Progress.update`.
+        """
+        self._send([("update", self.task_id, fields)])
+
+    def flush(self) -> None:
+        """Send the steps advanced since the last batch."""
+        self._send([])
+
+    def _send(self, messages: Messages) -> None:
+        """Send messages, after any advance not yet sent."""
+        with self._lock:
+            if self._advance:
+                messages.insert(0, ("advance", self.task_id, self._advance))
+                self._advance = 0
+            self._next_send = monotonic() + self.update_period
+            if messages:
+                _send(self._address, self._authkey, messages)
+
+
+class RemoteCollector:
+    """Listens for updates from remote tasks, and applies them to a progress.
+
+    Args:
+        progress (Progress): Progress to update.
+    """
+
+    def __init__(self, progress: "Progress") -> None:
+        from multiprocessing.connection import Listener
+
+        self.progress = progress
+        self.authkey = os.urandom(32)
+        self._listener = Listener(authkey=self.authkey)
+        self.address = self._listener.address
+        self._connections: List["Connection"] = []
+        self._lock = Lock()
+        self._closing = Event()
+        self._accept_thread = Thread(target=self._accept, daemon=True)
+        self._collect_thread = Thread(target=self._collect, daemon=True)
+        self._accept_thread.start()
+        self._collect_thread.start()
+
+    def close(self) -> None:
+        """Stop listening, after applying the updates which have been sent."""
+        self._closing.set()
+        # Wake the thread waiting to accept a connection. The accept thread may already
+        # have exited, in which case closing the listener releases the waiting client.
+        Thread(target=self._wake, daemon=True).start()
+        self._accept_thread.join()
+        self._listener.close()
+        self._collect_thread.join()
+
+    def _wake(self) -> None:
+        """Connect to the listener, so that a pending accept returns."""
+        from multiprocessing.connection import Client
+
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except (OSError, EOFError):
+            pass
+
+    def _accept(self) -> None:
+        """Accept connections from remote tasks, until closed."""
+        from multiprocessing import AuthenticationError
+
+        while True:
+            try:
+                connection = self._listener.accept()
+            except AuthenticationError:
+                continue
+            except (OSError, EOFError):
+                return
+            # Kept even when closing, as a remote task may have sent updates
+            with self._lock:
+                self._connections.append(connection)
+            if self._closing.is_set():
+                return
+
+    def _collect(self) -> None:
+        """Receive messages from remote tasks, until closed."""
+        from multiprocessing.connection import wait
+
+        while True:
+            if self._closing.is_set():
+                # Apply anything sent before close, then stop
+                self._accept_thread.join()
+                for connection in self._connections[:]:
+                    while self._receive(connection) and connection.poll():
+                        pass
+                    connection.close()
+                return
+            with self._lock:
+                connections = self._connections[:]
+            if not connections:
+                self._closing.wait(0.05)
+                continue
+            ready = wait(connections, timeout=0.05)
+            for connection in connections:
+                if connection in ready:
+                    self._receive(connection)
+
+    def _receive(self, connection: "Connection") -> bool:
+        """Receive and apply a batch of messages.
+
+        Returns:
+            bool: True if the connection is still open.
+        """
+        from .progress import TaskID
+
+        try:
+            if not connection.poll():
+                return True
+            messages: Messages = connection.recv()
+        except (OSError, EOFError):
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+            connection.close()
+            return False
+        progress = self.progress
+        for message, task_id, value in messages:
+            try:
+                if message == "advance":
+                    progress.advance(TaskID(task_id), value)
+                elif message == "update":
+                    progress.update(TaskID(task_id), **value)
+            except KeyError:
+                # Task has been removed
+                pass
+        return True
@@ -0,0 +1,187 @@
+import sys
+import threading
+from itertools import count
+from threading import Event, ExceptHookArgs, Lock, Thread, current_thread
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+MAX_IDLE_INTERVAL = 0.5
+"""Maximum time (in seconds) between frames, when nothing has changed."""
+
+
+class _Client:
+    """A callback registered with a refresh scheduler."""
+
+    __slots__ = ["callback", "interval", "update", "due"]
+
+    def __init__(
+        self,
+        callback: Callable[[], bool],
+        interval: float,
+        update: bool,
+        due: float,
+    ) -> None:
+        self.callback = callback
+        self.interval = interval
+        self.update = update
+        self.due = due
+
+
+class RefreshScheduler:
+    """Calls the refresh callbacks of live displays from a single thread.
+
+    Frames run at the highest rate requested by any callback, and each callback is called
+    when its own interval has elapsed, so callbacks due at the same time are coalesced in
+    to one frame. Callbacks return True if anything changed. While nothing changes the time
+    between frames doubles, up to ``MAX_IDLE_INTERVAL``, until :meth:`wake` is called.
+
+    Args:
+        clock (Callable[[], float], optional): Function which returns the time in seconds.
+            Defaults to time.monotonic.
+    """
+
+    def __init__(self, clock: Callable[[], float] = monotonic) -> None:
+        self._clock = clock
+        self._lock = Lock()
+        self._clients: Dict[int, _Client] = {}
+        self._client_ids = count()
+        self._thread: Optional[Thread] = None
+        self._wake = Event()
+        self._idle = False
+
+    def __repr__(self) -> str:
+        return f"<RefreshScheduler clients={len(self._clients)}>"
+
+    @property
+    def refresh_per_second(self) -> Optional[float]:
+        """The rate of frames, or None if there are no callbacks."""
+        with self._lock:
+            if not self._clients:
+                return None
+            return 1 / min(
+                client.interval for client in self._clients.values()
+            )
+
+    def add(
+        self,
+        callback: Callable[[], bool],
+        refresh_per_second: float,
+        *,
+        update: bool = False,
+    ) -> int:
+        """Add a callback to be called at regular intervals.
+
+        Args:
+            callback (Callable[[], bool]): A callable which returns True if it changed anything.
+            refresh_per_second (float): Number of times per second to call the callback.
+            update (bool, optional): The callback updates state which is displayed by other callbacks,
+                and should be called first in a frame. Defaults to False.
+
+        Returns:
+            int: An ID which may be passed to :meth:`remove`.
+        """
+        assert refresh_per_second > 0, "refresh_per_second must be > 0"
+        interval = 1 / refresh_per_second
+        client = _Client(callback, interval, update, self._clock() + interval)
+        with self._lock:
+            client_id = next(self._client_ids)
+            self._clients[client_id] = client
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._idle = False
+        self._wake.set()
+        return client_id
+
+    def remove(self, client_id: int) -> None:
+        """Remove a callback. The scheduler thread exits when there are no callbacks.
+
+        Note that the callback may be running in the scheduler thread when this is called.
+
+        Args:
+            client_id (int): ID returned from :meth:`add`.
+        """
+        with self._lock:
+            self._clients.pop(client_id, None)
+            if not self._clients:
+                self._thread = None
+        self._wake.set()
+
+    def wake(self) -> None:
+        """Return to the full rate of frames, if the scheduler has backed off."""
+        if self._idle:
+            self._idle = False
+            self._wake.set()
+
+    def _get_due(self, now: float) -> Optional[List[_Client]]:
+        """Get the clients due to be called, or None if the thread should exit."""
+        with self._lock:
+            if self._thread is not current_thread():
+                return None
+            clients = list(self._clients.values())
+        # Callbacks due within half a frame are called in this frame
+        frame = min(client.interval for client in clients) / 2
+        due = [client for client in clients if client.due - frame <= now]
+        due.sort(key=lambda client: not client.update)
+        return due
+
+    def _remove_client(self, client: _Client) -> None:
+        """Remove a client which failed."""
+        with self._lock:
+            for client_id, other_client in list(self._clients.items()):
+                if other_client is client:
+                    del self._clients[client_id]
+            if not self._clients:
+                self._thread = None
+
+    def _run(self) -> None:
+        """Run frames until there are no callbacks."""
+        try:
+            self._run_frames()
+        finally:
+            # Allow a new thread to start, if this one exited unexpectedly
+            with self._lock:
+                if self._thread is current_thread():
+                    self._thread = None
+
+    def _run_frames(self) -> None:
+        """Run frames until there are no callbacks, or another thread takes over."""
+        idle_frames = 0
+        wait = self._wake.wait
+        while True:
+            with self._lock:
+                if self._thread is not current_thread():
+                    return
+                interval = min(
+                    client.interval for client in self._clients.values()
+                )
+            if idle_frames:
+                interval = min(
+                    interval * 2**idle_frames,
+                    max(interval, MAX_IDLE_INTERVAL),
+                )
+            if wait(interval):
+                self._wake.clear()
+                idle_frames = 0
+            now = self._clock()
+            due = self._get_due(now)
+            if due is None:
+                return
+            changed = False
+            for client in due:
+                client.due = now + client.interval
+                try:
+                    if client.callback():
+                        changed = True
+                except Exception:
+                    # Drop the client, so that it doesn't stop the other clients
+                    self._remove_client(client)
+                    threading.excepthook(
+                        ExceptHookArgs([*sys.exc_info(), current_thread()])
+                    )
+            if changed:
+                idle_frames = 0
+                self._idle = False
+            elif due:
+                idle_frames = min(idle_frames + 1, 16)
+                self._idle = True
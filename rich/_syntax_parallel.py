@@ -0,0 +1,147 @@
+import re
+from itertools import repeat
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Type
+
+from pygments.lexer import Lexer
+from pygments.token import Error, String, string_to_tokentype
+
+TokenType = Tuple[str, ...]
+
+# Patterns matching the positions where a lexer may start again without changing the
+# tokens, for lexers which are known to be safe to lex in chunks. Keyed on lexer alias.
+CHUNK_BOUNDARIES: Dict[str, Pattern[str]] = {
+    # A line starting at column 0 after a blank line is a new top level statement,
+    # unless it is within a string (which is checked after lexing)
+    "python": re.compile(r"\n\n(?=\S)"),
+    "diff": re.compile(r"\n"),
+    "text": re.compile(r"\n"),
+}
+
+
+def get_chunk_boundary(lexer: Lexer) -> Optional[Pattern[str]]:
+    """Get a pattern which matches safe boundaries to split code for a lexer.
+
+    Args:
+        lexer (Lexer): A Pygments lexer.
+
+    Returns:
+        Optional[Pattern[str]]: A compiled regex, or None if the lexer is not chunk safe.
+    """
+    if lexer.filters or lexer.stripnl or lexer.stripall:
+        # Filters may depend on previous tokens, and stripping would remove newlines
+        # at the boundaries
+        return None
+    for alias in lexer.aliases:
+        boundary = CHUNK_BOUNDARIES.get(alias)
+        if boundary is not None:
+            return boundary
+    return None
+
+
+def split_code(
+    code: str, boundary: Pattern[str], chunk_size: int
+) -> List[str]:
+    """Split code in to chunks of at least chunk_size characters, at boundaries.
+
+    Args:
+        code (str): Code to split.
+        boundary (Pattern[str]): Pattern matching positions to split at.
+        chunk_size (int): Minimum number of characters in a chunk (other than the last).
+
+    Returns:
+        List[str]: Chunks of code.
+    """
+    chunks: List[str] = []
+    position = 0
+    code_length = len(code)
+    while position < code_length:
+        match = boundary.search(code, position + chunk_size)
+        if match is None:
+            break
+        chunks.append(code[position : match.end()])
+        position = match.end()
+    if position < code_length or not chunks:
+        chunks.append(code[position:])
+    return chunks
+
+
+def lex_chunk(
+    lexer_type: Type[Lexer], options: Dict[str, Any], code: str
+) -> List[Tuple[str, str]]:
+    """Lex a chunk of code (in a worker process).
+
+    Args:
+        lexer_type (Type[Lexer]): Lexer class.
+        options (Dict[str, Any]): Lexer options.
+        code (str): Code to lex.
+
+    Returns:
+        List[Tuple[str, str]]: A list of (TOKEN TYPE NAME, TEXT) tuples. Token types are
+            sent as names, which are much cheaper to pickle.
+    """
+    lexer = lexer_type(**options)
+    return [
+        (".".join(token_type), token)
+        for token_type, token in lexer.get_tokens(code)
+    ]
+
+
+def lex_parallel(
+    lexer: Lexer,
+    code: str,
+    chunk_size: int,
+    max_workers: Optional[int] = None,
+) -> Optional[List[Tuple[TokenType, str]]]:
+    """Lex code in a pool of processes.
+
+    Args:
+        lexer (Lexer): A Pygments lexer.
+        code (str): Code to lex.
+        chunk_size (int): Minimum number of characters to lex in each process.
+        max_workers (int, optional): Maximum number of processes, or None for the
+            number of CPUs. Defaults to None.
+
+    Returns:
+        Optional[List[Tuple[TokenType, str]]]: A list of (TOKEN TYPE, TEXT) tuples, or
+            None if the code could not be lexed in parallel, and should be lexed serially.
+    """
+    boundary = get_chunk_boundary(lexer)
+    if boundary is None:
+        return None
+    chunks = split_code(code, boundary, chunk_size)
+    if len(chunks) < 2:
+        return None
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_tokens = list(
+                executor.map(
+                    lex_chunk,
+                    repeat(type(lexer)),
+                    repeat(lexer.options),
+                    chunks,
+                )
+            )
+    except Exception:
+        # Process pools are not available on every platform (or may fail to start)
+        return None
+
+    token_types: Dict[str, TokenType] = {}
+    tokens: List[Tuple[TokenType, str]] = []
+    append = tokens.append
+    for chunk_no, chunk in enumerate(chunk_tokens, 1):
+        for token_name, token in chunk:
+            token_type = token_types.get(token_name)
+            if token_type is None:
+                token_type = token_types[token_name] = string_to_tokentype(
+                    token_name
+                )
+            if token_type in Error:
+                return None
+            append((token_type, token))
+        if chunk_no < len(chunk_tokens) and tokens and tokens[-1][0] in String:
+            # The chunk ended within a string, so the boundary was not safe
+            return None
+    return tokens
@@ -4,7 +4,7 @@ import re
 from typing import Iterable
 
 from ._loop import loop_last
-from .cells import cell_len, chop_cells
+from .cells import _is_single_cell_text, cell_len, chop_cells
 
 re_word = re.compile(r"\s*\S+\s*")
 
@@ -39,7 +39,8 @@ def divide_line(text: str, width: int, fold: bool = True) -> list[int]:
     break_positions: list[int] = []  # offsets to insert the breaks at
     append = break_positions.append
     cell_offset = 0
-    _cell_len = cell_len
+    # If every character is a single cell, the cell length of a word is its length
+    _cell_len = len if _is_single_cell_text(text) else cell_len
 
     for start, _end, word in words(text):
         word_length = _cell_len(word.rstrip())
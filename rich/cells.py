@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from functools import lru_cache
-from typing import Callable
+from typing import Callable, Iterable
 
-from ._cell_widths import CELL_WIDTHS
+from ._cell_widths import CELL_WIDTH_RANGES
+
+# The start, end, and cell width of ranges in CELL_WIDTH_RANGES, as parallel tuples.
+# Starts are ordered, so may be bisected to find the range containing a codepoint.
+_RANGE_STARTS: tuple[int, ...] = CELL_WIDTH_RANGES[0::3]
+_RANGE_ENDS: tuple[int, ...] = CELL_WIDTH_RANGES[1::3]
+_RANGE_WIDTHS: tuple[int, ...] = tuple(
+    max(0, width) for width in CELL_WIDTH_RANGES[2::3]
+)
 
 # Ranges of unicode ordinals that produce a 1-cell wide character
 # This is non-exhaustive, but covers most common Western characters
@@ -30,6 +39,54 @@ _SINGLE_CELLS = frozenset(
 _is_single_cell_widths: Callable[[str], bool] = _SINGLE_CELLS.issuperset
 
 
+def _make_bmp_cell_widths() -> bytes:
+    """Make a table of cell widths for the Basic Multilingual Plane, indexed by codepoint."""
+    widths = bytearray(b"\x01") * 0x10000
+    for start, end, width in zip(_RANGE_STARTS, _RANGE_ENDS, _RANGE_WIDTHS):
+        if start > 0xFFFF:
+            break
+        end = min(end, 0xFFFF)
+        widths[start : end + 1] = bytes((width,)) * (end - start + 1)
+    return bytes(widths)
+
+
+# Cell widths of characters in the Basic Multilingual Plane, which covers most text
+_BMP_CELL_WIDTHS = _make_bmp_cell_widths()
+
+
+def _is_single_cell_text(text: str) -> bool:
+    """Check if every character in text is a single cell wide.
+
+    Args:
+        text (str): Text to check.
+
+    Returns:
+        bool: True if the cell length of text is equal to its length.
+    """
+    # isascii is constant time, and isprintable excludes ASCII control codes
+    if text.isascii():
+        return text.isprintable()
+    return _is_single_cell_widths(text)
+
+
+def _uncached_cell_len(text: str) -> int:
+    """Get the number of cells required to display text, without caching.
+
+    Args:
+        text (str): Text to display.
+
+    Returns:
+        int: Get the number of cells required to display text.
+    """
+    if _is_single_cell_text(text):
+        return len(text)
+    try:
+        return sum(map(_BMP_CELL_WIDTHS.__getitem__, map(ord, text)))
+    except IndexError:
+        # Text contains characters outside of the Basic Multilingual Plane
+        return sum(map(get_character_cell_size, text))
+
+
 @lru_cache(4096)
 def cached_cell_len(text: str) -> int:
     """Get the number of cells required to display text.
@@ -43,9 +100,7 @@ def cached_cell_len(text: str) -> int:
     Returns:
         int: Get the number of cells required to display text.
     """
-    if _is_single_cell_widths(text):
-        return len(text)
-    return sum(map(get_character_cell_size, text))
+    return _uncached_cell_len(text)
 
 
 def cell_len(
@@ -59,11 +114,28 @@ def cell_len(
     Returns:
         int: Get the number of cells required to display text.
     """
+    if text.isascii() and text.isprintable():
+        return len(text)
     if len(text) < 512:
         return _cell_len(text)
-    if _is_single_cell_widths(text):
-        return len(text)
-    return sum(map(get_character_cell_size, text))
+    return _uncached_cell_len(text)
+
+
+def cell_lens(texts: Iterable[str]) -> list[int]:
+    """Get the number of cells required to display each of a number of strings.
+
+    This is faster than calling `cell_len` for each string, when the strings are mostly single-cell.
+
+    Args:
+        texts (Iterable[str]): Strings to display.
+
+    Returns:
+        list[int]: The number of cells required for each string.
+    """
+    texts = list(texts)
+    if _is_single_cell_text("".join(texts)):
+        return list(map(len, texts))
+    return list(map(cell_len, texts))
 
 
 @lru_cache(maxsize=4096)
@@ -77,28 +149,18 @@ def get_character_cell_size(character: str) -> int:
         int: Number of cells (0, 1 or 2) occupied by that character.
     """
     codepoint = ord(character)
-    _table = CELL_WIDTHS
-    lower_bound = 0
-    upper_bound = len(_table) - 1
-    index = (lower_bound + upper_bound) // 2
-    while True:
-        start, end, width = _table[index]
-        if codepoint < start:
-            upper_bound = index - 1
-        elif codepoint > end:
-            lower_bound = index + 1
-        else:
-            return 0 if width == -1 else width
-        if upper_bound < lower_bound:
-            break
-        index = (lower_bound + upper_bound) // 2
+    if codepoint <= 0xFFFF:
+        return _BMP_CELL_WIDTHS[codepoint]
+    index = bisect_right(_RANGE_STARTS, codepoint) - 1
+    if codepoint <= _RANGE_ENDS[index]:
+        return _RANGE_WIDTHS[index]
     return 1
 
 
 def set_cell_size(text: str, total: int) -> str:
     """Set the length of a string to fit within given number of cells."""
 
-    if _is_single_cell_widths(text):
+    if _is_single_cell_text(text):
         size = len(text)
         if size < total:
             return text + " " * (total - size)
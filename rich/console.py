@@ -8,7 +8,6 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
 from getpass import getpass
-from html import escape
 from inspect import isclass
 from itertools import islice
 from math import ceil
@@ -45,7 +44,6 @@ else:
 
 from . import errors, themes
 from ._emoji_replace import _emoji_replace
-from ._export_format import CONSOLE_HTML_FORMAT, CONSOLE_SVG_FORMAT
 from ._fileno import get_fileno
 from ._log_render import FormatTimeCallable, LogRender
 from .align import Align, AlignMethod
@@ -55,14 +53,10 @@ from .emoji import EmojiVariant
 from .highlighter import NullHighlighter, ReprHighlighter
 from .markup import render as render_markup
 from .measure import Measurement, measure_renderables
-from .pager import Pager, SystemPager
-from .pretty import Pretty, is_expandable
 from .protocol import rich_cast
 from .region import Region
-from .scope import render_scope
-from .screen import Screen
 from .segment import Segment
-from .style import Style, StyleType
+from .style import Style, StyleTable, StyleType
 from .styled import Styled
 from .terminal_theme import (
     DEFAULT_TERMINAL_THEME,
@@ -72,13 +66,20 @@ from .terminal_theme import (
 from .text import Text, TextType
 from .theme import Theme, ThemeStack
 
+# Modules only required by some features (export, pager, pretty, scope, screen) are
+# imported when first used, to reduce the time taken to import rich.console.
+
 if TYPE_CHECKING:
+    from ._refresh import RefreshScheduler
     from ._windows import WindowsConsoleFeatures
     from .live import Live
+    from .pager import Pager
     from .status import Status
 
 JUPYTER_DEFAULT_COLUMNS = 115
 JUPYTER_DEFAULT_LINES = 100
+STYLE_RENDER_CACHE_SIZE = 4096
+STYLE_TABLE_SIZE = 4096
 WINDOWS = sys.platform == "win32"
 
 HighlighterType = Callable[[Union[str, "Text"]], "Text"]
@@ -385,10 +386,12 @@ class PagerContext:
     def __init__(
         self,
         console: "Console",
-        pager: Optional[Pager] = None,
+        pager: Optional["Pager"] = None,
         styles: bool = False,
         links: bool = False,
     ) -> None:
+        from .pager import SystemPager
+
         self._console = console
         self.pager = SystemPager() if pager is None else pager
         self.styles = styles
@@ -424,6 +427,8 @@ class ScreenContext:
     def __init__(
         self, console: "Console", hide_cursor: bool, style: StyleType = ""
     ) -> None:
+        from .screen import Screen
+
         self.console = console
         self.hide_cursor = hide_cursor
         self.screen = Screen(style=style)
@@ -634,6 +639,7 @@ class Console:
         get_datetime (Callable[[], datetime], optional): Callable that gets the current time as a datetime.datetime object (used by Console.log),
             or None for datetime.now.
         get_time (Callable[[], time], optional): Callable that gets the current time in seconds, default uses time.monotonic.
+        stream_lines (int, optional): Number of lines to render between writes, when printing with ``stream=True``. Defaults to 100.
     """
 
     _environ: Mapping[str, str] = os.environ
@@ -670,6 +676,7 @@ class Console:
         safe_box: bool = True,
         get_datetime: Optional[Callable[[], datetime]] = None,
         get_time: Optional[Callable[[], float]] = None,
+        stream_lines: int = 100,
         _environ: Optional[Mapping[str, str]] = None,
     ):
         # Copy of os.environ allows us to replace it for testing
@@ -745,6 +752,7 @@ class Console:
         self.safe_box = safe_box
         self.get_datetime = get_datetime or datetime.now
         self.get_time = get_time or monotonic
+        self.stream_lines = stream_lines
         self.style = style
         self.no_color = (
             no_color if no_color is not None else "NO_COLOR" in self._environ
@@ -763,6 +771,11 @@ class Console:
         self._render_hooks: List[RenderHook] = []
         self._live: Optional["Live"] = None
         self._is_alt_screen = False
+        # Rendered (prefix, suffix) codes for styles, for the color system in _style_render_system
+        self._style_render_cache: Dict[Style, Tuple[str, str]] = {}
+        self._style_render_system = self._color_system
+        self._style_table = StyleTable()
+        self._refresh_scheduler: Optional["RefreshScheduler"] = None
 
     def __repr__(self) -> str:
         return f"<console width={self.width} {self._color_system!s}>"
@@ -1125,7 +1138,7 @@ class Console:
 
     def pager(
         self,
-        pager: Optional[Pager] = None,
+        pager: Optional["Pager"] = None,
         styles: bool = False,
         links: bool = False,
     ) -> PagerContext:
@@ -1498,6 +1511,34 @@ class Console:
 
         return rich_text
 
+    @property
+    def style_table(self) -> StyleTable:
+        """Get the table of interned styles used to combine styles when rendering.
+
+        The table is replaced with a new one when it holds more than ``STYLE_TABLE_SIZE`` styles,
+        so style ids should not be kept between renders.
+
+        Returns:
+            StyleTable: A table of styles.
+        """
+        if len(self._style_table) > STYLE_TABLE_SIZE:
+            self._style_table = StyleTable()
+        return self._style_table
+
+    @property
+    def refresh_scheduler(self) -> "RefreshScheduler":
+        """Get the scheduler which refreshes live displays on this console.
+
+        Returns:
+            RefreshScheduler: A refresh scheduler, shared by live displays and progress tracking.
+        """
+        with self._lock:
+            if self._refresh_scheduler is None:
+                from ._refresh import RefreshScheduler
+
+                self._refresh_scheduler = RefreshScheduler()
+            return self._refresh_scheduler
+
     def get_style(
         self,
         name: Union[str, Style],
@@ -1596,11 +1637,14 @@ class Console:
             elif isinstance(renderable, ConsoleRenderable):
                 check_text()
                 append(renderable)
-            elif is_expandable(renderable):
-                check_text()
-                append(Pretty(renderable, highlighter=_highlighter))
             else:
-                append_text(_highlighter(str(renderable)))
+                from .pretty import Pretty, is_expandable
+
+                if is_expandable(renderable):
+                    check_text()
+                    append(Pretty(renderable, highlighter=_highlighter))
+                else:
+                    append_text(_highlighter(str(renderable)))
 
         check_text()
 
@@ -1694,6 +1738,7 @@ class Console:
         crop: bool = True,
         soft_wrap: Optional[bool] = None,
         new_line_start: bool = False,
+        stream: bool = False,
     ) -> None:
         """Print to the console.
 
@@ -1713,6 +1758,8 @@ class Console:
             soft_wrap (bool, optional): Enable soft wrap mode which disables word wrapping and cropping of text or ``None`` for
                 Console default. Defaults to ``None``.
             new_line_start (bool, False): Insert a new line at the start if the output contains more than one line. Defaults to ``False``.
+            stream (bool, optional): Write output every :attr:`stream_lines` lines as it is rendered, rather than once rendering
+                is complete. Has no effect if ``new_line_start`` is set. Defaults to ``False``.
         """
         if not objects:
             objects = (NewLine(),)
@@ -1750,9 +1797,22 @@ class Console:
                 highlight=highlight,
             )
 
+            render = self.render
+            if stream and not new_line_start:
+                segments: Iterable[Segment] = (
+                    segment
+                    for renderable in renderables
+                    for segment in render(renderable, render_options)
+                )
+                if style is not None:
+                    segments = Segment.apply_style(
+                        segments, self.get_style(style)
+                    )
+                self._stream_segments(segments, crop)
+                return
+
             new_segments: List[Segment] = []
             extend = new_segments.extend
-            render = self.render
             if style is None:
                 for renderable in renderables:
                     extend(render(renderable, render_options))
@@ -1783,6 +1843,41 @@ class Console:
             else:
                 self._buffer.extend(new_segments)
 
+    def _stream_segments(
+        self, segments: Iterable[Segment], crop: bool
+    ) -> None:
+        """Add segments to the buffer, writing it every `stream_lines` lines.
+
+        If not cropping, the buffer is written at the end of the segment which completes the lines.
+
+        Args:
+            segments (Iterable[Segment]): Rendered segments.
+            crop (bool): Crop lines to the width of the terminal.
+        """
+        stream_lines = max(1, self.stream_lines)
+        buffer = self._buffer
+        line_count = 0
+        if crop:
+            for line in Segment.split_and_crop_lines(
+                segments, self.width, pad=False
+            ):
+                buffer.extend(line)
+                line_count += 1
+                if line_count >= stream_lines:
+                    # Leaving the buffer context writes the buffer, unless in a nested context
+                    self._exit_buffer()
+                    self._enter_buffer()
+                    line_count = 0
+        else:
+            for segment in segments:
+                buffer.append(segment)
+                if not segment.control:
+                    line_count += segment.text.count("\n")
+                    if line_count >= stream_lines:
+                        self._exit_buffer()
+                        self._enter_buffer()
+                        line_count = 0
+
     def print_json(
         self,
         json: Optional[str] = None,
@@ -2030,6 +2125,8 @@ class Console:
             )
             path = filename.rpartition(os.sep)[-1]
             if log_locals:
+                from .scope import render_scope
+
                 locals_map = {
                     key: value
                     for key, value in locals.items()
@@ -2179,15 +2276,35 @@ class Console:
         not_terminal = not self.is_terminal
         if self.no_color and color_system:
             buffer = Segment.remove_color(buffer)
+        style_cache = self._style_render_cache
+        if self._style_render_system != color_system:
+            style_cache.clear()
+            self._style_render_system = color_system
         for text, style, control in buffer:
             if style:
-                append(
-                    style.render(
-                        text,
-                        color_system=color_system,
-                        legacy_windows=legacy_windows,
+                if not text or color_system is None:
+                    append(text)
+                elif style.link:
+                    # Styles with links compare equal but have distinct link ids, so can't be cached
+                    append(
+                        style.render(
+                            text,
+                            color_system=color_system,
+                            legacy_windows=legacy_windows,
+                        )
                     )
-                )
+                else:
+                    codes = style_cache.get(style)
+                    if codes is None:
+                        if len(style_cache) >= STYLE_RENDER_CACHE_SIZE:
+                            style_cache.clear()
+                        codes = style_cache[style] = style.get_render_codes(
+                            color_system, legacy_windows
+                        )
+                    prefix, suffix = codes
+                    append(prefix)
+                    append(text)
+                    append(suffix)
             elif not (not_terminal and control):
                 append(text)
 
@@ -2289,7 +2406,7 @@ class Console:
         Args:
             theme (TerminalTheme, optional): TerminalTheme object containing console colors.
             clear (bool, optional): Clear record buffer after exporting. Defaults to ``True``.
-            code_format (str, optional): Format string to render HTML. In addition to '{foreground}',
+            code_format (str, optional): Format string to render HTML, or ``None`` for the default. In addition to '{foreground}',
                 '{background}', and '{code}', should contain '{stylesheet}' if inline_styles is ``False``.
             inline_styles (bool, optional): If ``True`` styles will be inlined in to spans, which makes files
                 larger but easier to cut and paste markup. If ``False``, styles will be embedded in a style tag.
@@ -2298,6 +2415,10 @@ class Console:
         Returns:
             str: String containing console contents as HTML.
         """
+        from html import escape
+
+        from ._export_format import CONSOLE_HTML_FORMAT
+
         assert (
             self.record
         ), "To export console contents set record=True in the constructor or instance"
@@ -2365,7 +2486,7 @@ class Console:
         *,
         theme: Optional[TerminalTheme] = None,
         clear: bool = True,
-        code_format: str = CONSOLE_HTML_FORMAT,
+        code_format: Optional[str] = None,
         inline_styles: bool = False,
     ) -> None:
         """Generate HTML from console contents and write to a file (requires record=True argument in constructor).
@@ -2374,7 +2495,7 @@ class Console:
             path (str): Path to write html file.
             theme (TerminalTheme, optional): TerminalTheme object containing console colors.
             clear (bool, optional): Clear record buffer after exporting. Defaults to ``True``.
-            code_format (str, optional): Format string to render HTML. In addition to '{foreground}',
+            code_format (str, optional): Format string to render HTML, or ``None`` for the default. In addition to '{foreground}',
                 '{background}', and '{code}', should contain '{stylesheet}' if inline_styles is ``False``.
             inline_styles (bool, optional): If ``True`` styles will be inlined in to spans, which makes files
                 larger but easier to cut and paste markup. If ``False``, styles will be embedded in a style tag.
@@ -2396,7 +2517,7 @@ class Console:
         title: str = "Rich",
         theme: Optional[TerminalTheme] = None,
         clear: bool = True,
-        code_format: str = CONSOLE_SVG_FORMAT,
+        code_format: Optional[str] = None,
         font_aspect_ratio: float = 0.61,
         unique_id: Optional[str] = None,
     ) -> str:
@@ -2407,7 +2528,7 @@ class Console:
             title (str, optional): The title of the tab in the output image
             theme (TerminalTheme, optional): The ``TerminalTheme`` object to use to style the terminal
             clear (bool, optional): Clear record buffer after exporting. Defaults to ``True``
-            code_format (str, optional): Format string used to generate the SVG. Rich will inject a number of variables
+            code_format (str, optional): Format string used to generate the SVG, or ``None`` for the default. Rich will inject a number of variables
                 into the string in order to form the final SVG output. The default template used and the variables
                 injected by Rich can be found by inspecting the ``console.CONSOLE_SVG_FORMAT`` variable.
             font_aspect_ratio (float, optional): The width to height ratio of the font used in the ``code_format``
@@ -2417,8 +2538,15 @@ class Console:
                 ids). If not set, this defaults to a computed value based on the recorded content.
         """
 
+        from html import escape
+
         from rich.cells import cell_len
 
+        from ._export_format import CONSOLE_SVG_FORMAT
+
+        if code_format is None:
+            code_format = CONSOLE_SVG_FORMAT
+
         style_cache: Dict[Style, str] = {}
 
         def get_svg_style(style: Style) -> str:
@@ -2653,7 +2781,7 @@ class Console:
         title: str = "Rich",
         theme: Optional[TerminalTheme] = None,
         clear: bool = True,
-        code_format: str = CONSOLE_SVG_FORMAT,
+        code_format: Optional[str] = None,
         font_aspect_ratio: float = 0.61,
         unique_id: Optional[str] = None,
     ) -> None:
@@ -2664,7 +2792,7 @@ class Console:
             title (str, optional): The title of the tab in the output image
             theme (TerminalTheme, optional): The ``TerminalTheme`` object to use to style the terminal
             clear (bool, optional): Clear record buffer after exporting. Defaults to ``True``
-            code_format (str, optional): Format string used to generate the SVG. Rich will inject a number of variables
+            code_format (str, optional): Format string used to generate the SVG, or ``None`` for the default. Rich will inject a number of variables
                 into the string in order to form the final SVG output. The default template used and the variables
                 injected by Rich can be found by inspecting the ``console.CONSOLE_SVG_FORMAT`` variable.
             font_aspect_ratio (float, optional): The width to height ratio of the font used in the ``code_format``
@@ -2685,6 +2813,15 @@ class Console:
             write_file.write(svg)
 
 
+def __getattr__(name: str) -> Any:
+    # The export formats are imported on first access, as they are rarely required
+    if name in ("CONSOLE_HTML_FORMAT", "CONSOLE_SVG_FORMAT"):
+        from . import _export_format
+
+        return getattr(_export_format, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _svg_hash(svg_main_code: str) -> str:
     """Returns a unique hash for the given SVG main code.
 
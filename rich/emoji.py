@@ -4,7 +4,6 @@ from typing import TYPE_CHECKING, Optional, Union
 from .jupyter import JupyterMixin
 from .segment import Segment
 from .style import Style
-from ._emoji_codes import EMOJI
 from ._emoji_replace import _emoji_replace
 
 if sys.version_info >= (3, 8):
@@ -44,6 +43,8 @@ class Emoji(JupyterMixin):
         Raises:
             NoEmoji: If the emoji doesn't exist.
         """
+        from ._emoji_codes import EMOJI
+
         self.name = name
         self.style = style
         self.variant = variant
@@ -81,6 +82,7 @@ class Emoji(JupyterMixin):
 if __name__ == "__main__":  # pragma: no cover
     import sys
 
+    from rich._emoji_codes import EMOJI
     from rich.columns import Columns
     from rich.console import Console
 
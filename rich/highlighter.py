@@ -1,9 +1,29 @@
 import re
 from abc import ABC, abstractmethod
-from typing import List, Union
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List, Optional, Pattern, Tuple, Union
 
 from .text import Span, Text
 
+DEFAULT_HIGHLIGHT_CACHE_SIZE = 1024
+
+# A highlighter and the plain text it highlighted
+HighlightKey = Tuple["Highlighter", str]
+
+# Matches the group names in a regex: named groups, named backreferences, and conditionals
+_RE_GROUP_NAME = re.compile(
+    r"\(\?P<([^\W\d]\w*)>|\(\?P=([^\W\d]\w*)\)|\(\?\(([^\W\d]\w*)\)"
+)
+
+# Matches numbered backreferences and conditionals, skipping other escapes (including
+# octal escapes) and character classes, in which digits are not group numbers
+_RE_GROUP_NUMBER = re.compile(
+    r"\\(?:0[0-7]{0,2}|[0-7]{3}|([1-9]\d?)|.)|\[\^?\]?(?:\\.|[^\]\\])*\]|\(\?\((\d+)\)",
+    re.DOTALL,
+)
+
 
 def _combine_regex(*regexes: str) -> str:
     """Combine a number of regexes in to a single regex.
@@ -14,9 +34,153 @@ def _combine_regex(*regexes: str) -> str:
     return "|".join(regexes)
 
 
+@lru_cache(maxsize=64)
+def _compile_highlights(
+    highlights: Tuple[str, ...], base_style: str
+) -> Tuple[Pattern[str], List[List[Tuple[int, str]]]]:
+    """Compile a number of highlight regexes in to a single regex.
+
+    Each regex becomes an alternative in a group of its own. Groups are renamed so that
+    regexes may use the same group names, and numbered backreferences are renumbered.
+
+    Args:
+        highlights (Tuple[str, ...]): Regexes with named groups.
+        base_style (str): Prefix for the styles of named groups.
+
+    Returns:
+        Tuple[Pattern[str], List[List[Tuple[int, str]]]]: The combined regex, and the
+            indices and styles of the named groups in each alternative, indexed by the
+            alternative's group (which is the last group of a match).
+    """
+    group_styles: Dict[str, str] = {}
+    alternatives: List[str] = []
+    group_offset = 0
+    for alternative_index, highlight in enumerate(highlights):
+        highlight_pattern = re.compile(highlight)
+        group_names = {
+            group_index: name
+            for name, group_index in highlight_pattern.groupindex.items()
+        }
+        # Groups of this regex follow the group of the alternative
+        group_offset += 1
+
+        def rename(match: "re.Match[str]") -> str:
+            group, reference, condition = match.groups()
+            name = f"_{alternative_index}_{group or reference or condition}"
+            if group:
+                group_styles[name] = f"{base_style}{group}"
+                return f"(?P<{name}>"
+            if reference:
+                return f"(?P={name})"
+            return f"(?({name})"
+
+        def renumber(match: "re.Match[str]") -> str:
+            reference, condition = match.groups()
+            if not (reference or condition):
+                return match.group()
+            group_number = int(reference or condition)
+            name = group_names.get(group_number)
+            if name is not None:
+                name = f"_{alternative_index}_{name}"
+                return f"(?P={name})" if reference else f"(?({name})"
+            group_number += group_offset
+            if condition:
+                return f"(?({group_number})"
+            if group_number > 99:
+                raise re.error(
+                    f"backreference to unnamed group {reference} is beyond"
+                    " group 99 once combined; use a named group",
+                    highlight,
+                )
+            return f"(?:\\{group_number})"
+
+        renamed = _RE_GROUP_NAME.sub(rename, highlight)
+        alternatives.append(
+            f"(?P<_{alternative_index}>{_RE_GROUP_NUMBER.sub(renumber, renamed)})"
+        )
+        group_offset += highlight_pattern.groups
+    pattern = re.compile(_combine_regex(*alternatives))
+    groups: List[List[Tuple[int, str]]] = [
+        [] for _ in range(pattern.groups + 1)
+    ]
+    for alternative_index in range(len(highlights)):
+        prefix = f"_{alternative_index}_"
+        groups[pattern.groupindex[f"_{alternative_index}"]] = [
+            (group_index, group_styles[name])
+            for name, group_index in sorted(
+                pattern.groupindex.items(), key=lambda item: item[1]
+            )
+            if name.startswith(prefix)
+        ]
+    return pattern, groups
+
+
+class HighlightCache:
+    """A least recently used cache of the spans added by highlighters, keyed on the
+    highlighter and the plain text.
+
+    Highlighting the same string again copies the cached spans to the new text, rather than
+    running the highlighter. Only use a cache with highlighters which add spans depending on
+    the plain text alone (such as a :class:`RegexHighlighter`). Set a cache on a highlighter
+    (or a highlighter class) with the ``cache`` attribute.
+
+    Args:
+        maxsize (int, optional): Maximum number of strings to cache. Defaults to DEFAULT_HIGHLIGHT_CACHE_SIZE.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_HIGHLIGHT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._spans: "OrderedDict[HighlightKey, Tuple[Span, ...]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f"<highlightcache maxsize={self.maxsize} hits={self.hits} misses={self.misses}>"
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def clear(self) -> None:
+        """Clear the cache (but not the hit and miss counts)."""
+        with self._lock:
+            self._spans.clear()
+
+    def highlight(self, highlighter: "Highlighter", text: Text) -> None:
+        """Apply highlighting in place to text, with cached spans if possible.
+
+        Args:
+            highlighter (Highlighter): Highlighter to apply.
+            text (~Text): A text object to highlight.
+        """
+        key = (highlighter, text.plain)
+        with self._lock:
+            spans = self._spans.get(key)
+            if spans is None:
+                self.misses += 1
+            else:
+                self._spans.move_to_end(key)
+                self.hits += 1
+        if spans is not None:
+            text.spans.extend(spans)
+            return
+        start = len(text.spans)
+        highlighter.highlight(text)
+        spans = tuple(text.spans[start:])
+        with self._lock:
+            self._spans[key] = spans
+            if len(self._spans) > self.maxsize:
+                self._spans.popitem(last=False)
+
+
 class Highlighter(ABC):
     """Abstract base class for highlighters."""
 
+    cache: Optional[HighlightCache] = None
+    """Optional cache of highlighted strings, or None to highlight every string."""
+
     def __call__(self, text: Union[str, Text]) -> Text:
         """Highlight a str or Text instance.
 
@@ -35,7 +199,11 @@ class Highlighter(ABC):
             highlight_text = text.copy()
         else:
             raise TypeError(f"str or Text instance required, not {text!r}")
-        self.highlight(highlight_text)
+        cache = self.cache
+        if cache is None:
+            self.highlight(highlight_text)
+        else:
+            cache.highlight(self, highlight_text)
         return highlight_text
 
     @abstractmethod
@@ -77,6 +245,35 @@ class RegexHighlighter(Highlighter):
             highlight_regex(re_highlight, style_prefix=self.base_style)
 
 
+class CombinedRegexHighlighter(RegexHighlighter):
+    """Applies highlighting from a list of regular expressions, which are combined in to
+    a single regular expression so that the text is scanned once.
+
+    Unlike :class:`RegexHighlighter`, matches may not overlap. Where matches of different
+    expressions would overlap, the match which starts first is used, or the match of the
+    expression which is first in ``highlights`` if they start at the same position.
+    """
+
+    def highlight(self, text: Text) -> None:
+        """Highlight :class:`rich.text.Text` using regular expressions.
+
+        Args:
+            text (~Text): Text to highlighted.
+
+        """
+        pattern, alternatives = _compile_highlights(
+            tuple(self.highlights), self.base_style
+        )
+        append_span = text.spans.append
+        _Span = Span
+        for match in pattern.finditer(text.plain):
+            get_span = match.span
+            for group_index, style in alternatives[match.lastindex or 0]:
+                start, end = get_span(group_index)
+                if end > start:
+                    append_span(_Span(start, end, style))
+
+
 class ReprHighlighter(RegexHighlighter):
     """Highlights the text typically produced from ``__repr__`` methods."""
 
@@ -103,6 +300,14 @@ class ReprHighlighter(RegexHighlighter):
     ]
 
 
+class CombinedReprHighlighter(CombinedRegexHighlighter, ReprHighlighter):
+    """Highlights the text typically produced from ``__repr__`` methods, scanning the text once.
+
+    Faster than :class:`ReprHighlighter`, but doesn't highlight within matches. For instance, the
+    contents of a ``<tag>`` or the value of an attribute are styled as a whole.
+    """
+
+
 class JSONHighlighter(RegexHighlighter):
     """Highlights JSON"""
 
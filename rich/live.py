@@ -1,5 +1,5 @@
 import sys
-from threading import Event, RLock, Thread
+from threading import RLock
 from types import TracebackType
 from typing import IO, Any, Callable, List, Optional, TextIO, Type, cast
 
@@ -13,25 +13,6 @@ from .screen import Screen
 from .text import Text
 
 
-class _RefreshThread(Thread):
-    """A thread that calls refresh() at regular intervals."""
-
-    def __init__(self, live: "Live", refresh_per_second: float) -> None:
-        self.live = live
-        self.refresh_per_second = refresh_per_second
-        self.done = Event()
-        super().__init__(daemon=True)
-
-    def stop(self) -> None:
-        self.done.set()
-
-    def run(self) -> None:
-        while not self.done.wait(1 / self.refresh_per_second):
-            with self.live._lock:
-                if not self.done.is_set():
-                    self.live.refresh()
-
-
 class Live(JupyterMixin, RenderHook):
     """Renders an auto-updating live display of any given renderable.
 
@@ -46,6 +27,7 @@ class Live(JupyterMixin, RenderHook):
         redirect_stderr (bool, optional): Enable redirection of stderr. Defaults to True.
         vertical_overflow (VerticalOverflowMethod, optional): How to handle renderable when it is too tall for the console. Defaults to "ellipsis".
         get_renderable (Callable[[], RenderableType], optional): Optional callable to get renderable. Defaults to None.
+        differential (bool, optional): Only write the parts of the display that changed since the last refresh. Defaults to False.
     """
 
     def __init__(
@@ -61,6 +43,7 @@ class Live(JupyterMixin, RenderHook):
         redirect_stderr: bool = True,
         vertical_overflow: VerticalOverflowMethod = "ellipsis",
         get_renderable: Optional[Callable[[], RenderableType]] = None,
+        differential: bool = False,
     ) -> None:
         assert refresh_per_second > 0, "refresh_per_second must be > 0"
         self._renderable = renderable
@@ -79,14 +62,19 @@ class Live(JupyterMixin, RenderHook):
         self._started: bool = False
         self.transient = True if screen else transient
 
-        self._refresh_thread: Optional[_RefreshThread] = None
+        self._refresh_id: Optional[int] = None
         self.refresh_per_second = refresh_per_second
 
         self.vertical_overflow = vertical_overflow
+        self.differential = differential
         self._get_renderable = get_renderable
         self._live_render = LiveRender(
-            self.get_renderable(), vertical_overflow=vertical_overflow
+            self.get_renderable(),
+            vertical_overflow=vertical_overflow,
+            differential=differential,
         )
+        # Printed on refresh, so process_renderables can tell a refresh from other output
+        self._refresh_control = Control()
 
     @property
     def is_started(self) -> bool:
@@ -128,10 +116,9 @@ class Live(JupyterMixin, RenderHook):
                     self.stop()
                     raise
             if self.auto_refresh:
-                self._refresh_thread = _RefreshThread(
-                    self, self.refresh_per_second
+                self._refresh_id = self.console.refresh_scheduler.add(
+                    self._auto_refresh, self.refresh_per_second
                 )
-                self._refresh_thread.start()
 
     def stop(self) -> None:
         """Stop live rendering display."""
@@ -141,9 +128,9 @@ class Live(JupyterMixin, RenderHook):
             self.console.clear_live()
             self._started = False
 
-            if self.auto_refresh and self._refresh_thread is not None:
-                self._refresh_thread.stop()
-                self._refresh_thread = None
+            if self._refresh_id is not None:
+                self.console.refresh_scheduler.remove(self._refresh_id)
+                self._refresh_id = None
             # allow it to fully render on the last even if overflow
             self.vertical_overflow = "visible"
             with self.console:
@@ -226,6 +213,22 @@ class Live(JupyterMixin, RenderHook):
             self._renderable = renderable
             if refresh:
                 self.refresh()
+            elif self._refresh_id is not None:
+                self.console.refresh_scheduler.wake()
+
+    def _auto_refresh(self) -> bool:
+        """Refresh from the console's refresh scheduler.
+
+        Returns:
+            bool: True if the display changed.
+        """
+        with self._lock:
+            if self._refresh_id is None:
+                # Stopped while the scheduler was waiting for the lock
+                return False
+            self._live_render.changed = False
+            self.refresh()
+            return self._live_render.changed or self.console.is_jupyter
 
     def refresh(self) -> None:
         """Update the display of the Live Render."""
@@ -251,7 +254,11 @@ class Live(JupyterMixin, RenderHook):
                 self.console.is_terminal and not self.console.is_dumb_terminal
             ):
                 with self.console:
-                    self.console.print(Control())
+                    # A differential update moves between lines with control codes,
+                    # so must not be cropped as if it were a single line.
+                    self.console.print(
+                        self._refresh_control, crop=not self.differential
+                    )
             elif (
                 not self._started and not self.transient
             ):  # if it is finished allow files or dumb-terminals to see final result
@@ -266,12 +273,21 @@ class Live(JupyterMixin, RenderHook):
         if self.console.is_interactive:
             # lock needs acquiring as user can modify live_render renderable at any time unlike in Progress.
             with self._lock:
-                reset = (
-                    Control.home()
-                    if self._alt_screen
-                    else self._live_render.position_cursor()
-                )
-                renderables = [reset, *renderables, self._live_render]
+                if (
+                    self.differential
+                    and self._live_render.has_frame
+                    and renderables == [self._refresh_control]
+                ):
+                    # Nothing printed above the live display, so update it in place
+                    renderables = [self._live_render]
+                else:
+                    reset = (
+                        Control.home()
+                        if self._alt_screen
+                        else self._live_render.position_cursor()
+                    )
+                    self._live_render.reset_frame()
+                    renderables = [reset, *renderables, self._live_render]
         elif (
             not self._started and not self.transient
         ):  # if it is finished render the final output for files or dumb_terminals
@@ -1,5 +1,5 @@
 import sys
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 if sys.version_info >= (3, 8):
     from typing import Literal
@@ -10,19 +10,67 @@ else:
 from ._loop import loop_last
 from .console import Console, ConsoleOptions, RenderableType, RenderResult
 from .control import Control
-from .segment import ControlType, Segment
+from .segment import ControlCode, ControlType, Segment
 from .style import StyleType
 from .text import Text
 
 VerticalOverflowMethod = Literal["crop", "ellipsis", "visible"]
 
 
+def _move_vertical(offset: int) -> ControlCode:
+    """Get a control code to move the cursor up or down by a number of lines."""
+    return (
+        ControlType.CURSOR_DOWN if offset > 0 else ControlType.CURSOR_UP,
+        abs(offset),
+    )
+
+
+def _diff_line(
+    previous_line: List[Segment], line: List[Segment]
+) -> Tuple[int, List[Segment], bool]:
+    """Find the run of segments in a line that differs from the previous version of the line.
+
+    Args:
+        previous_line (List[Segment]): Line as it is currently displayed.
+        line (List[Segment]): New line.
+
+    Returns:
+        Tuple[int, List[Segment], bool]: Cell offset of the changed run, the segments in the run,
+            and a flag to indicate the remainder of the line should be erased.
+    """
+    start = 0
+    x = 0
+    max_start = min(len(previous_line), len(line))
+    while start < max_start and previous_line[start] == line[start]:
+        x += line[start].cell_length
+        start += 1
+
+    get_line_length = Segment.get_line_length
+    previous_length = get_line_length(previous_line)
+    line_length = get_line_length(line)
+
+    end = len(line)
+    if previous_length == line_length:
+        # Segments at the end of the line occupy the same cells, so an equal suffix may be skipped
+        previous_end = len(previous_line)
+        while (
+            end > start
+            and previous_end > start
+            and previous_line[previous_end - 1] == line[end - 1]
+        ):
+            end -= 1
+            previous_end -= 1
+    return x, line[start:end], line_length < previous_length
+
+
 class LiveRender:
     """Creates a renderable that may be updated.
 
     Args:
         renderable (RenderableType): Any renderable object.
         style (StyleType, optional): An optional style to apply to the renderable. Defaults to "".
+        vertical_overflow (VerticalOverflowMethod, optional): How to handle renderable when it is too tall for the console. Defaults to "ellipsis".
+        differential (bool, optional): Render only what changed since the previous render. Defaults to False.
     """
 
     def __init__(
@@ -30,11 +78,18 @@ class LiveRender:
         renderable: RenderableType,
         style: StyleType = "",
         vertical_overflow: VerticalOverflowMethod = "ellipsis",
+        differential: bool = False,
     ) -> None:
         self.renderable = renderable
         self.style = style
         self.vertical_overflow = vertical_overflow
+        self.differential = differential
         self._shape: Optional[Tuple[int, int]] = None
+        self._lines: Optional[List[List[Segment]]] = None
+        self._width = 0
+        self._frame: Optional[List[List[Segment]]] = None
+        self.changed = True
+        """True if the last render was different from the render before it."""
 
     def set_renderable(self, renderable: RenderableType) -> None:
         """Set a new renderable.
@@ -44,6 +99,15 @@ class LiveRender:
         """
         self.renderable = renderable
 
+    @property
+    def has_frame(self) -> bool:
+        """Check if a previous frame is on screen, which a differential render may update."""
+        return self._lines is not None
+
+    def reset_frame(self) -> None:
+        """Discard the previous frame, so that the next render is written in full."""
+        self._lines = None
+
     def position_cursor(self) -> Control:
         """Get control codes to move cursor to beginning of live render.
 
@@ -106,6 +170,26 @@ class LiveRender:
                 )
                 lines.append(list(console.render(overflow_text)))
                 shape = Segment.get_shape(lines)
+
+        self.changed = lines != self._frame
+        self._frame = lines
+
+        if self.differential:
+            previous_lines = self._lines
+            self._lines = lines
+            if previous_lines is not None:
+                if (
+                    previous_lines
+                    and lines
+                    and self._width == options.max_width
+                    and len(previous_lines) <= options.size.height
+                ):
+                    self._shape = shape
+                    yield from self._render_changes(previous_lines, lines)
+                    return
+                # The previous frame can't be updated in place, erase it and render in full
+                yield self.position_cursor().segment
+            self._width = options.max_width
         self._shape = shape
 
         new_line = Segment.line()
@@ -113,3 +197,57 @@ class LiveRender:
             yield from line
             if not last:
                 yield new_line
+
+    def _render_changes(
+        self, previous_lines: List[List[Segment]], lines: List[List[Segment]]
+    ) -> Iterable[Segment]:
+        """Render the changes required to update the previous frame to a new frame.
+
+        The cursor is expected to be on the last line of the previous frame, and is
+        left on the last line of the new frame.
+
+        Args:
+            previous_lines (List[List[Segment]]): Lines currently on screen.
+            lines (List[List[Segment]]): New lines.
+
+        Returns:
+            Iterable[Segment]: Segments containing control codes and changed text.
+        """
+        control = ControlType
+        codes: List[ControlCode] = []
+        new_line = Segment.line()
+        previous_height = len(previous_lines)
+        height = len(lines)
+        cursor_y = previous_height - 1
+
+        for y, line in enumerate(lines):
+            if y < previous_height:
+                previous_line = previous_lines[y]
+                if line == previous_line:
+                    continue
+                if y != cursor_y:
+                    codes.append(_move_vertical(y - cursor_y))
+                x, changed, erase = _diff_line(previous_line, line)
+                codes.append((control.CURSOR_MOVE_TO_COLUMN, x))
+                yield Control(*codes).segment
+                codes.clear()
+                yield from changed
+                if erase:
+                    yield Control((control.ERASE_IN_LINE, 0)).segment
+            else:
+                # New lines are added below the previous frame, which may scroll the terminal
+                if cursor_y != y - 1:
+                    yield Control(_move_vertical(y - 1 - cursor_y)).segment
+                yield new_line
+                yield from line
+            cursor_y = y
+
+        for y in range(height, previous_height):
+            if y != cursor_y:
+                codes.append(_move_vertical(y - cursor_y))
+            codes.append((control.ERASE_IN_LINE, 2))
+            cursor_y = y
+        if cursor_y != height - 1:
+            codes.append(_move_vertical(height - 1 - cursor_y))
+        if codes:
+            yield Control(*codes).segment
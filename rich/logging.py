@@ -1,19 +1,34 @@
 import logging
+import os
+import sys
 from datetime import datetime
 from logging import Handler, LogRecord
 from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Lock, Thread, current_thread
 from types import ModuleType
 from typing import ClassVar, Iterable, List, Optional, Type, Union
 
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal  # pragma: no cover
+
 from rich._null_file import NullFile
 
 from . import get_console
 from ._log_render import FormatTimeCallable, LogRender
 from .console import Console, ConsoleRenderable
 from .highlighter import Highlighter, ReprHighlighter
+from .segment import Segment, Segments
 from .text import Text
 from .traceback import Traceback
 
+QueueFullMethod = Literal["block", "drop"]
+
+MAX_RENDER_BATCH = 256
+"""Maximum number of queued records written at once by an asynchronous handler."""
+
 
 class RichHandler(Handler):
     """A logging handler that renders output with Rich. The time / level / message and file are displayed in columns.
@@ -48,6 +63,21 @@ class RichHandler(Handler):
         locals_max_string (int, optional): Maximum length of string before truncating, or None to disable. Defaults to 80.
         log_time_format (Union[str, TimeFormatterCallable], optional): If ``log_time`` is enabled, either string for strftime or callable that formats the time. Defaults to "[%x %X] ".
         keywords (List[str], optional): List of words to highlight instead of ``RichHandler.KEYWORDS``.
+        asynchronous (bool, optional): Render and write records in a background thread, so that logging doesn't
+            block the calling thread. Records are formatted when they are rendered, so arguments should not be
+            modified after logging. Defaults to False.
+        queue_size (int, optional): Maximum number of records waiting to be rendered by an asynchronous handler,
+            or 0 for no limit. Defaults to 10000.
+        queue_full (str, optional): What to do when the queue is full, "block" to wait for space, or "drop" to
+            discard the record (and count it in ``dropped``). Defaults to "block".
+        batch_size (int, optional): Number of records to render before writing them to the console at once.
+            Defaults to 1, to write every record as it is logged.
+        batch_interval (float, optional): Maximum time (in seconds) that a rendered record waits to be written,
+            when ``batch_size`` is more than 1. Defaults to 0.1.
+        fast_plain_text (bool, optional): Write records as plain text without rendering them, when the console
+            doesn't write styles (e.g. output isn't a terminal). The output is the same, but highlighters and
+            :meth:`render_message`, :meth:`get_level_text`, and :meth:`render` aren't called. Records which don't
+            fit on one line are rendered as usual. Defaults to False.
     """
 
     KEYWORDS: ClassVar[Optional[List[str]]] = [
@@ -87,6 +117,12 @@ class RichHandler(Handler):
         locals_max_string: int = 80,
         log_time_format: Union[str, FormatTimeCallable] = "[%x %X]",
         keywords: Optional[List[str]] = None,
+        asynchronous: bool = False,
+        queue_size: int = 10000,
+        queue_full: QueueFullMethod = "block",
+        batch_size: int = 1,
+        batch_interval: float = 0.1,
+        fast_plain_text: bool = False,
     ) -> None:
         super().__init__(level=level)
         self.console = console or get_console()
@@ -113,6 +149,28 @@ class RichHandler(Handler):
         self.locals_max_length = locals_max_length
         self.locals_max_string = locals_max_string
         self.keywords = keywords
+        assert queue_full in (
+            "block",
+            "drop",
+        ), "queue_full must be 'block' or 'drop'"
+        self.queue_full = queue_full
+        self.dropped = 0
+        """Number of records discarded because the queue was full."""
+        self._queue: "Optional[Queue[Optional[LogRecord]]]" = (
+            Queue(queue_size) if asynchronous else None
+        )
+        self._render_thread: Optional[Thread] = None
+        self._pid = os.getpid()
+        assert batch_size >= 1, "batch_size must be >= 1"
+        assert batch_interval > 0, "batch_interval must be > 0"
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._batch: List[Segment] = []
+        self._batch_records: List[LogRecord] = []
+        self._batch_refresh_id: Optional[int] = None
+        # Not the handler lock, which logging.shutdown holds while flushing the queue
+        self._batch_lock = Lock()
+        self.fast_plain_text = fast_plain_text
 
     def get_level_text(self, record: LogRecord) -> Text:
         """Get the level name from the record.
@@ -131,7 +189,108 @@ class RichHandler(Handler):
 
     def emit(self, record: LogRecord) -> None:
         """Invoked by logging."""
+        if self._queue is None:
+            self._emit(record)
+            return
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        if self._render_thread is None:
+            self._render_thread = Thread(
+                target=self._render_queue,
+                args=(self._queue,),
+                name="RichHandler",
+                daemon=True,
+            )
+            self._render_thread.start()
+        if self.queue_full == "drop":
+            try:
+                self._queue.put_nowait(record)
+            except Full:
+                self.dropped += 1
+        else:
+            self._queue.put(record)
+
+    def flush(self) -> None:
+        """Write the records which are batched, or queued by an asynchronous handler."""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        if (
+            self._queue is not None
+            and self._render_thread is not None
+            and self._render_thread is not current_thread()
+        ):
+            self._queue.join()
+        if self._batch_records:
+            self._flush_batch()
+
+    def close(self) -> None:
+        """Write the queued records, and stop the render thread of an asynchronous handler."""
+        if self._pid != os.getpid():
+            self._reset_after_fork()
+        render_thread = self._render_thread
+        if self._queue is not None and render_thread is not None:
+            self._render_thread = None
+            self._queue.put(None)
+            if render_thread is not current_thread():
+                render_thread.join()
+        if self._batch_records:
+            self._flush_batch()
+        super().close()
+
+    def _reset_after_fork(self) -> None:
+        """Discard the state inherited by a forked process, where the render thread
+        isn't running and locks may have been held by threads which no longer exist.
+        """
+        self._pid = os.getpid()
+        if self._queue is not None:
+            self._queue = Queue(self._queue.maxsize)
+        self._render_thread = None
+        self._batch_lock = Lock()
+        self._batch = []
+        self._batch_records = []
+        self._batch_refresh_id = None
+
+    def _render_queue(self, queue: "Queue[Optional[LogRecord]]") -> None:
+        """Render records from the queue, until closed. Records which are queued together
+        are written to the console at once.
+
+        Args:
+            queue (Queue[Optional[LogRecord]]): Queue of records, and None to stop.
+        """
+        while True:
+            records = [queue.get()]
+            while len(records) < MAX_RENDER_BATCH and records[-1] is not None:
+                try:
+                    records.append(queue.get_nowait())
+                except Empty:
+                    break
+            rendered = [record for record in records if record is not None]
+            try:
+                with self.console:
+                    for record in rendered:
+                        try:
+                            self._emit(record)
+                        except Exception:
+                            self.handleError(record)
+            except Exception:
+                # Writing the batch failed, which isn't specific to one record
+                if rendered:
+                    self.handleError(rendered[-1])
+            finally:
+                for _ in records:
+                    queue.task_done()
+            if records[-1] is None:
+                return
+
+    def _emit(self, record: LogRecord) -> None:
+        """Render a record, and write it to the console.
+
+        Args:
+            record (LogRecord): logging Record.
+        """
         message = self.format(record)
+        if self.fast_plain_text and self._emit_plain(record, message):
+            return
         traceback = None
         if (
             self.rich_tracebacks
@@ -177,12 +336,109 @@ class RichHandler(Handler):
             # instance from Console.file. In this case, we still want to make a log record
             # even though we won't be writing anything to a file.
             self.handleError(record)
+        elif self.batch_size > 1:
+            try:
+                self._add_to_batch(record, self.console.render(log_renderable))
+            except Exception:
+                self.handleError(record)
         else:
             try:
                 self.console.print(log_renderable)
             except Exception:
                 self.handleError(record)
 
+    def _emit_plain(self, record: LogRecord, message: str) -> bool:
+        """Write a record as plain text, if the console doesn't write styles.
+
+        Args:
+            record (LogRecord): logging Record.
+            message (str): Formatted log message.
+
+        Returns:
+            bool: True if the record was written, or False if it should be rendered.
+        """
+        console = self.console
+        if (
+            console.color_system is not None
+            or console.record
+            or console._render_hooks
+            or isinstance(console.file, NullFile)
+            or getattr(record, "markup", self.markup)
+            or (
+                self.rich_tracebacks
+                and record.exc_info
+                and record.exc_info != (None, None, None)
+            )
+        ):
+            return False
+        line = self._log_render.render_plain(
+            console.width,
+            message,
+            datetime.fromtimestamp(record.created),
+            None if self.formatter is None else self.formatter.datefmt,
+            level=record.levelname.ljust(8),
+            path=Path(record.pathname).name,
+            line_no=record.lineno,
+        )
+        if line is None:
+            return False
+        try:
+            if self.batch_size > 1:
+                self._add_to_batch(record, [Segment(line)])
+            else:
+                with console:
+                    # The line is rendered, and there are no render hooks to process it
+                    console._buffer.append(Segment(line))
+        except Exception:
+            self.handleError(record)
+        return True
+
+    def _add_to_batch(
+        self, record: LogRecord, segments: Iterable[Segment]
+    ) -> None:
+        """Add a rendered record to the batch, and write the batch if it is full.
+
+        Args:
+            record (LogRecord): logging Record.
+            segments (Iterable[Segment]): Segments of the rendered record.
+        """
+        console = self.console
+        with self._batch_lock:
+            self._batch.extend(segments)
+            self._batch_records.append(record)
+            if len(self._batch_records) >= self.batch_size:
+                self._write_batch()
+            elif self._batch_refresh_id is None:
+                # Write the batch from the refresh thread, if it doesn't fill in time
+                self._batch_refresh_id = console.refresh_scheduler.add(
+                    self._flush_batch, 1 / self.batch_interval
+                )
+
+    def _flush_batch(self) -> bool:
+        """Write the batch, reporting any error against its last record.
+
+        Returns:
+            bool: True, to keep the refresh rate of the console's refresh scheduler.
+        """
+        with self._batch_lock:
+            records = self._batch_records
+            try:
+                self._write_batch()
+            except Exception:
+                if records:
+                    self.handleError(records[-1])
+        return True
+
+    def _write_batch(self) -> None:
+        """Write the batched records to the console, with a single write."""
+        segments, self._batch = self._batch, []
+        self._batch_records = []
+        if self._batch_refresh_id is not None:
+            self.console.refresh_scheduler.remove(self._batch_refresh_id)
+            self._batch_refresh_id = None
+        if segments:
+            self.console.print(Segments(segments))
+
     def render_message(
         self, record: LogRecord, message: str
     ) -> "ConsoleRenderable":
@@ -10,7 +10,7 @@ from collections import Counter, UserDict, UserList, defaultdict, deque
 from dataclasses import dataclass, fields, is_dataclass
 from inspect import isclass
 from itertools import islice
-from types import MappingProxyType
+from types import MappingProxyType, ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,13 +29,6 @@ from typing import (
 
 from rich.repr import RichReprResult
 
-try:
-    import attr as _attr_module
-
-    _has_attrs = hasattr(_attr_module, "ib")
-except ImportError:  # pragma: no cover
-    _has_attrs = False
-
 from . import get_console
 from ._loop import loop_last
 from ._pick import pick_bool
@@ -47,6 +40,8 @@ from .measure import Measurement
 from .text import Text
 
 if TYPE_CHECKING:
+    from attr import Attribute
+
     from .console import (
         Console,
         ConsoleOptions,
@@ -57,14 +52,26 @@ if TYPE_CHECKING:
     )
 
 
+def _get_attr_module() -> Optional[ModuleType]:
+    """Get the attrs module, if it has been imported.
+
+    An object can only have been created with attrs if the module was imported,
+    so there is no need to import it here.
+    """
+    attr_module = sys.modules.get("attr")
+    return attr_module if hasattr(attr_module, "ib") else None
+
+
 def _is_attr_object(obj: Any) -> bool:
     """Check if an object was created with attrs module."""
-    return _has_attrs and _attr_module.has(type(obj))
+    attr_module = _get_attr_module()
+    return attr_module is not None and attr_module.has(type(obj))
 
 
-def _get_attr_fields(obj: Any) -> Sequence["_attr_module.Attribute[Any]"]:
+def _get_attr_fields(obj: Any) -> Sequence["Attribute[Any]"]:
     """Get fields for an attrs object."""
-    return _attr_module.fields(type(obj)) if _has_attrs else []
+    attr_module = _get_attr_module()
+    return attr_module.fields(type(obj)) if attr_module is not None else []
 
 
 def _is_dataclass_repr(obj: object) -> bool:
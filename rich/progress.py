@@ -11,7 +11,7 @@ from math import ceil
 from mmap import mmap
 from operator import length_hint
 from os import PathLike, stat
-from threading import Event, RLock, Thread
+from threading import RLock, local
 from types import TracebackType
 from typing import (
     Any,
@@ -45,6 +45,7 @@ else:
     from typing_extensions import Self  # pragma: no cover
 
 from . import filesize, get_console
+from ._progress_remote import RemoteCollector, RemoteTask
 from .console import Console, Group, JustifyMethod, RenderableType
 from .highlighter import Highlighter
 from .jupyter import JupyterMixin
@@ -65,8 +66,8 @@ GetTimeCallable = Callable[[], float]
 _I = typing.TypeVar("_I", TextIO, BinaryIO)
 
 
-class _TrackThread(Thread):
-    """A thread to periodically update progress."""
+class _TrackUpdater:
+    """Periodically updates progress from the console's refresh scheduler."""
 
     def __init__(
         self, progress: "Progress", task_id: "TaskID", update_period: float
@@ -74,29 +75,33 @@ class _TrackThread(Thread):
         self.progress = progress
         self.task_id = task_id
         self.update_period = update_period
-        self.done = Event()
-
         self.completed = 0
-        super().__init__(daemon=True)
-
-    def run(self) -> None:
-        task_id = self.task_id
-        advance = self.progress.advance
-        update_period = self.update_period
-        last_completed = 0
-        wait = self.done.wait
-        while not wait(update_period) and self.progress.live.is_started:
+        self._last_completed = 0
+        self._lock = RLock()
+        self._update_id: Optional[int] = None
+
+    def update(self) -> bool:
+        """Advance the task by the steps completed since the last update.
+
+        Returns:
+            bool: True if the task was advanced.
+        """
+        with self._lock:
+            if self._update_id is None:
+                return False
             completed = self.completed
-            if last_completed != completed:
-                advance(task_id, completed - last_completed)
-                last_completed = completed
+            if completed == self._last_completed:
+                return False
+            self.progress.advance(
+                self.task_id, completed - self._last_completed
+            )
+            self._last_completed = completed
+            return True
 
-        self.progress.update(
-            self.task_id, completed=self.completed, refresh=True
+    def __enter__(self) -> "_TrackUpdater":
+        self._update_id = self.progress.console.refresh_scheduler.add(
+            self.update, 1 / self.update_period, update=True
         )
-
-    def __enter__(self) -> "_TrackThread":
-        self.start()
         return self
 
     def __exit__(
@@ -105,8 +110,61 @@ class _TrackThread(Thread):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        self.done.set()
-        self.join()
+        with self._lock:
+            if self._update_id is not None:
+                self.progress.console.refresh_scheduler.remove(self._update_id)
+                self._update_id = None
+        self.progress.update(
+            self.task_id, completed=self.completed, refresh=True
+        )
+
+
+class ProgressCounter:
+    """Counts steps completed for a task, without taking the progress lock for each step.
+
+    Each thread counts steps separately, and the counts are added to the task in one
+    update per refresh. Get a counter from :meth:`Progress.counter`.
+
+    Args:
+        task_id (TaskID): Task to count steps for.
+    """
+
+    def __init__(self, task_id: "TaskID") -> None:
+        self.task_id = task_id
+        self._local = local()
+        self._lock = RLock()
+        self._counts: List[List[float]] = []
+        self._total: float = 0
+
+    def __repr__(self) -> str:
+        return f"<ProgressCounter task_id={self.task_id!r}>"
+
+    def advance(self, advance: float = 1) -> None:
+        """Advance the count by a number of steps.
+
+        Args:
+            advance (float): Number of steps to advance. Default is 1.
+        """
+        try:
+            count = self._local.count
+        except AttributeError:
+            count = self._local.count = [0]
+            with self._lock:
+                self._counts.append(count)
+        # Only this thread writes to its count, so no lock is required
+        count[0] += advance
+
+    def collect(self) -> float:
+        """Get the number of steps advanced since the last call to collect.
+
+        Returns:
+            float: Number of steps.
+        """
+        with self._lock:
+            total = sum(count[0] for count in self._counts)
+            steps = total - self._total
+            self._total = total
+        return steps
 
 
 def track(
@@ -1134,6 +1192,9 @@ class Progress(JupyterMixin):
         self.expand = expand
         self._tasks: Dict[TaskID, Task] = {}
         self._task_index: TaskID = TaskID(0)
+        self._counters: List[ProgressCounter] = []
+        self._counters_id: Optional[int] = None
+        self._remote: Optional[RemoteCollector] = None
         self.live = Live(
             console=console or get_console(),
             auto_refresh=auto_refresh,
@@ -1206,9 +1267,23 @@ class Progress(JupyterMixin):
         """Start the progress display."""
         if not self.disable:
             self.live.start(refresh=True)
+            if self.live.auto_refresh and self._counters_id is None:
+                self._counters_id = self.console.refresh_scheduler.add(
+                    self._update_counters,
+                    self.live.refresh_per_second,
+                    update=True,
+                )
 
     def stop(self) -> None:
         """Stop the progress display."""
+        with self._lock:
+            remote, self._remote = self._remote, None
+        if remote is not None:
+            remote.close()
+        if self._counters_id is not None:
+            self.console.refresh_scheduler.remove(self._counters_id)
+            self._counters_id = None
+        self._update_counters()
         self.live.stop()
         if not self.console.is_interactive and not self.console.is_jupyter:
             self.console.print()
@@ -1258,10 +1333,10 @@ class Progress(JupyterMixin):
             self.update(task_id, total=total, completed=completed)
 
         if self.live.auto_refresh:
-            with _TrackThread(self, task_id, update_period) as track_thread:
+            with _TrackUpdater(self, task_id, update_period) as track_updater:
                 for value in sequence:
                     yield value
-                    track_thread.completed += 1
+                    track_updater.completed += 1
         else:
             advance = self.advance
             refresh = self.refresh
@@ -1582,8 +1657,71 @@ class Progress(JupyterMixin):
                 task.finished_time = task.elapsed
                 task.finished_speed = task.speed
 
+    def counter(self, task_id: TaskID) -> ProgressCounter:
+        """Get a counter to advance a task from many threads at a high rate.
+
+        Steps counted with :meth:`ProgressCounter.advance` are added to the task once per refresh
+        (and when the progress display is refreshed or stopped), rather than on every call.
+
+        Args:
+            task_id (TaskID): Task to count steps for.
+
+        Returns:
+            ProgressCounter: A counter for the task.
+        """
+        counter = ProgressCounter(task_id)
+        with self._lock:
+            self._counters.append(counter)
+        return counter
+
+    def get_remote_handle(
+        self, task_id: TaskID, update_period: float = 0.1
+    ) -> RemoteTask:
+        """Get a handle to update a task from another process, such as a worker in a
+        :class:`~concurrent.futures.ProcessPoolExecutor` or :class:`multiprocessing.pool.Pool`.
+
+        The handle may be pickled and sent to the other process, which connects back to this
+        process to send updates. Updates are applied until the progress display is stopped.
+
+        Args:
+            task_id (TaskID): Task to update.
+            update_period (float, optional): Minimum time (in seconds) between sending advances. Defaults to 0.1.
+
+        Returns:
+            RemoteTask: A picklable handle to the task.
+        """
+        with self._lock:
+            if self._remote is None:
+                self._remote = RemoteCollector(self)
+            return RemoteTask(
+                self._remote.address,
+                self._remote.authkey,
+                task_id,
+                update_period,
+            )
+
+    def _update_counters(self) -> bool:
+        """Advance tasks by the steps counted since the last update.
+
+        Returns:
+            bool: True if any task was advanced.
+        """
+        with self._lock:
+            counters = self._counters[:]
+        advanced = False
+        for counter in counters:
+            steps = counter.collect()
+            if steps:
+                with self._lock:
+                    if counter.task_id not in self._tasks:
+                        continue
+                    self.advance(counter.task_id, steps)
+                advanced = True
+        return advanced
+
     def refresh(self) -> None:
         """Refresh (render) the progress information."""
+        self._update_counters()
         if not self.disable and self.live.is_started:
             self.live.refresh()
 
@@ -1687,6 +1825,11 @@ class Progress(JupyterMixin):
         """
         with self._lock:
             del self._tasks[task_id]
+            self._counters = [
+                counter
+                for counter in self._counters
+                if counter.task_id != task_id
+            ]
 
 
 if __name__ == "__main__":  # pragma: no coverage
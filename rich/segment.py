@@ -17,7 +17,7 @@ from typing import (
 )
 
 from .cells import (
-    _is_single_cell_widths,
+    _is_single_cell_text,
     cached_cell_len,
     cell_len,
     get_character_cell_size,
@@ -172,7 +172,7 @@ class Segment(NamedTuple):
         text, style, control = self
         assert cut >= 0
 
-        if _is_single_cell_widths(text):
+        if _is_single_cell_text(text):
             # Fast path with all 1 cell characters
             if cut >= len(text):
                 return self, Segment("", style, control)
@@ -2,7 +2,18 @@ import sys
 from functools import lru_cache
 from marshal import dumps, loads
 from random import randint
-from typing import Any, Dict, Iterable, List, Optional, Type, Union, cast
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from . import errors
 from .color import Color, ColorParseError, ColorSystem, blend_rgb
@@ -729,6 +740,32 @@ class Style:
             rendered = f"\x1b]8;id={self._link_id};{self._link}\x1b\\{rendered}\x1b]8;;\x1b\\"
         return rendered
 
+    def get_render_codes(
+        self,
+        color_system: Optional[ColorSystem] = ColorSystem.TRUECOLOR,
+        legacy_windows: bool = False,
+    ) -> Tuple[str, str]:
+        """Get the codes to write before and after text rendered in this style.
+
+        Concatenating the prefix, some (non-empty) text, and the suffix is equivalent to
+        calling :meth:`render` on that text, which allows the codes to be rendered once and reused.
+
+        Args:
+            color_system (Optional[ColorSystem], optional): Color system to render to. Defaults to ColorSystem.TRUECOLOR.
+            legacy_windows (bool, optional): Omit hyperlinks, which aren't supported by legacy Windows. Defaults to False.
+
+        Returns:
+            Tuple[str, str]: A tuple of prefix and suffix.
+        """
+        if color_system is None:
+            return "", ""
+        attrs = self._ansi or self._make_ansi_codes(color_system)
+        prefix, suffix = (f"\x1b[{attrs}m", "\x1b[0m") if attrs else ("", "")
+        if self._link and not legacy_windows:
+            prefix = f"\x1b]8;id={self._link_id};{self._link}\x1b\\{prefix}"
+            suffix = f"{suffix}\x1b]8;;\x1b\\"
+        return prefix, suffix
+
     def test(self, text: Optional[str] = None) -> None:
         """Write text with style directly to terminal.
 
@@ -808,3 +845,118 @@ class StyleStack:
         """
         self._stack.pop()
         return self._stack[-1]
+
+
+STYLE_COMBINE_CACHE_SIZE = 4096
+"""Default maximum number of combined style ids remembered by a StyleTable."""
+
+
+class StyleTable:
+    """A table of interned styles, which assigns each unique style a small integer id.
+
+    Styles which are equal (and share a link id) are stored once. Combining two ids is
+    memoized, so repeating a combination is a single dictionary lookup and always
+    returns the same style instance. Ids are valid for the lifetime of the table, and the
+    table may be shared between threads.
+
+    Args:
+        combine_cache_size (int, optional): Maximum number of combinations to remember.
+            Defaults to STYLE_COMBINE_CACHE_SIZE.
+    """
+
+    __slots__ = [
+        "_styles",
+        "_style_ids",
+        "_combined",
+        "_lock",
+        "combine_cache_size",
+    ]
+
+    def __init__(
+        self, combine_cache_size: int = STYLE_COMBINE_CACHE_SIZE
+    ) -> None:
+        self._styles: List[Style] = []
+        self._style_ids: Dict[Tuple[Style, Optional[str]], int] = {}
+        self._combined: Dict[Tuple[int, int], int] = {}
+        self._lock = Lock()
+        self.combine_cache_size = combine_cache_size
+
+    def __repr__(self) -> str:
+        return f"<styletable {len(self._styles)} styles>"
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+    def get_id(self, style: Style) -> int:
+        """Get the id of a style, adding it to the table if required.
+
+        Args:
+            style (Style): A style.
+
+        Returns:
+            int: Id of the style.
+        """
+        key = (style, style._link_id)
+        style_id = self._style_ids.get(key)
+        if style_id is None:
+            with self._lock:
+                style_id = self._add(key, style)
+        return style_id
+
+    def _add(self, key: Tuple[Style, Optional[str]], style: Style) -> int:
+        """Add a style to the table. Must be called with the lock held."""
+        style_id = self._style_ids.get(key)
+        if style_id is None:
+            style_id = len(self._styles)
+            self._styles.append(style)
+            self._style_ids[key] = style_id
+        return style_id
+
+    def get_style(self, style_id: int) -> Style:
+        """Get the style with the given id.
+
+        Args:
+            style_id (int): Id returned by :meth:`get_id`.
+
+        Returns:
+            Style: The interned style.
+        """
+        return self._styles[style_id]
+
+    def combine(self, style_id1: int, style_id2: int) -> int:
+        """Combine two styles by id, as with ``style1 + style2``.
+
+        Args:
+            style_id1 (int): Id of the base style.
+            style_id2 (int): Id of the style to apply on top.
+
+        Returns:
+            int: Id of the combined style.
+        """
+        key = (style_id1, style_id2)
+        combined_id = self._combined.get(key)
+        if combined_id is None:
+            styles = self._styles
+            style = styles[style_id1] + styles[style_id2]
+            with self._lock:
+                combined_id = self._add((style, style._link_id), style)
+                if len(self._combined) >= self.combine_cache_size:
+                    self._combined.clear()
+                self._combined[key] = combined_id
+        return combined_id
+
+    def combine_ids(self, style_ids: Iterable[int]) -> int:
+        """Combine any number of styles by id.
+
+        Args:
+            style_ids (Iterable[int]): Ids of styles to combine, with later styles taking precedence.
+
+        Returns:
+            int: Id of the combined style.
+        """
+        iter_ids = iter(style_ids)
+        combine = self.combine
+        combined_id = next(iter_ids)
+        for style_id in iter_ids:
+            combined_id = combine(combined_id, style_id)
+        return combined_id
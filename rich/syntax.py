@@ -3,11 +3,18 @@ import re
 import sys
 import textwrap
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import partial
+from hashlib import blake2b
 from pathlib import Path
+from threading import RLock
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -16,6 +23,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 
 from pygments.lexer import Lexer
@@ -33,6 +41,7 @@ from pygments.token import (
     String,
     Token,
     Whitespace,
+    string_to_tokentype,
 )
 from pygments.util import ClassNotFound
 
@@ -117,6 +126,10 @@ ANSI_DARK: Dict[TokenType, Style] = {
 
 RICH_SYNTAX_THEMES = {"ansi_light": ANSI_LIGHT, "ansi_dark": ANSI_DARK}
 NUMBERS_COLUMN_DEFAULT_PADDING = 2
+DEFAULT_TOKEN_CACHE_SIZE = 32
+DEFAULT_CHECKPOINT_LINES = 100
+PARALLEL_MIN_SIZE = 1024 * 1024
+PARALLEL_CHUNK_SIZE = 256 * 1024
 
 
 class SyntaxTheme(ABC):
@@ -228,6 +241,311 @@ class _SyntaxHighlightRange(NamedTuple):
     style_before: bool = False
 
 
+class _TokenStream:
+    """Tokens lexed from some code, which are read from the lexer as required.
+
+    The index of the first token to start on or after every ``checkpoint_lines`` lines is
+    recorded, so that tokens may be read from near any line without scanning from the
+    start, and lexing resumes from where it previously stopped.
+
+    Args:
+        tokens (Iterable[Tuple[TokenType, str]]): Tokens from a lexer.
+        checkpoint_lines (int): Number of lines between checkpoints.
+        on_complete (Callable[[List[Tuple[TokenType, str]]], None], optional): Callback
+            invoked with all the tokens once the lexer is exhausted. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[Tuple[TokenType, str]],
+        checkpoint_lines: int,
+        on_complete: Optional[
+            Callable[[List[Tuple[TokenType, str]]], None]
+        ] = None,
+    ) -> None:
+        self.tokens: List[Tuple[TokenType, str]] = []
+        self.complete = False
+        self.checkpoint_lines = max(1, checkpoint_lines)
+        # Token index and line number (from 0) of each checkpoint
+        self._checkpoint_indexes: List[int] = [0]
+        self._checkpoint_line_numbers: List[int] = [0]
+        self._next_checkpoint = self.checkpoint_lines
+        self._line_no = 0
+        self._iter_tokens = iter(tokens)
+        self._on_complete = on_complete
+        self._lock = RLock()
+
+    def _read(self) -> bool:
+        """Read the next token from the lexer.
+
+        Returns:
+            bool: True if a token was read, or False if the lexer is exhausted.
+        """
+        with self._lock:
+            if self.complete:
+                return False
+            try:
+                token = next(self._iter_tokens)
+            except StopIteration:
+                self.complete = True
+                self._iter_tokens = iter(())
+                if self._on_complete is not None:
+                    self._on_complete(self.tokens)
+                return False
+            line_no = self._line_no
+            if line_no >= self._next_checkpoint:
+                self._checkpoint_indexes.append(len(self.tokens))
+                self._checkpoint_line_numbers.append(line_no)
+                self._next_checkpoint = (
+                    line_no // self.checkpoint_lines + 1
+                ) * self.checkpoint_lines
+            self.tokens.append(token)
+            self._line_no += token[1].count("\n")
+            return True
+
+    def get_checkpoint(self, line_no: int) -> Tuple[int, int]:
+        """Get the closest checkpoint at or before a line, lexing up to it if required.
+
+        Args:
+            line_no (int): Line number, from 0.
+
+        Returns:
+            Tuple[int, int]: The index of a token, and the line number on which it starts.
+        """
+        target_line_no = line_no - line_no % self.checkpoint_lines
+        while (
+            self._checkpoint_line_numbers[-1] < target_line_no and self._read()
+        ):
+            pass
+        position = bisect_right(self._checkpoint_line_numbers, line_no) - 1
+        return (
+            self._checkpoint_indexes[position],
+            self._checkpoint_line_numbers[position],
+        )
+
+    def iter_tokens(self, index: int = 0) -> Iterator[Tuple[TokenType, str]]:
+        """Iterate over tokens, reading from the lexer as required.
+
+        Args:
+            index (int, optional): Index of the first token. Defaults to 0.
+
+        Returns:
+            Iterator[Tuple[TokenType, str]]: An iterator of (TOKEN TYPE, TEXT) tuples.
+        """
+        tokens = self.tokens
+        # Check the length again after a failed read, as another thread may have read
+        # the remaining tokens
+        while index < len(tokens) or self._read() or index < len(tokens):
+            yield tokens[index]
+            index += 1
+
+
+class TokenCache:
+    """A least recently used cache of the tokens produced by lexing code.
+
+    Tokens are keyed on a hash of the code, the lexer class, and the lexer options (which
+    include the tab size), so the same tokens are reused with any theme. If a path is given,
+    tokens are also saved to files in that directory, so that they may be reused by later
+    processes.
+
+    Code is lexed only as far as it has been read, and the position of every
+    ``checkpoint_lines`` lines is recorded, so rendering a range of lines resumes lexing
+    from near the start of that range.
+
+    Args:
+        maxsize (int, optional): Maximum number of results to keep in memory. Defaults to DEFAULT_TOKEN_CACHE_SIZE.
+        path (Union[str, Path], optional): Directory to save tokens to, or None to keep tokens in memory only. Defaults to None.
+        checkpoint_lines (int, optional): Number of lines between checkpoints. Defaults to DEFAULT_CHECKPOINT_LINES.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_TOKEN_CACHE_SIZE,
+        path: Optional[Union[str, Path]] = None,
+        checkpoint_lines: int = DEFAULT_CHECKPOINT_LINES,
+    ) -> None:
+        self.maxsize = maxsize
+        self.path = None if path is None else Path(path)
+        self.checkpoint_lines = checkpoint_lines
+        self.hits = 0
+        self.misses = 0
+        self._streams: "OrderedDict[str, _TokenStream]" = OrderedDict()
+        self._lock = RLock()
+
+    def __repr__(self) -> str:
+        return f"<tokencache maxsize={self.maxsize} path={self.path!r}>"
+
+    @classmethod
+    def get_key(cls, lexer: Lexer, code: str) -> Optional[str]:
+        """Get the cache key for code lexed with a given lexer.
+
+        Args:
+            lexer (Lexer): A Pygments lexer.
+            code (str): Code to lex.
+
+        Returns:
+            Optional[str]: A key, or None if the tokens can not be cached.
+        """
+        if lexer.filters:
+            # Filters may not be deterministic
+            return None
+        lexer_type = type(lexer)
+        options = repr(sorted(lexer.options.items()))
+        hasher = blake2b(digest_size=20)
+        hasher.update(
+            f"{lexer_type.__module__}.{lexer_type.__qualname__}\0{options}\0".encode(
+                "utf-8"
+            )
+        )
+        hasher.update(code.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Tuple[TokenType, str]]]:
+        """Get cached tokens.
+
+        Args:
+            key (str): Key from :meth:`get_key`.
+
+        Returns:
+            Optional[List[Tuple[TokenType, str]]]: A list of (TOKEN TYPE, TEXT) tuples, or None if not cached.
+        """
+        stream = self._get_stream(key)
+        if stream is None or not stream.complete:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return stream.tokens
+
+    def set(self, key: str, tokens: List[Tuple[TokenType, str]]) -> None:
+        """Add tokens to the cache.
+
+        Args:
+            key (str): Key from :meth:`get_key`.
+            tokens (List[Tuple[TokenType, str]]): A list of (TOKEN TYPE, TEXT) tuples.
+        """
+        stream = _TokenStream(tokens, self.checkpoint_lines)
+        stream.get_checkpoint(sys.maxsize)
+        self._store(key, stream)
+        if self.path is not None:
+            self._save(key, tokens)
+
+    def clear(self) -> None:
+        """Clear tokens held in memory."""
+        with self._lock:
+            self._streams.clear()
+
+    def get_stream(self, lexer: Lexer, code: str) -> Optional[_TokenStream]:
+        """Get a stream of tokens for code, which reads from the lexer as required.
+
+        Args:
+            lexer (Lexer): A Pygments lexer.
+            code (str): Code to lex.
+
+        Returns:
+            Optional[_TokenStream]: A token stream, or None if the tokens can not be cached.
+        """
+        key = self.get_key(lexer, code)
+        if key is None:
+            return None
+        stream = self._get_stream(key)
+        if stream is None:
+            self.misses += 1
+            stream = _TokenStream(
+                lexer.get_tokens(code),
+                self.checkpoint_lines,
+                on_complete=(
+                    None if self.path is None else partial(self._save, key)
+                ),
+            )
+            self._store(key, stream)
+        else:
+            self.hits += 1
+        return stream
+
+    def get_tokens(
+        self, lexer: Lexer, code: str
+    ) -> Iterable[Tuple[TokenType, str]]:
+        """Get tokens for code from the cache, or from the lexer if they are not cached.
+
+        Args:
+            lexer (Lexer): A Pygments lexer.
+            code (str): Code to lex.
+
+        Returns:
+            Iterable[Tuple[TokenType, str]]: An iterable of (TOKEN TYPE, TEXT) tuples.
+        """
+        stream = self.get_stream(lexer, code)
+        if stream is None:
+            return cast(
+                Iterable[Tuple[TokenType, str]], lexer.get_tokens(code)
+            )
+        return stream.iter_tokens()
+
+    def _get_stream(self, key: str) -> Optional[_TokenStream]:
+        """Get a stream from memory, or from disk if a path was given."""
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is not None:
+                self._streams.move_to_end(key)
+                return stream
+        if self.path is not None:
+            tokens = self._load(key)
+            if tokens is not None:
+                stream = _TokenStream(tokens, self.checkpoint_lines)
+                stream.get_checkpoint(sys.maxsize)
+                self._store(key, stream)
+        return stream
+
+    def _store(self, key: str, stream: _TokenStream) -> None:
+        """Store a stream in memory, discarding the least recently used if required."""
+        with self._lock:
+            self._streams[key] = stream
+            self._streams.move_to_end(key)
+            while len(self._streams) > self.maxsize:
+                self._streams.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[List[Tuple[TokenType, str]]]:
+        """Load tokens from disk."""
+        import json
+
+        assert self.path is not None
+        try:
+            with open(
+                self.path / f"{key}.json", "rt", encoding="utf-8"
+            ) as token_file:
+                saved_tokens = json.load(token_file)
+            return [
+                (string_to_tokentype(token_type), token)
+                for token_type, token in saved_tokens
+            ]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save(self, key: str, tokens: List[Tuple[TokenType, str]]) -> None:
+        """Save tokens to disk, ignoring any errors."""
+        import json
+
+        assert self.path is not None
+        token_path = self.path / f"{key}.json"
+        temp_path = token_path.with_name(f"{key}.{os.getpid()}.tmp")
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wt", encoding="utf-8") as token_file:
+                json.dump(
+                    [
+                        (".".join(token_type), token)
+                        for token_type, token in tokens
+                    ],
+                    token_file,
+                )
+            os.replace(temp_path, token_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
 class Syntax(JupyterMixin):
     """Construct a Syntax object to render syntax highlighted code.
 
@@ -247,11 +565,15 @@ class Syntax(JupyterMixin):
         background_color (str, optional): Optional background color, or None to use theme color. Defaults to None.
         indent_guides (bool, optional): Show indent guides. Defaults to False.
         padding (PaddingDimensions): Padding to apply around the syntax. Defaults to 0 (no padding).
+        parallel (bool, optional): Lex large code in a pool of processes, if the lexer supports it. Defaults to False.
     """
 
     _pygments_style_class: Type[PygmentsStyle]
     _theme: SyntaxTheme
 
+    token_cache: Optional[TokenCache] = None
+    """Cache of lexed tokens shared by Syntax instances, or None (the default) to always run the lexer."""
+
     @classmethod
     def get_theme(cls, name: Union[str, SyntaxTheme]) -> SyntaxTheme:
         """Get a syntax theme instance."""
@@ -281,6 +603,7 @@ class Syntax(JupyterMixin):
         background_color: Optional[str] = None,
         indent_guides: bool = False,
         padding: PaddingDimensions = 0,
+        parallel: bool = False,
     ) -> None:
         self.code = code
         self._lexer = lexer
@@ -298,9 +621,12 @@ class Syntax(JupyterMixin):
         )
         self.indent_guides = indent_guides
         self.padding = padding
+        self.parallel = parallel
 
         self._theme = self.get_theme(theme)
         self._stylized_ranges: List[_SyntaxHighlightRange] = []
+        # Key and token stream of the code last rendered with a line range
+        self._token_stream: Optional[Tuple[str, _TokenStream]] = None
 
     @classmethod
     def from_path(
@@ -320,6 +646,7 @@ class Syntax(JupyterMixin):
         background_color: Optional[str] = None,
         indent_guides: bool = False,
         padding: PaddingDimensions = 0,
+        parallel: bool = False,
     ) -> "Syntax":
         """Construct a Syntax object from a file.
 
@@ -339,6 +666,7 @@ class Syntax(JupyterMixin):
             background_color (str, optional): Optional background color, or None to use theme color. Defaults to None.
             indent_guides (bool, optional): Show indent guides. Defaults to False.
             padding (PaddingDimensions): Padding to apply around the syntax. Defaults to 0 (no padding).
+            parallel (bool, optional): Lex large code in a pool of processes, if the lexer supports it. Defaults to False.
 
         Returns:
             [Syntax]: A Syntax object that may be printed to the console
@@ -363,6 +691,7 @@ class Syntax(JupyterMixin):
             background_color=background_color,
             indent_guides=indent_guides,
             padding=padding,
+            parallel=parallel,
         )
 
     @classmethod
@@ -455,6 +784,65 @@ class Syntax(JupyterMixin):
             tabsize=self.tab_size,
         )
 
+    def _get_tokens(
+        self, lexer: Lexer, code: str
+    ) -> Iterable[Tuple[TokenType, str]]:
+        """Get tokens for code, using the token cache if enabled."""
+        token_cache = self.token_cache
+        if self.parallel and len(code) >= PARALLEL_MIN_SIZE:
+            tokens = self._get_parallel_tokens(lexer, code)
+            if tokens is not None:
+                return tokens
+        if token_cache is None:
+            return cast(
+                Iterable[Tuple[TokenType, str]], lexer.get_tokens(code)
+            )
+        return token_cache.get_tokens(lexer, code)
+
+    def _get_token_stream(
+        self, lexer: Lexer, code: str
+    ) -> Optional[_TokenStream]:
+        """Get a token stream for rendering a range of lines, which records checkpoints.
+
+        The stream comes from the token cache if enabled. Otherwise the stream is kept by
+        this instance, so rendering another range of the same code resumes from a checkpoint.
+        """
+        if self.token_cache is not None:
+            return self.token_cache.get_stream(lexer, code)
+        key = TokenCache.get_key(lexer, code)
+        if key is None:
+            return None
+        if self._token_stream is None or self._token_stream[0] != key:
+            self._token_stream = (
+                key,
+                _TokenStream(lexer.get_tokens(code), DEFAULT_CHECKPOINT_LINES),
+            )
+        return self._token_stream[1]
+
+    def _get_parallel_tokens(
+        self, lexer: Lexer, code: str
+    ) -> Optional[List[Tuple[TokenType, str]]]:
+        """Get tokens for code lexed in a pool of processes.
+
+        Returns:
+            Optional[List[Tuple[TokenType, str]]]: Tokens, or None if the code must be lexed serially.
+        """
+        from ._syntax_parallel import lex_parallel
+
+        token_cache = self.token_cache
+        key = None if token_cache is None else token_cache.get_key(lexer, code)
+        if token_cache is not None and key is not None:
+            tokens = token_cache.get(key)
+            if tokens is not None:
+                return tokens
+        chunk_size = max(
+            PARALLEL_CHUNK_SIZE, len(code) // (os.cpu_count() or 1)
+        )
+        tokens = lex_parallel(lexer, code, chunk_size)
+        if tokens is not None and token_cache is not None and key is not None:
+            token_cache.set(key, tokens)
+        return tokens
+
     def highlight(
         self,
         code: str,
@@ -493,20 +881,43 @@ class Syntax(JupyterMixin):
                 # This speeds up further operations as there are less spans to process
                 line_start, line_end = line_range
 
-                def line_tokenize() -> Iterable[Tuple[Any, str]]:
+                def line_tokenize(
+                    tokens: Iterable[Tuple[TokenType, str]],
+                ) -> Iterable[Tuple[Any, str]]:
                     """Split tokens to one per line."""
-                    assert lexer  # required to make MyPy happy - we know lexer is not None at this point
-
-                    for token_type, token in lexer.get_tokens(code):
+                    for token_type, token in tokens:
                         while token:
                             line_token, new_line, token = token.partition("\n")
                             yield token_type, line_token + new_line
 
                 def tokens_to_spans() -> Iterable[Tuple[str, Optional[Style]]]:
                     """Convert tokens to spans."""
-                    tokens = iter(line_tokenize())
-                    line_no = 0
+                    assert lexer  # required to make MyPy happy - we know lexer is not None at this point
                     _line_start = line_start - 1 if line_start else 0
+                    token_stream = self._get_token_stream(lexer, code)
+                    if token_stream is None:
+                        line_no = 0
+                        tokens = iter(line_tokenize(lexer.get_tokens(code)))
+                    else:
+                        # Resume from the closest checkpoint before the line range
+                        token_index, line_no = token_stream.get_checkpoint(
+                            _line_start
+                        )
+                        if token_index:
+                            yield (
+                                "".join(
+                                    token
+                                    for _, token in token_stream.tokens[
+                                        :token_index
+                                    ]
+                                ),
+                                None,
+                            )
+                        tokens = iter(
+                            line_tokenize(
+                                token_stream.iter_tokens(token_index)
+                            )
+                        )
 
                     # Skip over tokens until line start
                     while line_no < _line_start:
@@ -530,7 +941,7 @@ class Syntax(JupyterMixin):
             else:
                 text.append_tokens(
                     (token, _get_theme_style(token_type))
-                    for token_type, token in lexer.get_tokens(code)
+                    for token_type, token in self._get_tokens(lexer, code)
                 )
             if self.background_color is not None:
                 text.stylize(f"on {self.background_color}")
@@ -704,13 +1115,22 @@ class Syntax(JupyterMixin):
         line_offset = 0
         if start_line:
             line_offset = max(0, start_line - 1)
-        lines: Union[List[Text], Lines] = text.split(
-            "\n", allow_blank=ends_on_nl
+        lines: Union[List[Text], Lines]
+        remaining_lines = (
+            text.plain.split("\n", line_offset) if line_offset else []
         )
-        if self.line_range:
-            if line_offset > len(lines):
-                return
-            lines = lines[line_offset:end_line]
+        if len(remaining_lines) > line_offset and remaining_lines[-1]:
+            # Discard the lines before the range, rather than splitting them
+            range_text = text.divide([len(text) - len(remaining_lines[-1])])[1]
+            lines = range_text.split("\n", allow_blank=ends_on_nl)
+            if end_line is not None:
+                lines = lines[: max(0, end_line - line_offset)]
+        else:
+            lines = text.split("\n", allow_blank=ends_on_nl)
+            if self.line_range:
+                if line_offset > len(lines):
+                    return
+                lines = lines[line_offset:end_line]
 
         if self.indent_guides and not options.ascii_only:
             style = (
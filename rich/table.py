@@ -1,14 +1,22 @@
 from dataclasses import dataclass, field, replace
+from itertools import chain, islice, repeat, zip_longest
 from typing import (
     TYPE_CHECKING,
+    Any,
+    Callable,
     Dict,
+    Hashable,
     Iterable,
+    Iterator,
     List,
+    Mapping,
     NamedTuple,
     Optional,
     Sequence,
     Tuple,
     Union,
+    cast,
+    overload,
 )
 
 from . import box, errors
@@ -140,6 +148,50 @@ class Row:
     """Indicated end of section, which will force a line beneath the row."""
 
 
+def _get_cell_renderables(values: Iterable[Any]) -> List["RenderableType"]:
+    """Convert a column of values to cell renderables.
+
+    Columns containing only strings, integers, and floats are converted in
+    bulk, without checking each cell.
+
+    Args:
+        values (Iterable[Any]): Cell values, which may be renderables,
+            numbers, or ``None`` for a blank cell.
+
+    Raises:
+        errors.NotRenderableError: If a value can't be rendered.
+
+    Returns:
+        List[RenderableType]: A list of renderables.
+    """
+    tolist = getattr(values, "tolist", None)
+    # NumPy arrays and array.array convert to Python objects much faster
+    cells: List[Any] = tolist() if callable(tolist) else list(values)
+    cell_types = set(map(type, cells))
+    if cell_types <= {str}:
+        return cells
+    if cell_types <= {str, int, float}:
+        return list(map(str, cells))
+    renderables: List["RenderableType"] = []
+    append = renderables.append
+    for cell in cells:
+        if cell is None:
+            append("")
+        elif isinstance(cell, (int, float)):
+            append(str(cell))
+        elif is_renderable(cell):
+            append(cell)
+        else:
+            raise errors.NotRenderableError(
+                f"unable to render {type(cell).__name__}; a string or other renderable object is required"
+            )
+    return renderables
+
+
+MEASURE_CACHE_OPTIONS = 8
+"""Maximum number of distinct options to cache cell measurements for."""
+
+
 class _Cell(NamedTuple):
     """A single cell in a table."""
 
@@ -242,6 +294,7 @@ class Table(JupyterMixin):
         self.caption_justify: "JustifyMethod" = caption_justify
         self.highlight = highlight
         self.row_styles: Sequence[StyleType] = list(row_styles or [])
+        self._measure_cache: Dict[Hashable, Dict[Hashable, Measurement]] = {}
         append_column = self.columns.append
         for header in headers:
             if isinstance(header, str):
@@ -283,6 +336,39 @@ class Table(JupyterMixin):
             expand=expand,
         )
 
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Union[
+            Mapping[str, Iterable[Any]],
+            Iterable[Tuple[Union[Column, str], Iterable[Any]]],
+        ],
+        **kwargs: Any,
+    ) -> "Table":
+        """Get a table from column-major data.
+
+        Args:
+            columns (Union[Mapping[str, Iterable[Any]], Iterable[Tuple[Union[Column, str], Iterable[Any]]]]): A mapping of header on to
+                the values in the column, or an iterable of (HEADER, VALUES) tuples. Values may be lists, ``array.array``, or NumPy arrays
+                of renderables, integers, or floats.
+            **kwargs (Any): Other arguments, as for :class:`~rich.table.Table`.
+
+        Raises:
+            ValueError: If the columns are not all the same length.
+            errors.NotRenderableError: If a value can't be rendered.
+
+        Returns:
+            Table: A table instance.
+        """
+        items = (
+            list(columns.items())
+            if isinstance(columns, Mapping)
+            else list(columns)
+        )
+        table = cls(*[header for header, _ in items], **kwargs)
+        table._add_column_values([values for _, values in items])
+        return table
+
     @property
     def expand(self) -> bool:
         """Setting a non-None self.width implies expand."""
@@ -471,6 +557,78 @@ class Table(JupyterMixin):
                 )
         self.rows.append(Row(style=style, end_section=end_section))
 
+    def add_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        style: Optional[StyleType] = None,
+        batch_size: int = 1000,
+    ) -> None:
+        """Add many rows at once.
+
+        This is much faster than calling :meth:`add_row` for each row, as
+        the rows are added to the columns in batches.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): An iterable of rows, or a DB-API cursor (which will be read with ``fetchmany``).
+                Each cell must be a renderable object (including str), an integer or float, or ``None`` for a blank cell.
+            style (StyleType, optional): An optional style to apply to each of the rows. Defaults to None.
+            batch_size (int, optional): Number of rows to read at a time. Defaults to 1000.
+
+        Raises:
+            errors.NotRenderableError: If you add something that can't be rendered.
+        """
+        fetchmany = getattr(rows, "fetchmany", None)
+        if callable(fetchmany):
+            get_batch: Callable[[], Sequence[Sequence[Any]]] = lambda: (
+                fetchmany(batch_size)
+            )
+        else:
+            iter_rows = iter(rows)
+            get_batch = lambda: list(islice(iter_rows, batch_size))
+        while True:
+            batch = get_batch()
+            if not batch:
+                break
+            self._add_column_values(
+                list(zip_longest(*batch, fillvalue=None)), style=style
+            )
+
+    def _add_column_values(
+        self,
+        column_values: Sequence[Iterable[Any]],
+        style: Optional[StyleType] = None,
+    ) -> None:
+        """Add rows from the values in each column.
+
+        Args:
+            column_values (Sequence[Iterable[Any]]): Values for each column.
+            style (StyleType, optional): An optional style to apply to each of the rows. Defaults to None.
+
+        Raises:
+            ValueError: If the columns are not all the same length.
+        """
+        column_cells = [
+            _get_cell_renderables(values) for values in column_values
+        ]
+        row_count = len(column_cells[0]) if column_cells else 0
+        if any(len(cells) != row_count for cells in column_cells):
+            raise ValueError("columns must all be the same length")
+        if not row_count:
+            return
+        columns = self.columns
+        for index, cells in enumerate(column_cells):
+            if index == len(columns):
+                column = Column(_index=index, highlight=self.highlight)
+                column._cells.extend([""] * len(self.rows))
+                columns.append(column)
+            else:
+                column = columns[index]
+            column._cells.extend(cells)
+        for column in columns[len(column_cells) :]:
+            column._cells.extend([""] * row_count)
+        self.rows.extend(map(Row, repeat(style, row_count)))
+
     def add_section(self) -> None:
         """Add a new section (draw a line after current row)."""
 
@@ -646,19 +804,48 @@ class Table(JupyterMixin):
                 excess_width = total_width - max_width
         return widths
 
+    def _get_column_cells(
+        self, column: Column, row_indexes: Optional[Sequence[int]] = None
+    ) -> Iterable["RenderableType"]:
+        """Get the renderables in a column.
+
+        Args:
+            column (Column): A column.
+            row_indexes (Sequence[int], optional): Indexes of rows, or None for all rows. Defaults to None.
+
+        Returns:
+            Iterable[RenderableType]: Renderables for the cells.
+        """
+        if row_indexes is None:
+            return column.cells
+        cells = column._cells
+        return (cells[row_index] for row_index in row_indexes)
+
+    def _get_measure_row_indexes(self) -> Optional[Sequence[int]]:
+        """Get the indexes of the rows to measure column widths from, or None for all rows."""
+        return None
+
     def _get_cells(
-        self, console: "Console", column_index: int, column: Column
+        self,
+        console: "Console",
+        column_index: int,
+        column: Column,
+        row_indexes: Optional[Sequence[int]] = None,
     ) -> Iterable[_Cell]:
-        """Get all the cells with padding and optional header."""
+        """Get all the cells with padding and optional header.
 
-        collapse_padding = self.collapse_padding
-        pad_edge = self.pad_edge
-        padding = self.padding
-        any_padding = any(padding)
+        Args:
+            console (Console): Console instance.
+            column_index (int): Index of the column.
+            column (Column): The column.
+            row_indexes (Sequence[int], optional): Indexes of rows to get cells from, or None for all rows. Defaults to None.
 
-        first_column = column_index == 0
-        last_column = column_index == len(self.columns) - 1
+        Returns:
+            Iterable[_Cell]: Cells in the column.
+        """
 
+        any_padding = any(self.padding)
+        get_cell_padding = self._get_cell_padding
         _padding_cache: Dict[Tuple[bool, bool], Tuple[int, int, int, int]] = {}
 
         def get_padding(
@@ -667,43 +854,28 @@ class Table(JupyterMixin):
             cached = _padding_cache.get((first_row, last_row))
             if cached:
                 return cached
-            top, right, bottom, left = padding
-
-            if collapse_padding:
-                if not first_column:
-                    left = max(0, left - right)
-                if not last_row:
-                    bottom = max(0, top - bottom)
-
-            if not pad_edge:
-                if first_column:
-                    left = 0
-                if last_column:
-                    right = 0
-                if first_row:
-                    top = 0
-                if last_row:
-                    bottom = 0
-            _padding = (top, right, bottom, left)
+            _padding = get_cell_padding(column_index, first_row, last_row)
             _padding_cache[(first_row, last_row)] = _padding
             return _padding
 
-        raw_cells: List[Tuple[StyleType, "RenderableType"]] = []
-        _append = raw_cells.append
         get_style = console.get_style
-        if self.show_header:
-            header_style = get_style(self.header_style or "") + get_style(
-                column.header_style
-            )
-            _append((header_style, column.header))
-        cell_style = get_style(column.style or "")
-        for cell in column.cells:
-            _append((cell_style, cell))
-        if self.show_footer:
-            footer_style = get_style(self.footer_style or "") + get_style(
-                column.footer_style
-            )
-            _append((footer_style, column.footer))
+
+        def iter_raw_cells() -> Iterable[Tuple[StyleType, "RenderableType"]]:
+            if self.show_header:
+                header_style = get_style(self.header_style or "") + get_style(
+                    column.header_style
+                )
+                yield (header_style, column.header)
+            cell_style = get_style(column.style or "")
+            for cell in self._get_column_cells(column, row_indexes):
+                yield (cell_style, cell)
+            if self.show_footer:
+                footer_style = get_style(self.footer_style or "") + get_style(
+                    column.footer_style
+                )
+                yield (footer_style, column.footer)
+
+        raw_cells = iter_raw_cells()
 
         if any_padding:
             _Padding = Padding
@@ -721,6 +893,40 @@ class Table(JupyterMixin):
                     getattr(renderable, "vertical", None) or column.vertical,
                 )
 
+    def _get_cell_padding(
+        self, column_index: int, first_row: bool, last_row: bool
+    ) -> Tuple[int, int, int, int]:
+        """Get the padding around a cell.
+
+        Args:
+            column_index (int): Index of the column.
+            first_row (bool): The cell is in the first row.
+            last_row (bool): The cell is in the last row.
+
+        Returns:
+            Tuple[int, int, int, int]: Padding (top, right, bottom, left).
+        """
+        top, right, bottom, left = self.padding
+        first_column = column_index == 0
+        last_column = column_index == len(self.columns) - 1
+
+        if self.collapse_padding:
+            if not first_column:
+                left = max(0, left - right)
+            if not last_row:
+                bottom = max(0, top - bottom)
+
+        if not self.pad_edge:
+            if first_column:
+                left = 0
+            if last_column:
+                right = 0
+            if first_row:
+                top = 0
+            if last_row:
+                bottom = 0
+        return (top, right, bottom, left)
+
     def _get_padding_width(self, column_index: int) -> int:
         """Get extra width from padding."""
         _, pad_right, _, pad_left = self.padding
@@ -729,6 +935,55 @@ class Table(JupyterMixin):
                 pad_left = max(0, pad_left - pad_right)
         return pad_left + pad_right
 
+    @staticmethod
+    def _get_measure_key(renderable: "RenderableType") -> Optional[Hashable]:
+        """Get a key for the measurement of a cell, from its content.
+
+        Only strings and Text are keyed, as other renderables may change
+        without the table being aware of it.
+
+        Args:
+            renderable (RenderableType): A cell renderable.
+
+        Returns:
+            Optional[Hashable]: A key, or None if the cell can't be cached.
+        """
+        if type(renderable) is str:
+            return renderable
+        if type(renderable) is Text:
+            # Text is measured from its plain text only
+            return (Text, renderable.plain)
+        return None
+
+    def _get_measure_cache(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Dict[Hashable, Measurement]:
+        """Get the cache of cell measurements for the given options.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Options the cells are measured with.
+
+        Returns:
+            Dict[Hashable, Measurement]: A mapping of cell key on to measurement.
+        """
+        fingerprint = (
+            options.max_width,
+            options.markup,
+            console._markup,
+            console._emoji,
+        )
+        measure_cache = self._measure_cache
+        cache = measure_cache.get(fingerprint)
+        # Cells which are no longer in the table are only evicted when the
+        # cache is larger than the table
+        max_size = 2 * (len(self.rows) + 2) * max(1, len(self.columns))
+        if cache is None or len(cache) > max_size:
+            if len(measure_cache) >= MEASURE_CACHE_OPTIONS:
+                measure_cache.clear()
+            cache = measure_cache[fingerprint] = {}
+        return cache
+
     def _measure_column(
         self,
         console: "Console",
@@ -754,8 +1009,32 @@ class Table(JupyterMixin):
         append_min = min_widths.append
         append_max = max_widths.append
         get_render_width = Measurement.get
-        for cell in self._get_cells(console, column._index, column):
-            _min, _max = get_render_width(console, options, cell.renderable)
+        measure_cache = self._get_measure_cache(console, options)
+        get_measure_key = self._get_measure_key
+        any_padding = any(self.padding)
+        for cell in self._get_cells(
+            console,
+            column._index,
+            column,
+            self._get_measure_row_indexes(),
+        ):
+            renderable = cell.renderable
+            if any_padding:
+                padding = cast(Padding, renderable)
+                key = get_measure_key(padding.renderable)
+                if key is not None:
+                    key = (key, padding.left, padding.right)
+            else:
+                key = get_measure_key(renderable)
+            if key is None:
+                _min, _max = get_render_width(console, options, renderable)
+            else:
+                measurement = measure_cache.get(key)
+                if measurement is None:
+                    measurement = measure_cache[key] = get_render_width(
+                        console, options, renderable
+                    )
+                _min, _max = measurement
             append_min(_min)
             append_max(_max)
 
@@ -778,28 +1057,25 @@ class Table(JupyterMixin):
         return measurement
 
     def _render(
-        self, console: "Console", options: "ConsoleOptions", widths: List[int]
-    ) -> "RenderResult":
+        self,
+        console: "Console",
+        options: "ConsoleOptions",
+        widths: List[int],
+        row_indexes: Optional[Sequence[int]] = None,
+    ) -> Iterable[Segment]:
         table_style = console.get_style(self.style or "")
 
         border_style = table_style + console.get_style(self.border_style or "")
         _column_cells = (
-            self._get_cells(console, column_index, column)
+            self._get_cells(console, column_index, column, row_indexes)
             for column_index, column in enumerate(self.columns)
         )
-        row_cells: List[Tuple[_Cell, ...]] = list(zip(*_column_cells))
-        _box = (
-            self.box.substitute(
-                options, safe=pick_bool(self.safe_box, console.safe_box)
-            )
-            if self.box
-            else None
-        )
-        _box = (
-            _box.get_plain_headed_box()
-            if _box and not self.show_header
-            else _box
-        )
+        # Rows are rendered as they are read, so cells are never all in memory
+        row_cells: Iterable[Tuple[_Cell, ...]] = zip(*_column_cells)
+        row_cell_count = (
+            len(self.rows) if row_indexes is None else len(row_indexes)
+        ) + (self.show_header + self.show_footer)
+        _box = self._get_box(console, options)
 
         new_line = Segment.line()
 
@@ -812,23 +1088,7 @@ class Table(JupyterMixin):
 
         _Segment = Segment
         if _box:
-            box_segments = [
-                (
-                    _Segment(_box.head_left, border_style),
-                    _Segment(_box.head_right, border_style),
-                    _Segment(_box.head_vertical, border_style),
-                ),
-                (
-                    _Segment(_box.mid_left, border_style),
-                    _Segment(_box.mid_right, border_style),
-                    _Segment(_box.mid_vertical, border_style),
-                ),
-                (
-                    _Segment(_box.foot_left, border_style),
-                    _Segment(_box.foot_right, border_style),
-                    _Segment(_box.foot_vertical, border_style),
-                ),
-            ]
+            box_segments = self._get_box_segments(_box, border_style)
             if show_edge:
                 yield _Segment(_box.get_top(widths), border_style)
                 yield new_line
@@ -843,108 +1103,38 @@ class Table(JupyterMixin):
         ):
             header_row = first and show_header
             footer_row = last and show_footer
+            row_index = index - show_header
+            if row_indexes is not None and not (header_row or footer_row):
+                row_index = row_indexes[row_index]
             row = (
-                self.rows[index - show_header]
+                self.rows[row_index]
                 if (not header_row and not footer_row)
                 else None
             )
-            max_height = 1
-            cells: List[List[List[Segment]]] = []
             if header_row or footer_row:
                 row_style = Style.null()
             else:
-                row_style = get_style(
-                    get_row_style(console, index - 1 if show_header else index)
-                )
-            for width, cell, column in zip(widths, row_cell, columns):
-                render_options = options.update(
-                    width=width,
-                    justify=column.justify,
-                    no_wrap=column.no_wrap,
-                    overflow=column.overflow,
-                    height=None,
-                    highlight=column.highlight,
-                )
-                lines = console.render_lines(
-                    cell.renderable,
-                    render_options,
-                    style=get_style(cell.style) + row_style,
-                )
-                max_height = max(max_height, len(lines))
-                cells.append(lines)
-
-            row_height = max(len(cell) for cell in cells)
-
-            def align_cell(
-                cell: List[List[Segment]],
-                vertical: "VerticalAlignMethod",
-                width: int,
-                style: Style,
-            ) -> List[List[Segment]]:
-                if header_row:
-                    vertical = "bottom"
-                elif footer_row:
-                    vertical = "top"
-
-                if vertical == "top":
-                    return _Segment.align_top(cell, width, row_height, style)
-                elif vertical == "middle":
-                    return _Segment.align_middle(
-                        cell, width, row_height, style
-                    )
-                return _Segment.align_bottom(cell, width, row_height, style)
-
-            cells[:] = [
-                _Segment.set_shape(
-                    align_cell(
-                        cell,
-                        _cell.vertical,
-                        width,
-                        get_style(_cell.style) + row_style,
-                    ),
-                    width,
-                    max_height,
-                )
-                for width, _cell, cell, column in zip(
-                    widths, row_cell, cells, columns
-                )
-            ]
-
-            if _box:
-                if last and show_footer:
-                    yield _Segment(
-                        _box.get_row(widths, "foot", edge=show_edge),
-                        border_style,
-                    )
-                    yield new_line
-                left, right, _divider = box_segments[
-                    0 if first else (2 if last else 1)
-                ]
-
-                # If the column divider is whitespace also style it with the row background
-                divider = (
-                    _divider
-                    if _divider.text.strip()
-                    else _Segment(
-                        _divider.text,
-                        row_style.background_style + _divider.style,
-                    )
+                row_style = get_style(get_row_style(console, row_index))
+            if _box and last and show_footer:
+                yield _Segment(
+                    _box.get_row(widths, "foot", edge=show_edge),
+                    border_style,
                 )
-                for line_no in range(max_height):
-                    if show_edge:
-                        yield left
-                    for last_cell, rendered_cell in loop_last(cells):
-                        yield from rendered_cell[line_no]
-                        if not last_cell:
-                            yield divider
-                    if show_edge:
-                        yield right
-                    yield new_line
-            else:
-                for line_no in range(max_height):
-                    for rendered_cell in cells:
-                        yield from rendered_cell[line_no]
-                    yield new_line
+                yield new_line
+            yield from self._render_row(
+                console,
+                options,
+                widths,
+                row_cell,
+                row_style,
+                header_row=header_row,
+                footer_row=footer_row,
+                box_segments=(
+                    box_segments[0 if first else (2 if last else 1)]
+                    if _box
+                    else None
+                ),
+            )
             if _box and first and show_header:
                 yield _Segment(
                     _box.get_row(widths, "head", edge=show_edge), border_style
@@ -954,7 +1144,7 @@ class Table(JupyterMixin):
             if _box and (show_lines or leading or end_section):
                 if (
                     not last
-                    and not (show_footer and index >= len(row_cells) - 2)
+                    and not (show_footer and index >= row_cell_count - 2)
                     and not (show_header and header_row)
                 ):
                     if leading:
@@ -974,6 +1164,574 @@ class Table(JupyterMixin):
             yield _Segment(_box.get_bottom(widths), border_style)
             yield new_line
 
+    def _get_box(
+        self, console: "Console", options: "ConsoleOptions"
+    ) -> Optional[box.Box]:
+        """Get the box to draw borders with, or None for no borders."""
+        _box = (
+            self.box.substitute(
+                options, safe=pick_bool(self.safe_box, console.safe_box)
+            )
+            if self.box
+            else None
+        )
+        _box = (
+            _box.get_plain_headed_box()
+            if _box and not self.show_header
+            else _box
+        )
+        return _box
+
+    @staticmethod
+    def _get_box_segments(
+        _box: box.Box, border_style: Style
+    ) -> List[Tuple[Segment, Segment, Segment]]:
+        """Get the left edge, right edge, and column divider for the head, mid, and foot rows."""
+        return [
+            (
+                Segment(_box.head_left, border_style),
+                Segment(_box.head_right, border_style),
+                Segment(_box.head_vertical, border_style),
+            ),
+            (
+                Segment(_box.mid_left, border_style),
+                Segment(_box.mid_right, border_style),
+                Segment(_box.mid_vertical, border_style),
+            ),
+            (
+                Segment(_box.foot_left, border_style),
+                Segment(_box.foot_right, border_style),
+                Segment(_box.foot_vertical, border_style),
+            ),
+        ]
+
+    def _render_row(
+        self,
+        console: "Console",
+        options: "ConsoleOptions",
+        widths: List[int],
+        row_cell: Sequence[_Cell],
+        row_style: Style,
+        *,
+        header_row: bool = False,
+        footer_row: bool = False,
+        box_segments: Optional[Tuple[Segment, Segment, Segment]] = None,
+    ) -> Iterable[Segment]:
+        """Render the lines of a row of cells, with the borders either side of them.
+
+        Args:
+            console (Console): Console instance.
+            options (ConsoleOptions): Console options.
+            widths (List[int]): Width of each column.
+            row_cell (Sequence[_Cell]): A cell for each column.
+            row_style (Style): Style to apply to the row.
+            header_row (bool, optional): The row is the header. Defaults to False.
+            footer_row (bool, optional): The row is the footer. Defaults to False.
+            box_segments (Tuple[Segment, Segment, Segment], optional): Left edge, right edge, and
+                column divider, or None for no borders. Defaults to None.
+
+        Returns:
+            Iterable[Segment]: Segments for the lines of the row.
+        """
+        get_style = console.get_style
+        columns = self.columns
+        show_edge = self.show_edge
+        new_line = Segment.line()
+        _Segment = Segment
+
+        max_height = 1
+        cells: List[List[List[Segment]]] = []
+        for width, cell, column in zip(widths, row_cell, columns):
+            render_options = options.update(
+                width=width,
+                justify=column.justify,
+                no_wrap=column.no_wrap,
+                overflow=column.overflow,
+                height=None,
+                highlight=column.highlight,
+            )
+            lines = console.render_lines(
+                cell.renderable,
+                render_options,
+                style=get_style(cell.style) + row_style,
+            )
+            max_height = max(max_height, len(lines))
+            cells.append(lines)
+
+        row_height = max(len(cell) for cell in cells)
+
+        def align_cell(
+            cell: List[List[Segment]],
+            vertical: "VerticalAlignMethod",
+            width: int,
+            style: Style,
+        ) -> List[List[Segment]]:
+            if header_row:
+                vertical = "bottom"
+            elif footer_row:
+                vertical = "top"
+
+            if vertical == "top":
+                return _Segment.align_top(cell, width, row_height, style)
+            elif vertical == "middle":
+                return _Segment.align_middle(cell, width, row_height, style)
+            return _Segment.align_bottom(cell, width, row_height, style)
+
+        cells[:] = [
+            _Segment.set_shape(
+                align_cell(
+                    cell,
+                    _cell.vertical,
+                    width,
+                    get_style(_cell.style) + row_style,
+                ),
+                width,
+                max_height,
+            )
+            for width, _cell, cell, column in zip(
+                widths, row_cell, cells, columns
+            )
+        ]
+
+        if box_segments is not None:
+            left, right, _divider = box_segments
+
+            # If the column divider is whitespace also style it with the row background
+            divider = (
+                _divider
+                if _divider.text.strip()
+                else _Segment(
+                    _divider.text,
+                    row_style.background_style + _divider.style,
+                )
+            )
+            for line_no in range(max_height):
+                if show_edge:
+                    yield left
+                for last_cell, rendered_cell in loop_last(cells):
+                    yield from rendered_cell[line_no]
+                    if not last_cell:
+                        yield divider
+                if show_edge:
+                    yield right
+                yield new_line
+        else:
+            for line_no in range(max_height):
+                for rendered_cell in cells:
+                    yield from rendered_cell[line_no]
+                yield new_line
+
+
+RowSource = Union[
+    Sequence[Sequence[Optional["RenderableType"]]],
+    Callable[[int], Sequence[Optional["RenderableType"]]],
+]
+"""A sequence of rows, or a callable that returns the row at a given index."""
+
+
+class _VirtualRows(Sequence[Row]):
+    """Row information for a virtual table, which has no per-row state."""
+
+    def __init__(self, table: "VirtualTable") -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table.row_count
+
+    @overload
+    def __getitem__(self, index: int) -> Row: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Row]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Row, List[Row]]:
+        if isinstance(index, slice):
+            return [Row() for _ in range(*index.indices(len(self)))]
+        if not -len(self) <= index < len(self):
+            raise IndexError("row index out of range")
+        return Row()
+
+
+class VirtualTable(Table):
+    """A table which reads rows from a row source as they are rendered.
+
+    Column widths are calculated from the header, the footer, and a sample of the rows (or
+    from the column ``width``, if set), so the cost of rendering doesn't grow with the number
+    of rows. Use :meth:`render_rows` to render a window of rows.
+
+    Args:
+        *headers (Union[Column, str]): Column headers, either as a string, or :class:`~rich.table.Column` instance.
+        rows (RowSource): A sequence of rows, or a callable which returns the row at an index.
+            Each row is a sequence of renderables (or ``None`` for a blank cell).
+        row_count (int, optional): Number of rows, required if ``rows`` is a callable. Defaults to None.
+        sample_size (int, optional): Maximum number of rows to measure column widths from. Defaults to 100.
+        **kwargs (Any): Other arguments, as for :class:`~rich.table.Table`.
+    """
+
+    def __init__(
+        self,
+        *headers: Union[Column, str],
+        rows: RowSource,
+        row_count: Optional[int] = None,
+        sample_size: int = 100,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*headers, **kwargs)
+        if callable(rows) and row_count is None:
+            raise ValueError("row_count is required when rows is a callable")
+        self.row_source = rows
+        self.source_row_count = row_count
+        self.sample_size = sample_size
+        self.rows = _VirtualRows(self)  # type: ignore[assignment]
+        self._cached_row: Optional[
+            Tuple[int, Sequence[Optional["RenderableType"]]]
+        ] = None
+
+    @property
+    def row_count(self) -> int:
+        """Get the number of rows in the row source."""
+        if self.source_row_count is not None:
+            return self.source_row_count
+        return len(cast(Sequence[Any], self.row_source))
+
+    def add_row(
+        self,
+        *renderables: Optional["RenderableType"],
+        style: Optional[StyleType] = None,
+        end_section: bool = False,
+    ) -> None:
+        raise TypeError(
+            "can't add rows to a VirtualTable; add them to the row source"
+        )
+
+    def add_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        style: Optional[StyleType] = None,
+        batch_size: int = 1000,
+    ) -> None:
+        raise TypeError(
+            "can't add rows to a VirtualTable; add them to the row source"
+        )
+
+    def add_section(self) -> None:
+        raise TypeError("can't add sections to a VirtualTable")
+
+    def _get_row(self, row_index: int) -> Sequence[Optional["RenderableType"]]:
+        """Get a row from the row source."""
+        cached_row = self._cached_row
+        if cached_row is not None and cached_row[0] == row_index:
+            return cached_row[1]
+        row_source = self.row_source
+        row = (
+            row_source(row_index)
+            if callable(row_source)
+            else row_source[row_index]
+        )
+        self._cached_row = (row_index, row)
+        return row
+
+    def _get_column_cells(
+        self, column: Column, row_indexes: Optional[Sequence[int]] = None
+    ) -> Iterable["RenderableType"]:
+        get_row = self._get_row
+        column_index = column._index
+        for row_index in (
+            range(self.row_count) if row_indexes is None else row_indexes
+        ):
+            row = get_row(row_index)
+            renderable = row[column_index] if column_index < len(row) else None
+            if renderable is None:
+                yield ""
+            elif is_renderable(renderable):
+                yield renderable
+            else:
+                raise errors.NotRenderableError(
+                    f"unable to render {type(renderable).__name__}; a string or other renderable object is required"
+                )
+
+    def _get_measure_row_indexes(self) -> Optional[Sequence[int]]:
+        row_count = self.row_count
+        sample_size = max(1, self.sample_size)
+        if row_count <= sample_size:
+            return range(row_count)
+        # Rows spread evenly through the source, including the first and last
+        step = (row_count - 1) / (sample_size - 1) if sample_size > 1 else 0
+        return sorted({round(sample * step) for sample in range(sample_size)})
+
+    def render_rows(
+        self,
+        console: "Console",
+        start: int,
+        end: int,
+        options: Optional["ConsoleOptions"] = None,
+    ) -> List[List[Segment]]:
+        """Render a window of rows, with the header, footer, and edges, but not the title or caption.
+
+        Args:
+            console (Console): Console instance.
+            start (int): Index of the first row.
+            end (int): Index of the row after the last row.
+            options (ConsoleOptions, optional): Options to render with, or None for the console's options. Defaults to None.
+
+        Returns:
+            List[List[Segment]]: Rendered lines.
+        """
+        render_options = console.options if options is None else options
+        row_indexes = range(*slice(start, end).indices(self.row_count))
+        if not self.columns:
+            return [[]]
+        max_width = render_options.max_width
+        if self.width is not None:
+            max_width = self.width
+        extra_width = self._extra_width
+        widths = self._calculate_column_widths(
+            console, render_options.update_width(max_width - extra_width)
+        )
+        render_options = render_options.update(
+            width=sum(widths) + extra_width,
+            highlight=self.highlight,
+            height=None,
+        )
+        return list(
+            Segment.split_lines(
+                self._render(console, render_options, widths, row_indexes)
+            )
+        )
+
+
+class StreamingTable(Table):
+    """A table which renders rows from an iterable as they arrive.
+
+    Column widths are fixed before the first row is rendered, from the column ``width``
+    (or ``min_width``) and the first ``sample_size`` rows, so rows never need to be stored.
+    Print with ``stream=True`` to write rows as they are rendered (see :meth:`~rich.console.Console.print`).
+
+    Args:
+        *headers (Union[Column, str]): Column headers, either as a string, or :class:`~rich.table.Column` instance.
+        rows (Iterable[Sequence[Any]]): An iterable of rows. Each cell must be a renderable object (including str),
+            an integer or float, or ``None`` for a blank cell. Cells beyond the number of columns are ignored.
+        sample_size (int, optional): Number of rows to measure column widths from, if any column doesn't
+            have a fixed width. Defaults to 10.
+        **kwargs (Any): Other arguments, as for :class:`~rich.table.Table`.
+    """
+
+    def __init__(
+        self,
+        *headers: Union[Column, str],
+        rows: Iterable[Sequence[Any]],
+        sample_size: int = 10,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*headers, **kwargs)
+        self.row_source = rows
+        self.sample_size = sample_size
+        self._iter_rows: Iterator[Sequence[Any]] = iter(())
+        self._sample: Optional[List[List["RenderableType"]]] = None
+
+    def add_row(
+        self,
+        *renderables: Optional["RenderableType"],
+        style: Optional[StyleType] = None,
+        end_section: bool = False,
+    ) -> None:
+        raise TypeError(
+            "can't add rows to a StreamingTable; add them to the row source"
+        )
+
+    def add_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        style: Optional[StyleType] = None,
+        batch_size: int = 1000,
+    ) -> None:
+        raise TypeError(
+            "can't add rows to a StreamingTable; add them to the row source"
+        )
+
+    def add_section(self) -> None:
+        raise TypeError("can't add sections to a StreamingTable")
+
+    def get_row_style(self, console: "Console", index: int) -> StyleType:
+        """Get the current row style."""
+        if self.row_styles:
+            return console.get_style(
+                self.row_styles[index % len(self.row_styles)]
+            )
+        return Style.null()
+
+    def _get_row_cells(self, row: Sequence[Any]) -> List["RenderableType"]:
+        """Get the renderables for a row from the row source."""
+        column_count = len(self.columns)
+        cells = _get_cell_renderables(islice(row, column_count))
+        if len(cells) < column_count:
+            cells.extend([""] * (column_count - len(cells)))
+        return cells
+
+    def _get_sample(self) -> List[List["RenderableType"]]:
+        """Start reading the row source, and get the rows to measure."""
+        if self._sample is None:
+            self._iter_rows = iter(self.row_source)
+            if all(column.width is not None for column in self.columns):
+                self._sample = []
+            else:
+                self._sample = [
+                    self._get_row_cells(row)
+                    for row in islice(self._iter_rows, self.sample_size)
+                ]
+        return self._sample
+
+    def _get_column_cells(
+        self, column: Column, row_indexes: Optional[Sequence[int]] = None
+    ) -> Iterable["RenderableType"]:
+        column_index = column._index
+        for cells in self._get_sample():
+            yield cells[column_index]
+
+    def _render(
+        self,
+        console: "Console",
+        options: "ConsoleOptions",
+        widths: List[int],
+        row_indexes: Optional[Sequence[int]] = None,
+    ) -> Iterable[Segment]:
+        sample = self._get_sample()
+        rows = chain(sample, map(self._get_row_cells, self._iter_rows))
+        # The next render starts from the beginning of the row source
+        self._sample = None
+
+        table_style = console.get_style(self.style or "")
+        border_style = table_style + console.get_style(self.border_style or "")
+        _box = self._get_box(console, options)
+        box_segments = (
+            self._get_box_segments(_box, border_style) if _box else None
+        )
+        columns = self.columns
+        show_edge = self.show_edge
+        get_style = console.get_style
+        any_padding = any(self.padding)
+        get_cell_padding = self._get_cell_padding
+        new_line = Segment.line()
+
+        def get_row_cell(
+            renderables: Iterable["RenderableType"],
+            styles: Iterable[Style],
+            first_row: bool,
+            last_row: bool,
+        ) -> List[_Cell]:
+            return [
+                _Cell(
+                    style,
+                    (
+                        Padding(
+                            renderable,
+                            get_cell_padding(
+                                column._index, first_row, last_row
+                            ),
+                        )
+                        if any_padding
+                        else renderable
+                    ),
+                    getattr(renderable, "vertical", None) or column.vertical,
+                )
+                for column, renderable, style in zip(
+                    columns, renderables, styles
+                )
+            ]
+
+        if _box and show_edge:
+            yield Segment(_box.get_top(widths), border_style)
+            yield new_line
+
+        if self.show_header:
+            header_style = get_style(self.header_style or "")
+            yield from self._render_row(
+                console,
+                options,
+                widths,
+                get_row_cell(
+                    [column.header for column in columns],
+                    [
+                        header_style + get_style(column.header_style)
+                        for column in columns
+                    ],
+                    True,
+                    False,
+                ),
+                Style.null(),
+                header_row=True,
+                box_segments=box_segments[0] if box_segments else None,
+            )
+            if _box:
+                yield Segment(
+                    _box.get_row(widths, "head", edge=show_edge), border_style
+                )
+                yield new_line
+
+        cell_styles = [get_style(column.style or "") for column in columns]
+        index = -1
+        for index, cells in enumerate(rows):
+            first = index == 0
+            if _box and not first and (self.show_lines or self.leading):
+                if self.leading:
+                    yield Segment(
+                        _box.get_row(widths, "mid", edge=show_edge)
+                        * self.leading,
+                        border_style,
+                    )
+                else:
+                    yield Segment(
+                        _box.get_row(widths, "row", edge=show_edge),
+                        border_style,
+                    )
+                yield new_line
+            # The last row isn't known until the row source is exhausted, so
+            # rows (other than the first) are drawn as middle rows
+            head_row = first and not self.show_header
+            yield from self._render_row(
+                console,
+                options,
+                widths,
+                get_row_cell(cells, cell_styles, head_row, False),
+                get_style(self.get_row_style(console, index)),
+                box_segments=(
+                    box_segments[0 if head_row else 1]
+                    if box_segments
+                    else None
+                ),
+            )
+
+        if self.show_footer:
+            if _box:
+                yield Segment(
+                    _box.get_row(widths, "foot", edge=show_edge), border_style
+                )
+                yield new_line
+            footer_style = get_style(self.footer_style or "")
+            yield from self._render_row(
+                console,
+                options,
+                widths,
+                get_row_cell(
+                    [column.footer for column in columns],
+                    [
+                        footer_style + get_style(column.footer_style)
+                        for column in columns
+                    ],
+                    index == -1 and not self.show_header,
+                    True,
+                ),
+                Style.null(),
+                footer_row=True,
+                box_segments=box_segments[2] if box_segments else None,
+            )
+
+        if _box and show_edge:
+            yield Segment(_box.get_bottom(widths), border_style)
+            yield new_line
+
 
 if __name__ == "__main__":  # pragma: no cover
     from rich.console import Console
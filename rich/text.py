@@ -1,5 +1,8 @@
 import re
+from array import array
+from bisect import bisect_left, bisect_right
 from functools import partial, reduce
+from itertools import starmap
 from math import gcd
 from operator import itemgetter
 from typing import (
@@ -8,12 +11,17 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
+    MutableSequence,
     NamedTuple,
     Optional,
     Pattern,
     Tuple,
+    TypeVar,
     Union,
+    cast,
+    overload,
 )
 
 from ._loop import loop_last
@@ -34,6 +42,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 DEFAULT_JUSTIFY: "JustifyMethod" = "default"
 DEFAULT_OVERFLOW: "OverflowMethod" = "fold"
+COMPACT_STYLE_TABLE_SIZE = 1024
 
 
 _re_whitespace = re.compile(r"\s+$")
@@ -43,6 +52,8 @@ TextType = Union[str, "Text"]
 
 GetStyleCallable = Callable[[str], Optional[StyleType]]
 
+T = TypeVar("T")
+
 
 class Span(NamedTuple):
     """A marked up region in some text."""
@@ -115,6 +126,208 @@ class Span(NamedTuple):
             return self
 
 
+class CompactSpans(MutableSequence[Span]):
+    """A sequence of spans stored in arrays rather than as individual Span objects.
+
+    Offsets are kept in integer arrays and styles are stored once in a table which is
+    shared with any copies, so a large number of spans (such as those produced by syntax
+    highlighting) take a fraction of the memory of a list of Span instances. Span objects
+    are created on demand when the sequence is accessed.
+
+    Pass an instance as the ``spans`` argument of :class:`Text` to opt in.
+
+    The style table grows as new styles are added. Once it holds more than
+    ``COMPACT_STYLE_TABLE_SIZE`` styles (and more than twice the number of spans), the
+    instance moves to a new table containing only the styles it still uses.
+
+    Args:
+        spans (Iterable[Span], optional): Initial spans. Defaults to ().
+    """
+
+    __slots__ = ["_starts", "_ends", "_style_ids", "_styles", "_style_index"]
+
+    def __init__(self, spans: Iterable[Span] = ()) -> None:
+        self._starts = array("l")
+        self._ends = array("l")
+        self._style_ids = array("L")
+        self._styles: List[Union[str, Style]] = []
+        self._style_index: Dict[object, int] = {}
+        self.extend(spans)
+
+    def _new(self) -> "CompactSpans":
+        """Create an empty instance which shares the style table."""
+        new_spans = CompactSpans.__new__(CompactSpans)
+        new_spans._starts = array("l")
+        new_spans._ends = array("l")
+        new_spans._style_ids = array("L")
+        new_spans._styles = self._styles
+        new_spans._style_index = self._style_index
+        return new_spans
+
+    def _get_style_id(self, style: Union[str, Style]) -> int:
+        """Get the index of a style in the style table, adding it if required."""
+        # Style objects are keyed by identity, so styles which compare equal but differ
+        # in their link id are kept distinct. The table holds a reference to each style.
+        key = style if isinstance(style, str) else id(style)
+        style_id = self._style_index.get(key)
+        if style_id is None:
+            style_id = self._style_index[key] = len(self._styles)
+            self._styles.append(style)
+        return style_id
+
+    def _compact_styles(self) -> None:
+        """Move to a new style table containing only the styles in use, if the
+        current table has grown too large.
+
+        Must be called before any new style ids are created by a mutation.
+        """
+        old_styles = self._styles
+        if len(old_styles) < max(
+            COMPACT_STYLE_TABLE_SIZE, len(self._style_ids) * 2
+        ):
+            return
+        styles: List[Union[str, Style]] = []
+        style_index: Dict[object, int] = {}
+        new_ids: Dict[int, int] = {}
+        for old_id in self._style_ids:
+            if old_id not in new_ids:
+                style = old_styles[old_id]
+                key = style if isinstance(style, str) else id(style)
+                new_ids[old_id] = style_index[key] = len(styles)
+                styles.append(style)
+        self._style_ids = array("L", map(new_ids.__getitem__, self._style_ids))
+        self._styles = styles
+        self._style_index = style_index
+
+    def _pack(self, spans: Iterable[Span]) -> Tuple["array[int]", ...]:
+        """Pack spans in to arrays of starts, ends, and style ids."""
+        if len(self._styles) >= COMPACT_STYLE_TABLE_SIZE:
+            self._compact_styles()
+        starts = array("l")
+        ends = array("l")
+        style_ids = array("L")
+        get_style_id = self._get_style_id
+        for start, end, style in spans:
+            starts.append(start)
+            ends.append(end)
+            style_ids.append(get_style_id(style))
+        return starts, ends, style_ids
+
+    def blank(self) -> "CompactSpans":
+        """Get a new empty instance which shares the style table with this one.
+
+        Returns:
+            CompactSpans: Empty spans.
+        """
+        return self._new()
+
+    def copy(self) -> "CompactSpans":
+        """Get a copy of the spans.
+
+        Returns:
+            CompactSpans: New spans.
+        """
+        new_spans = self._new()
+        new_spans._starts = self._starts[:]
+        new_spans._ends = self._ends[:]
+        new_spans._style_ids = self._style_ids[:]
+        return new_spans
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Span]:
+        return starmap(
+            Span,
+            zip(
+                self._starts,
+                self._ends,
+                map(self._styles.__getitem__, self._style_ids),
+            ),
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Span: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CompactSpans": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Span, "CompactSpans"]:
+        if isinstance(index, slice):
+            new_spans = self._new()
+            new_spans._starts = self._starts[index]
+            new_spans._ends = self._ends[index]
+            new_spans._style_ids = self._style_ids[index]
+            return new_spans
+        return Span(
+            self._starts[index],
+            self._ends[index],
+            self._styles[self._style_ids[index]],
+        )
+
+    @overload
+    def __setitem__(self, index: int, value: Span) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Span]) -> None: ...
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[Span, Iterable[Span]]
+    ) -> None:
+        if isinstance(index, slice):
+            starts, ends, style_ids = self._pack(cast(Iterable[Span], value))
+            self._starts[index] = starts
+            self._ends[index] = ends
+            self._style_ids[index] = style_ids
+        else:
+            if len(self._styles) >= COMPACT_STYLE_TABLE_SIZE:
+                self._compact_styles()
+            start, end, style = cast(Span, value)
+            self._starts[index] = start
+            self._ends[index] = end
+            self._style_ids[index] = self._get_style_id(style)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._starts[index]
+        del self._ends[index]
+        del self._style_ids[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CompactSpans, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def insert(self, index: int, value: Span) -> None:
+        if len(self._styles) >= COMPACT_STYLE_TABLE_SIZE:
+            self._compact_styles()
+        start, end, style = value
+        self._starts.insert(index, start)
+        self._ends.insert(index, end)
+        self._style_ids.insert(index, self._get_style_id(style))
+
+    def append(self, value: Span) -> None:
+        if len(self._styles) >= COMPACT_STYLE_TABLE_SIZE:
+            self._compact_styles()
+        start, end, style = value
+        self._starts.append(start)
+        self._ends.append(end)
+        self._style_ids.append(self._get_style_id(style))
+
+    def extend(self, values: Iterable[Span]) -> None:
+        starts, ends, style_ids = self._pack(values)
+        self._starts.extend(starts)
+        self._ends.extend(ends)
+        self._style_ids.extend(style_ids)
+
+    def clear(self) -> None:
+        del self[:]
+
+
 class Text(JupyterMixin):
     """Text with color / style.
 
@@ -126,7 +339,8 @@ class Text(JupyterMixin):
         no_wrap (bool, optional): Disable text wrapping, or None for default. Defaults to None.
         end (str, optional): Character to end text with. Defaults to "\\\\n".
         tab_size (int): Number of spaces per tab, or ``None`` to use ``console.tab_size``. Defaults to None.
-        spans (List[Span], optional). A list of predefined style spans. Defaults to None.
+        spans (List[Span], optional). A list of predefined style spans, or a :class:`CompactSpans`
+            instance to store spans compactly. Defaults to None.
     """
 
     __slots__ = [
@@ -151,7 +365,7 @@ class Text(JupyterMixin):
         no_wrap: Optional[bool] = None,
         end: str = "\n",
         tab_size: Optional[int] = None,
-        spans: Optional[List[Span]] = None,
+        spans: Optional[Union[List[Span], CompactSpans]] = None,
     ) -> None:
         sanitized_text = strip_control_codes(text)
         self._text = [sanitized_text]
@@ -161,7 +375,9 @@ class Text(JupyterMixin):
         self.no_wrap = no_wrap
         self.end = end
         self.tab_size = tab_size
-        self._spans: List[Span] = spans or []
+        self._spans: Union[List[Span], CompactSpans] = (
+            spans if isinstance(spans, CompactSpans) else (spans or [])
+        )
         self._length: int = len(sanitized_text)
 
     def __len__(self) -> int:
@@ -420,12 +636,12 @@ class Text(JupyterMixin):
                 self._trim_spans()
 
     @property
-    def spans(self) -> List[Span]:
+    def spans(self) -> Union[List[Span], CompactSpans]:
         """Get a reference to the internal list of spans."""
         return self._spans
 
     @spans.setter
-    def spans(self, spans: List[Span]) -> None:
+    def spans(self, spans: Union[List[Span], CompactSpans]) -> None:
         """Set spans."""
         self._spans = spans[:]
 
@@ -440,6 +656,8 @@ class Text(JupyterMixin):
             end=self.end,
             tab_size=self.tab_size,
         )
+        if isinstance(self._spans, CompactSpans):
+            copy_self._spans = self._spans.blank()
         return copy_self
 
     def copy(self) -> "Text":
@@ -453,7 +671,10 @@ class Text(JupyterMixin):
             end=self.end,
             tab_size=self.tab_size,
         )
-        copy_self._spans[:] = self._spans
+        if isinstance(self._spans, CompactSpans):
+            copy_self._spans = self._spans.copy()
+        else:
+            copy_self._spans[:] = self._spans
         return copy_self
 
     def stylize(
@@ -742,49 +963,94 @@ class Text(JupyterMixin):
             if end:
                 yield _Segment(end)
             return
-        get_style = partial(console.get_style, default=Style.null())
+        get_console_style = partial(console.get_style, default=Style.null())
+        style_table = console.style_table
+        get_style_id = style_table.get_id
+
+        def get_style(style: Union[str, Style]) -> int:
+            """Get the style table id of a span style."""
+            return get_style_id(get_console_style(style))
+
+        if isinstance(self._spans, CompactSpans):
+            # Resolve each style in the table once, rather than once per span
+            compact_spans = self._spans
+            table_styles = compact_spans._styles
+            resolved_styles: Dict[int, int] = {}
+
+            def resolve_style(table_id: int) -> int:
+                style_id = resolved_styles.get(table_id)
+                if style_id is None:
+                    style_id = resolved_styles[table_id] = get_style(
+                        table_styles[table_id]
+                    )
+                return style_id
 
-        enumerated_spans = list(enumerate(self._spans, 1))
-        style_map = {
-            index: get_style(span.style) for index, span in enumerated_spans
-        }
+            style_map = dict(
+                enumerate(map(resolve_style, compact_spans._style_ids), 1)
+            )
+            span_starts: Iterable[int] = compact_spans._starts
+            span_ends: Iterable[int] = compact_spans._ends
+        else:
+            style_map = {
+                index: get_style(span.style)
+                for index, span in enumerate(self._spans, 1)
+            }
+            span_starts = [span.start for span in self._spans]
+            span_ends = [span.end for span in self._spans]
         style_map[0] = get_style(self.style)
 
         spans = [
             (0, False, 0),
-            *((span.start, False, index) for index, span in enumerated_spans),
-            *((span.end, True, index) for index, span in enumerated_spans),
+            *(
+                (start, False, index)
+                for index, start in enumerate(span_starts, 1)
+            ),
+            *((end, True, index) for index, end in enumerate(span_ends, 1)),
             (len(text), True, 0),
         ]
         spans.sort(key=itemgetter(0, 1))
 
-        stack: List[int] = []
-        stack_append = stack.append
-        stack_pop = stack.remove
-
-        style_cache: Dict[Tuple[Style, ...], Style] = {}
-        style_cache_get = style_cache.get
-        combine = Style.combine
-
-        def get_current_style() -> Style:
-            """Construct current style from stack."""
-            styles = tuple(style_map[_style_id] for _style_id in sorted(stack))
-            cached_style = style_cache_get(styles)
-            if cached_style is not None:
-                return cached_style
-            current_style = combine(styles)
-            style_cache[styles] = current_style
-            return current_style
+        # Sweep through the span boundaries, keeping the active span ids sorted, along
+        # with the combined style of each prefix of the active spans. Opening or closing
+        # a span only invalidates the combined styles from its position onwards, which
+        # are recalculated when the next segment is emitted. Styles are combined by id,
+        # through the console's style table.
+        active: List[int] = []
+        combined: List[int] = []
+        valid = 0
+        combine = style_table.combine
+        get_table_style = style_table.get_style
 
         for (offset, leaving, style_id), (next_offset, _, _) in zip(
             spans, spans[1:]
         ):
             if leaving:
-                stack_pop(style_id)
+                position = bisect_left(active, style_id)
+                del active[position]
             else:
-                stack_append(style_id)
+                position = bisect_right(active, style_id)
+                active.insert(position, style_id)
+            if position < valid:
+                valid = position
             if next_offset > offset:
-                yield _Segment(text[offset:next_offset], get_current_style())
+                active_count = len(active)
+                if valid < active_count:
+                    del combined[valid:]
+                    if valid:
+                        current_id = combined[-1]
+                    else:
+                        current_id = style_map[active[0]]
+                        combined.append(current_id)
+                        valid = 1
+                    for active_id in active[valid:]:
+                        current_id = combine(current_id, style_map[active_id])
+                        combined.append(current_id)
+                else:
+                    del combined[active_count:]
+                valid = active_count
+                yield _Segment(
+                    text[offset:next_offset], get_table_style(combined[-1])
+                )
         if end:
             yield _Segment(end)
 
@@ -1162,47 +1428,70 @@ class Text(JupyterMixin):
         if not self._spans:
             return new_lines
 
-        _line_appends = [line._spans.append for line in new_lines._lines]
+        spans = self._spans
         line_count = len(line_ranges)
-        _Span = Span
 
-        for span_start, span_end, style in self._spans:
-            lower_bound = 0
-            upper_bound = line_count
-            start_line_no = (lower_bound + upper_bound) // 2
-
-            while True:
-                line_start, line_end = line_ranges[start_line_no]
-                if span_start < line_start:
-                    upper_bound = start_line_no - 1
-                elif span_start > line_end:
-                    lower_bound = start_line_no + 1
-                else:
-                    break
-                start_line_no = (lower_bound + upper_bound) // 2
-
-            if span_end < line_end:
-                end_line_no = start_line_no
-            else:
-                end_line_no = lower_bound = start_line_no
+        def split_spans(
+            spans: Iterable[Tuple[int, int, T]],
+        ) -> Iterable[Tuple[int, int, int, T]]:
+            """Split spans at line boundaries, generating the line number, new
+            start and end, and payload of each piece."""
+            for span_start, span_end, payload in spans:
+                lower_bound = 0
                 upper_bound = line_count
+                start_line_no = (lower_bound + upper_bound) // 2
 
                 while True:
-                    line_start, line_end = line_ranges[end_line_no]
-                    if span_end < line_start:
-                        upper_bound = end_line_no - 1
-                    elif span_end > line_end:
-                        lower_bound = end_line_no + 1
+                    line_start, line_end = line_ranges[start_line_no]
+                    if span_start < line_start:
+                        upper_bound = start_line_no - 1
+                    elif span_start > line_end:
+                        lower_bound = start_line_no + 1
                     else:
                         break
-                    end_line_no = (lower_bound + upper_bound) // 2
-
-            for line_no in range(start_line_no, end_line_no + 1):
-                line_start, line_end = line_ranges[line_no]
-                new_start = max(0, span_start - line_start)
-                new_end = min(span_end - line_start, line_end - line_start)
-                if new_end > new_start:
-                    _line_appends[line_no](_Span(new_start, new_end, style))
+                    start_line_no = (lower_bound + upper_bound) // 2
+
+                if span_end < line_end:
+                    end_line_no = start_line_no
+                else:
+                    end_line_no = lower_bound = start_line_no
+                    upper_bound = line_count
+
+                    while True:
+                        line_start, line_end = line_ranges[end_line_no]
+                        if span_end < line_start:
+                            upper_bound = end_line_no - 1
+                        elif span_end > line_end:
+                            lower_bound = end_line_no + 1
+                        else:
+                            break
+                        end_line_no = (lower_bound + upper_bound) // 2
+
+                for line_no in range(start_line_no, end_line_no + 1):
+                    line_start, line_end = line_ranges[line_no]
+                    new_start = max(0, span_start - line_start)
+                    new_end = min(span_end - line_start, line_end - line_start)
+                    if new_end > new_start:
+                        yield line_no, new_start, new_end, payload
+
+        if isinstance(spans, CompactSpans):
+            # Copy offsets and style ids directly, sharing the style table
+            line_spans = [spans.blank() for _ in line_ranges]
+            for line, compact_spans in zip(new_lines._lines, line_spans):
+                line._spans = compact_spans
+            for line_no, new_start, new_end, style_id in split_spans(
+                zip(spans._starts, spans._ends, spans._style_ids)
+            ):
+                compact_spans = line_spans[line_no]
+                compact_spans._starts.append(new_start)
+                compact_spans._ends.append(new_end)
+                compact_spans._style_ids.append(style_id)
+            return new_lines
+
+        _line_appends = [line._spans.append for line in new_lines._lines]
+        _Span = Span
+        for line_no, new_start, new_end, style in split_spans(spans):
+            _line_appends[line_no](_Span(new_start, new_end, style))
 
         return new_lines
 
@@ -0,0 +1,65 @@
+from threading import Condition
+from typing import List, Tuple
+
+from rich._refresh import RefreshScheduler
+
+
+class FakeTime:
+    """A clock, and a replacement for the scheduler's wake event, which run frames
+    only when stepped by the test."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.intervals: List[float] = []
+        self._condition = Condition()
+        self._flag = False
+        self._frames = 0
+        self._waiting = False
+
+    def clock(self) -> float:
+        return self.now
+
+    def set(self) -> None:
+        with self._condition:
+            self._flag = True
+            self._condition.notify_all()
+
+    def clear(self) -> None:
+        with self._condition:
+            self._flag = False
+
+    def wait(self, timeout: float) -> bool:
+        with self._condition:
+            if not self._flag:
+                self._waiting = True
+                self._condition.notify_all()
+                self._condition.wait_for(lambda: self._flag or self._frames)
+                self._waiting = False
+            if self._flag:
+                return True
+            self._frames -= 1
+            self.intervals.append(timeout)
+            self.now += timeout
+            return False
+
+    def start_frame(self) -> None:
+        """Run a frame, without waiting for the scheduler to finish it."""
+        with self._condition:
+            self._frames += 1
+            self._condition.notify_all()
+
+    def step(self, frames: int = 1) -> None:
+        """Run frames, and wait for the scheduler to finish them."""
+        for _ in range(frames):
+            self.start_frame()
+            with self._condition:
+                assert self._condition.wait_for(
+                    lambda: self._waiting and not self._frames, timeout=5
+                )
+
+
+def make_scheduler() -> Tuple[RefreshScheduler, FakeTime]:
+    fake_time = FakeTime()
+    scheduler = RefreshScheduler(clock=fake_time.clock)
+    scheduler._wake = fake_time  # type: ignore[assignment]
+    return scheduler, fake_time
@@ -1,7 +1,7 @@
 import string
 
 from rich import cells
-from rich.cells import _is_single_cell_widths, chop_cells
+from rich.cells import _is_single_cell_text, _is_single_cell_widths, chop_cells
 
 
 def test_cell_len_long_string():
@@ -87,3 +87,41 @@ def test_is_single_cell_widths() -> None:
 
     for character in "わさび":
         assert not _is_single_cell_widths(character)
+
+
+def test_is_single_cell_text() -> None:
+    assert _is_single_cell_text("")
+    assert _is_single_cell_text("Hello, World!")
+    assert _is_single_cell_text("┌─┬┐ café")
+    assert not _is_single_cell_text("foo\tbar")
+    assert not _is_single_cell_text("\x1b")
+    assert not _is_single_cell_text("わさび")
+
+
+def test_cell_len_bmp_table() -> None:
+    for codepoint in range(0x10000):
+        character = chr(codepoint)
+        assert cells._BMP_CELL_WIDTHS[codepoint] == (
+            cells.get_character_cell_size(character)
+        )
+    assert cells.cell_len("foo\x1bbar") == 6
+    assert cells.cell_len("わさび") == 6
+    assert cells.cell_len("わさび💩") == 8
+    assert cells.cell_len("わさび" * 200) == 1200
+
+
+def test_cell_lens() -> None:
+    assert cells.cell_lens([]) == []
+    assert cells.cell_lens(["foo", "", "bar baz"]) == [3, 0, 7]
+    assert cells.cell_lens(["foo", "わさび", "💩", "\x1b"]) == [3, 6, 2, 0]
+
+
+def test_get_character_cell_size() -> None:
+    assert cells.get_character_cell_size("\0") == 0
+    assert cells.get_character_cell_size("\x1b") == 0
+    assert cells.get_character_cell_size("a") == 1
+    assert cells.get_character_cell_size("わ") == 2
+    assert cells.get_character_cell_size("💩") == 2
+    assert cells.get_character_cell_size("\U0001f1e6") == 1
+    assert cells.get_character_cell_size("\U000e0001") == 0
+    assert cells.get_character_cell_size("\U0010ffff") == 1
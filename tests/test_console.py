@@ -729,6 +729,45 @@ def test_no_color():
     assert result == expected
 
 
+def test_style_render_cache():
+    console = Console(
+        file=io.StringIO(), color_system="truecolor", force_terminal=True
+    )
+    console.print("[bold]foo[/] [bold]bar[/] [link=https://example.org]baz")
+    result = console.file.getvalue()
+    assert result.startswith("\x1b[1mfoo\x1b[0m \x1b[1mbar\x1b[0m \x1b]8;id=")
+    assert list(console._style_render_cache) == [Style(bold=True)]
+
+
+def test_print_stream():
+    writes = []
+
+    class RecordWrites(io.StringIO):
+        def write(self, text: str) -> int:
+            writes.append(text)
+            return super().write(text)
+
+    console = Console(
+        file=RecordWrites(), width=20, color_system=None, stream_lines=2
+    )
+    console.print("foo\nbar\nbaz", stream=True)
+    assert writes == ["foo\nbar\n", "baz\n"]
+
+    writes.clear()
+    console.print("foo\nbar\nbaz", stream=True, crop=False)
+    assert writes == ["foo\nbar\nbaz", "\n"]
+
+    writes.clear()
+    console.print("[red]foo", stream=True, style="bold")
+    assert writes == ["foo\n"]
+
+    writes.clear()
+    with console:
+        console.print("foo\nbar\nbaz", stream=True)
+        assert writes == []
+    assert writes == ["foo\nbar\nbaz\n"]
+
+
 def test_quiet():
     console = Console(file=io.StringIO(), quiet=True)
     console.print("Hello, World!")
@@ -1081,3 +1120,12 @@ def test_capture_and_record() -> None:
     recorded_content = console.export_text()
     print(repr(recorded_content))
     assert recorded_content == "Print 0\n"
+
+
+def test_style_table(monkeypatch):
+    console = Console()
+    style_table = console.style_table
+    style_table.get_id(Style(bold=True))
+    assert console.style_table is style_table
+    monkeypatch.setattr("rich.console.STYLE_TABLE_SIZE", 0)
+    assert console.style_table is not style_table
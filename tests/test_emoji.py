@@ -19,6 +19,12 @@ def test_replace():
     assert Emoji.replace("my code is :pile_of_poo:") == "my code is 💩"
 
 
+def test_replace_no_codes():
+    text = "no emoji codes here"
+    assert Emoji.replace(text) is text
+    assert Emoji.replace("time is 12:00") == "time is 12:00"
+
+
 def test_render():
     render_result = render(Emoji("pile_of_poo"))
     assert render_result == "💩"
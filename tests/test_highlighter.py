@@ -1,11 +1,15 @@
 """Tests for the highlighter classes."""
 
 import json
+import re
 from typing import List
 
 import pytest
 
 from rich.highlighter import (
+    CombinedRegexHighlighter,
+    CombinedReprHighlighter,
+    HighlightCache,
     ISO8601Highlighter,
     JSONHighlighter,
     NullHighlighter,
@@ -468,3 +472,89 @@ def test_highlight_iso8601_regex(test: str, spans: List[Span]):
     highlighter.highlight(text)
     print(text.spans)
     assert text.spans == spans
+
+
+def _overlap(spans: List[Span]) -> bool:
+    spans = sorted(spans)
+    return any(
+        span.end > next_span.start for span, next_span in zip(spans, spans[1:])
+    )
+
+
+@pytest.mark.parametrize(
+    "test, spans",
+    [(test, spans) for test, spans in highlight_tests if not _overlap(spans)],
+)
+def test_highlight_combined_repr(test: str, spans: List[Span]):
+    """The combined highlighter finds the same spans, where they don't overlap."""
+    text = CombinedReprHighlighter()(test)
+    assert sorted(text.spans) == sorted(spans)
+
+
+def test_highlight_combined_repr_overlapping():
+    text = CombinedReprHighlighter()('<foo: 23> foo="bar"')
+    assert text.spans == [
+        Span(0, 1, "repr.tag_start"),
+        Span(1, 5, "repr.tag_name"),
+        Span(5, 8, "repr.tag_contents"),
+        Span(8, 9, "repr.tag_end"),
+        Span(10, 13, "repr.attrib_name"),
+        Span(14, 19, "repr.attrib_value"),
+    ]
+
+
+class CombinedISO8601Highlighter(CombinedRegexHighlighter, ISO8601Highlighter):
+    pass
+
+
+@pytest.mark.parametrize("test, spans", iso8601_highlight_tests)
+def test_highlight_combined_iso8601(test: str, spans: List[Span]):
+    """Group names are repeated, and used in conditionals, in ISO8601Highlighter."""
+    text = CombinedISO8601Highlighter()(test)
+    assert text.spans == spans
+
+
+def test_highlight_combined_backreferences():
+    class BackreferenceHighlighter(CombinedRegexHighlighter):
+        highlights = [
+            r"(?P<tag><(\w+)>)\w*</\2>",
+            r"(?P<quote>[\"'])(?P<quoted>\w+)\1",
+            r"(?P<number>\d+)[\1]",
+        ]
+
+    text = BackreferenceHighlighter()("<b>x</b> 'foo' \"bar' 12\x01")
+    assert text.spans == [
+        Span(0, 3, "tag"),
+        Span(9, 10, "quote"),
+        Span(10, 13, "quoted"),
+        Span(21, 23, "number"),
+    ]
+
+
+def test_highlight_combined_backreference_limit():
+    class ManyGroupsHighlighter(CombinedRegexHighlighter):
+        highlights = ["()" * 100, r"(a)\1"]
+
+    with pytest.raises(re.error, match="use a named group"):
+        ManyGroupsHighlighter()("aa")
+
+
+def test_highlight_cache():
+    highlighter = ReprHighlighter()
+    highlighter.cache = HighlightCache(maxsize=2)
+    expected = ReprHighlighter()("foo=1 [2]").spans
+    assert highlighter("foo=1 [2]").spans == expected
+    assert highlighter("foo=1 [2]").spans == expected
+    text = Text("foo=1 [2]", style="bold")
+    text.stylize("italic", 0, 3)
+    assert highlighter(text).spans == [Span(0, 3, "italic"), *expected]
+    assert (highlighter.cache.hits, highlighter.cache.misses) == (2, 1)
+
+    highlighter("bar")
+    highlighter("baz")
+    assert len(highlighter.cache) == 2
+    # The least recently used string was discarded
+    highlighter("foo=1 [2]")
+    assert highlighter.cache.misses == 4
+    # Other instances don't share the cache, unless it is set on the class
+    assert ReprHighlighter.cache is None
@@ -175,3 +175,38 @@ def test_live_screen() -> None:
     print(repr(result))
     expected = "\x1b[?1049h\x1b[H\x1b[?25l\x1b[Hfoo                 \n                    \n                    \n                    \n                    \x1b[Hfoo                 \n                    \n                    \n                    \n                    \x1b[?25h\x1b[?1049l"
     assert result == expected
+
+
+def test_differential_display() -> None:
+    console = create_capture_console()
+    console.begin_capture()
+    with Live(console=console, auto_refresh=False, differential=True) as live:
+        live.update("foo\nbar", refresh=True)
+        live.update("foo\nbaz", refresh=True)
+        live.update("foo\nbaz", refresh=True)
+        live.update("foo\nbaz\nqux", refresh=True)
+        console.print("hello")
+        live.update("egg", refresh=True)
+    output = console.end_capture()
+    print(repr(output))
+    assert (
+        output
+        == "\x1b[?25lfoo\nbar\x1b[1Gbaz\nqux\r\x1b[2K\x1b[1A\x1b[2K\x1b[1A\x1b[2Khello\nfoo\nbaz\nqux\x1b[2A\x1b[1Gegg\x1b[1B\x1b[2K\x1b[1B\x1b[2K\x1b[2A\n\x1b[?25h"
+    )
+
+
+def test_differential_display_screen() -> None:
+    console = create_capture_console(width=20, height=5)
+    console.begin_capture()
+    with Live(
+        Text("foo"),
+        screen=True,
+        console=console,
+        auto_refresh=False,
+        differential=True,
+    ) as live:
+        live.update(Text("bar"), refresh=True)
+    result = console.end_capture()
+    print(repr(result))
+    expected = "\x1b[?1049h\x1b[H\x1b[?25l\x1b[Hfoo                 \n                    \n                    \n                    \n                    \x1b[4A\x1b[1Gbar\x1b[4B\x1b[?25h\x1b[?1049l"
+    assert result == expected
@@ -45,3 +45,26 @@ def test_rich_console(live_render):
     live_render.style = "red"
     rich_console = live_render.__rich_console__(Console(), options)
     assert [Segment("my string", Style.parse("red"))] == list(rich_console)
+
+
+def test_differential_render():
+    console = Console(width=20, height=10, color_system=None)
+    live_render = LiveRender("foo\nbar", differential=True)
+    assert not live_render.has_frame
+    assert list(console.render(live_render)) == [
+        Segment("foo"),
+        Segment("\n"),
+        Segment("bar"),
+    ]
+    assert live_render.has_frame
+
+    live_render.set_renderable("foo\nbar")
+    assert list(console.render(live_render)) == []
+
+    live_render.set_renderable("fox")
+    output = "".join(segment.text for segment in console.render(live_render))
+    assert output == "\x1b[1A\x1b[1Gfox\x1b[1B\x1b[2K\x1b[1A"
+    assert live_render._shape == (3, 1)
+
+    live_render.reset_frame()
+    assert not live_render.has_frame
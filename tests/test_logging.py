@@ -1,6 +1,9 @@
 import io
 import os
 import logging
+import threading
+import weakref
+from time import sleep
 from typing import Optional
 
 import pytest
@@ -162,6 +165,292 @@ def test_markup_and_highlight():
     assert log_message in render_plain
 
 
+def test_asynchronous() -> None:
+    def make_handler(asynchronous: bool) -> RichHandler:
+        console = Console(
+            file=io.StringIO(), width=80, color_system=None, _environ={}
+        )
+        return RichHandler(
+            console=console,
+            enable_link_path=False,
+            asynchronous=asynchronous,
+        )
+
+    async_handler = make_handler(True)
+    sync_handler = make_handler(False)
+    threads = set()
+    write = async_handler.console.file.write
+
+    def record_thread(text: str) -> int:
+        threads.add(threading.current_thread())
+        return write(text)
+
+    async_handler.console.file.write = record_thread
+    test_log = logging.getLogger("rich.test_asynchronous")
+    test_log.propagate = False
+    test_log.addHandler(async_handler)
+    test_log.addHandler(sync_handler)
+    try:
+        for number in range(100):
+            test_log.warning("message %d", number)
+        async_handler.flush()
+    finally:
+        test_log.removeHandler(async_handler)
+        test_log.removeHandler(sync_handler)
+        async_handler.close()
+
+    render = async_handler.console.file.getvalue()
+    assert render.count("message") == 100
+    assert render == sync_handler.console.file.getvalue()
+    assert threading.current_thread() not in threads
+    assert async_handler._render_thread is None
+
+
+def test_asynchronous_queue_full() -> None:
+    console = Console(file=io.StringIO(), width=80, _environ={})
+    handler = RichHandler(
+        console=console, asynchronous=True, queue_size=1, queue_full="drop"
+    )
+    rendering = threading.Event()
+    release = threading.Event()
+    emit = handler._emit
+
+    def slow_emit(record: logging.LogRecord) -> None:
+        rendering.set()
+        release.wait()
+        emit(record)
+
+    handler._emit = slow_emit
+    test_log = logging.getLogger("rich.test_asynchronous_queue_full")
+    test_log.propagate = False
+    test_log.addHandler(handler)
+    try:
+        test_log.warning("rendering")
+        assert rendering.wait(5)
+        # One record fits in the queue while the first is rendered
+        for number in range(4):
+            test_log.warning("queued %d", number)
+        release.set()
+    finally:
+        test_log.removeHandler(handler)
+        handler.close()
+    assert handler.dropped == 3
+    render = console.file.getvalue()
+    assert "rendering" in render
+    assert "queued 0" in render
+    assert "queued 1" not in render
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_asynchronous_fork() -> None:
+    console = Console(file=io.StringIO(), width=80, _environ={})
+    handler = RichHandler(console=console, asynchronous=True, queue_size=5)
+    test_log = logging.getLogger("rich.test_asynchronous_fork")
+    test_log.propagate = False
+    test_log.addHandler(handler)
+    try:
+        test_log.warning("parent")
+        handler.flush()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if not pid:
+            # Child process
+            try:
+                console.file = io.StringIO()
+                for number in range(10):
+                    test_log.warning("child %d", number)
+                handler.flush()
+                os.write(write_fd, console.file.getvalue().encode("utf-8"))
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        for _ in range(100):
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                break
+            sleep(0.1)
+        else:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            pytest.fail("child process did not exit")
+        with os.fdopen(read_fd, "rb") as child_output:
+            render = child_output.read().decode("utf-8")
+    finally:
+        test_log.removeHandler(handler)
+        handler.close()
+    assert render.count("child") == 10
+    assert "parent" not in render
+    assert "parent" in console.file.getvalue()
+
+
+def test_asynchronous_error() -> None:
+    console = Console(file=io.StringIO(), width=80, _environ={})
+    handler = RichHandler(console=console, asynchronous=True)
+    emit = handler._emit
+    release = threading.Event()
+    errors = []
+
+    def failing_emit(record: logging.LogRecord) -> None:
+        if record.getMessage() == "hold":
+            release.wait(5)
+        elif record.getMessage() == "fail":
+            raise ValueError("failed")
+        emit(record)
+
+    handler._emit = failing_emit
+    handler.handleError = errors.append
+    # Hold the render thread, so that the next records are rendered in one batch
+    handler.emit(logging.makeLogRecord({"msg": "hold"}))
+    for message in ("before", "fail", "after"):
+        handler.emit(logging.makeLogRecord({"msg": message}))
+    release.set()
+    handler.close()
+    assert [record.getMessage() for record in errors] == ["fail"]
+    render = console.file.getvalue()
+    assert "before" in render
+    assert "after" in render
+
+
+def test_batch() -> None:
+    def make_handler(batch_size: int) -> RichHandler:
+        console = Console(
+            file=io.StringIO(), width=80, color_system=None, _environ={}
+        )
+        handler = RichHandler(
+            console=console, enable_link_path=False, batch_size=batch_size
+        )
+        handler.setFormatter(logging.Formatter(datefmt="[DATE]"))
+        return handler
+
+    batch_handler = make_handler(3)
+    handler = make_handler(1)
+    writes = []
+    write = batch_handler.console.file.write
+
+    def count_write(text: str) -> int:
+        writes.append(text)
+        return write(text)
+
+    batch_handler.console.file.write = count_write
+    test_log = logging.getLogger("rich.test_batch")
+    test_log.propagate = False
+    test_log.addHandler(batch_handler)
+    test_log.addHandler(handler)
+    try:
+        for number in range(7):
+            test_log.warning("message %d", number)
+        assert len(writes) == 2
+        batch_handler.flush()
+        assert len(writes) == 3
+    finally:
+        test_log.removeHandler(batch_handler)
+        test_log.removeHandler(handler)
+        batch_handler.close()
+
+    render = batch_handler.console.file.getvalue()
+    # Repeated times are omitted across batches
+    assert render.count("[DATE]") == 1
+    assert render == handler.console.file.getvalue()
+
+
+def test_asynchronous_batch_shutdown() -> None:
+    console = Console(file=io.StringIO(), width=80, _environ={})
+    handler = RichHandler(console=console, asynchronous=True, batch_size=50)
+    test_log = logging.getLogger("rich.test_asynchronous_batch_shutdown")
+    test_log.propagate = False
+    test_log.addHandler(handler)
+    try:
+        for number in range(200):
+            test_log.warning("message %d", number)
+        # Shutdown flushes while holding the handler lock
+        shutdown = threading.Thread(
+            target=logging.shutdown,
+            args=([weakref.ref(handler)],),
+            daemon=True,
+        )
+        shutdown.start()
+        shutdown.join(10)
+        assert not shutdown.is_alive()
+    finally:
+        test_log.removeHandler(handler)
+    assert console.file.getvalue().count("message") == 200
+
+
+def test_batch_interval() -> None:
+    console = Console(file=io.StringIO(), width=80, _environ={})
+    handler = RichHandler(console=console, batch_size=100, batch_interval=0.05)
+    test_log = logging.getLogger("rich.test_batch_interval")
+    test_log.propagate = False
+    test_log.addHandler(handler)
+    try:
+        test_log.warning("foo")
+        assert console.file.getvalue() == ""
+        sleep(0.3)
+        assert "foo" in console.file.getvalue()
+        assert handler._batch_refresh_id is None
+    finally:
+        test_log.removeHandler(handler)
+        handler.close()
+
+
+def test_fast_plain_text() -> None:
+    def make_handler(fast_plain_text: bool) -> RichHandler:
+        console = Console(file=io.StringIO(), width=60, _environ={})
+        handler = RichHandler(console=console, fast_plain_text=fast_plain_text)
+        handler.setFormatter(logging.Formatter(datefmt="[DATE]"))
+        return handler
+
+    fast_handler = make_handler(True)
+    handler = make_handler(False)
+    rendered = []
+    render = fast_handler.render
+
+    def record_render(**kwargs):
+        rendered.append(kwargs["record"].getMessage())
+        return render(**kwargs)
+
+    fast_handler.render = record_render
+    test_log = logging.getLogger("rich.test_fast_plain_text")
+    test_log.propagate = False
+    test_log.addHandler(fast_handler)
+    test_log.addHandler(handler)
+    try:
+        test_log.warning("GET /index.html 200")
+        test_log.warning("日本語 3.14")
+        test_log.error("wrapped " * 10)
+        test_log.error("[bold]markup[/bold]", extra={"markup": True})
+        test_log.warning("tab\tand\nnew line")
+    finally:
+        test_log.removeHandler(fast_handler)
+        test_log.removeHandler(handler)
+
+    assert fast_handler.console.file.getvalue() == (
+        handler.console.file.getvalue()
+    )
+    # Only messages which don't fit on a line are rendered
+    assert rendered == [
+        "wrapped " * 10,
+        "[bold]markup[/bold]",
+        "tab\tand\nnew line",
+    ]
+
+
+def test_fast_plain_text_terminal() -> None:
+    console = Console(
+        file=io.StringIO(), force_terminal=True, width=60, _environ={}
+    )
+    handler = RichHandler(console=console, fast_plain_text=True)
+    test_log = logging.getLogger("rich.test_fast_plain_text_terminal")
+    test_log.propagate = False
+    test_log.addHandler(handler)
+    try:
+        test_log.warning("GET /index.html")
+    finally:
+        test_log.removeHandler(handler)
+    # Styles are written, so the record is rendered as usual
+    assert "\x1b[" in console.file.getvalue()
+
+
 if __name__ == "__main__":
     render = make_log()
     print(render)
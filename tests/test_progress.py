@@ -2,7 +2,10 @@
 
 import io
 import os
+import pickle
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from threading import Thread
 from types import SimpleNamespace
 
 import pytest
@@ -16,6 +19,7 @@ from rich.progress import (
     FileSizeColumn,
     MofNCompleteColumn,
     Progress,
+    RemoteTask,
     RenderableColumn,
     SpinnerColumn,
     Task,
@@ -26,12 +30,14 @@ from rich.progress import (
     TimeRemainingColumn,
     TotalFileSizeColumn,
     TransferSpeedColumn,
-    _TrackThread,
+    _TrackUpdater,
     track,
 )
 from rich.progress_bar import ProgressBar
 from rich.text import Text
 
+from .fake_time import make_scheduler
+
 
 class MockClock:
     """A clock that is manually advanced."""
@@ -454,18 +460,96 @@ def test_progress_create() -> None:
     assert progress.task_ids == []
 
 
-def test_track_thread() -> None:
+def test_track_updater() -> None:
+    progress = Progress(console=Console(file=io.StringIO()))
+    scheduler, fake_time = make_scheduler()
+    progress.console._refresh_scheduler = scheduler
+    task_id = progress.add_task("foo")
+    track_updater = _TrackUpdater(progress, task_id, 0.1)
+    assert track_updater.completed == 0
+
+    with track_updater:
+        track_updater.completed = 1
+        fake_time.step()
+        assert progress.tasks[task_id].completed == 1
+        track_updater.completed += 1
+    assert progress.tasks[task_id].completed == 2
+
+
+def test_progress_counter() -> None:
+    progress = Progress()
+    task_id = progress.add_task("foo")
+    counter = progress.counter(task_id)
+
+    def count() -> None:
+        for _ in range(1000):
+            counter.advance()
+
+    threads = [Thread(target=count) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # Counts are added to the task when the progress is refreshed
+    assert progress.tasks[0].completed == 0
+    progress.refresh()
+    assert progress.tasks[0].completed == 4000
+    counter.advance(10)
+    progress.remove_task(task_id)
+    progress.refresh()
+    assert progress._counters == []
+
+
+def test_progress_counter_auto_refresh() -> None:
+    console = Console(file=io.StringIO(), force_terminal=True)
+    scheduler, fake_time = make_scheduler()
+    console._refresh_scheduler = scheduler
+    with Progress(console=console, refresh_per_second=20) as progress:
+        task_id = progress.add_task("foo")
+        counter = progress.counter(task_id)
+        counter.advance(5)
+        assert progress.tasks[0].completed == 0
+        fake_time.step()
+        assert progress.tasks[0].completed == 5
+        counter.advance(2)
+    assert progress.tasks[0].completed == 7
+
+
+def _advance_remote(handle: RemoteTask, steps: int) -> int:
+    with handle:
+        for _ in range(steps):
+            handle.advance()
+    handle.update(description="done")
+    return steps
+
+
+def test_progress_remote_handle() -> None:
+    progress = Progress()
+    task_id = progress.add_task("foo")
+    handle = pickle.loads(pickle.dumps(progress.get_remote_handle(task_id)))
+    assert handle.task_id == task_id
+    handle.advance(3)
+    handle.update(total=10)
+    handle.advance(2)
+    handle.flush()
+    progress.stop()
+    assert progress.tasks[0].completed == 5
+    assert progress.tasks[0].total == 10
+    # Updates after the progress has stopped are dropped
+    handle.advance()
+    handle.flush()
+    assert progress.tasks[0].completed == 5
+
+
+def test_progress_remote_handle_processes() -> None:
     progress = Progress()
     task_id = progress.add_task("foo")
-    track_thread = _TrackThread(progress, task_id, 0.1)
-    assert track_thread.completed == 0
-    from time import sleep
-
-    with track_thread:
-        track_thread.completed = 1
-        sleep(0.3)
-        assert progress.tasks[task_id].completed >= 1
-        track_thread.completed += 1
+    handle = progress.get_remote_handle(task_id)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_advance_remote, [handle] * 4, [1000] * 4))
+    progress.stop()
+    assert progress.tasks[0].completed == 4000
+    assert progress.tasks[0].description == "done"
 
 
 def test_reset() -> None:
@@ -0,0 +1,118 @@
+import io
+import threading
+
+import pytest
+
+from rich._refresh import MAX_IDLE_INTERVAL
+from rich.console import Console
+from rich.live import Live
+
+from .fake_time import make_scheduler
+
+
+def test_refresh_scheduler() -> None:
+    scheduler, fake_time = make_scheduler()
+    assert scheduler.refresh_per_second is None
+    calls = []
+
+    def fast() -> bool:
+        calls.append("fast")
+        return True
+
+    def slow() -> bool:
+        calls.append("slow")
+        return True
+
+    fast_id = scheduler.add(fast, 40)
+    slow_id = scheduler.add(slow, 5)
+    assert scheduler.refresh_per_second == 40
+    thread = scheduler._thread
+    assert thread is not None
+    fake_time.step(20)
+    scheduler.remove(fast_id)
+    scheduler.remove(slow_id)
+    thread.join(5)
+    assert not thread.is_alive()
+    assert scheduler._thread is None
+    assert calls.count("fast") == 20
+    assert calls.count("slow") == 2
+
+
+def test_refresh_scheduler_update_first() -> None:
+    scheduler, fake_time = make_scheduler()
+    calls = []
+    refresh_id = scheduler.add(lambda: bool(calls.append("refresh")), 20)
+    update_id = scheduler.add(
+        lambda: bool(calls.append("update")), 20, update=True
+    )
+    fake_time.step(3)
+    scheduler.remove(refresh_id)
+    scheduler.remove(update_id)
+    assert calls == ["update", "refresh"] * 3
+
+
+def test_refresh_scheduler_back_off() -> None:
+    scheduler, fake_time = make_scheduler()
+    calls = []
+    client_id = scheduler.add(lambda: bool(calls.append(1)), 50)
+    fake_time.step(7)
+    assert len(calls) == 7
+    assert fake_time.intervals == pytest.approx(
+        [0.02, 0.04, 0.08, 0.16, 0.32, MAX_IDLE_INTERVAL, MAX_IDLE_INTERVAL]
+    )
+    assert scheduler._idle
+    scheduler.wake()
+    assert not scheduler._idle
+    fake_time.step()
+    assert fake_time.intervals[-1] == pytest.approx(0.02)
+    scheduler.remove(client_id)
+
+
+def test_refresh_scheduler_error(monkeypatch) -> None:
+    scheduler, fake_time = make_scheduler()
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+    calls = []
+
+    def fail() -> bool:
+        calls.append("fail")
+        raise ValueError("failed")
+
+    scheduler.add(fail, 20)
+    healthy_id = scheduler.add(lambda: bool(calls.append("healthy")), 20)
+    thread = scheduler._thread
+    fake_time.step(3)
+    assert calls.count("fail") == 1
+    assert calls.count("healthy") == 3
+    assert [error.exc_type for error in errors] == [ValueError]
+    assert scheduler._thread is thread
+
+    # The scheduler stops when the last client fails, and restarts on add
+    scheduler.remove(healthy_id)
+    thread.join(5)
+    assert scheduler._thread is None
+    scheduler.add(fail, 20)
+    thread = scheduler._thread
+    fake_time.start_frame()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert calls.count("fail") == 2
+    assert scheduler._thread is None
+    new_id = scheduler.add(lambda: bool(calls.append("healthy")), 20)
+    fake_time.step()
+    assert calls.count("healthy") == 4
+    scheduler.remove(new_id)
+
+
+def test_live_refresh_scheduler() -> None:
+    console = Console(file=io.StringIO(), force_terminal=True)
+    assert console.refresh_scheduler is console.refresh_scheduler
+    with Live("foo", console=console, refresh_per_second=20) as live:
+        assert console.refresh_scheduler.refresh_per_second == 20
+        thread = console.refresh_scheduler._thread
+        assert thread is not None
+        live.update("bar")
+    thread.join(5)
+    assert not thread.is_alive()
+    assert console.refresh_scheduler.refresh_per_second is None
+    assert "bar" in console.file.getvalue()
@@ -2,7 +2,7 @@ import pytest
 
 from rich import errors
 from rich.color import Color, ColorSystem, ColorType
-from rich.style import Style, StyleStack
+from rich.style import Style, StyleStack, StyleTable
 
 
 def test_str():
@@ -172,6 +172,24 @@ def test_render():
     assert Style().render("foo") == "foo"
 
 
+def test_get_render_codes():
+    assert Style(color="red").get_render_codes(color_system=None) == ("", "")
+    assert Style(
+        color="red", bgcolor="black", bold=True
+    ).get_render_codes() == (
+        "\x1b[1;31;40m",
+        "\x1b[0m",
+    )
+    assert Style().get_render_codes() == ("", "")
+    style = Style(bold=True, link="https://example.org")
+    prefix, suffix = style.get_render_codes()
+    assert prefix + "foo" + suffix == style.render("foo")
+    assert style.get_render_codes(legacy_windows=True) == (
+        "\x1b[1m",
+        "\x1b[0m",
+    )
+
+
 def test_test():
     Style(color="red").test("hello")
 
@@ -275,3 +293,40 @@ def test_clear_meta_and_links_clears_hash():
 
     clear_style = style.clear_meta_and_links()
     assert clear_style._hash is None
+
+
+def test_style_table():
+    table = StyleTable(combine_cache_size=2)
+    bold_id = table.get_id(Style(bold=True))
+    red_id = table.get_id(Style.parse("red"))
+    assert table.get_id(Style(bold=True)) == bold_id
+    assert table.get_style(red_id) == Style.parse("red")
+    assert len(table) == 2
+
+    bold_red_id = table.combine(bold_id, red_id)
+    assert table.get_style(bold_red_id) == Style.parse("bold red")
+    assert table.combine(bold_id, red_id) == bold_red_id
+    assert table.combine_ids([red_id, bold_id, red_id]) == bold_red_id
+    assert len(table._combined) <= 2
+
+    link = Style(link="https://example.org")
+    assert table.get_id(link) != table.get_id(link.copy())
+
+
+def test_style_table_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    table = StyleTable()
+    styles = [Style(color=f"color({index})") for index in range(200)]
+
+    def get_ids(offset: int) -> list:
+        return [table.get_id(style) for style in styles[offset:] + styles]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(get_ids, range(8)))
+
+    assert len(table) == len(styles)
+    for style in styles:
+        assert table.get_style(table.get_id(style)) == style
+    for result in results:
+        assert result[-len(styles) :] == results[0][-len(styles) :]
@@ -15,6 +15,7 @@ from rich.syntax import (
     Console,
     PygmentsSyntaxTheme,
     Syntax,
+    TokenCache,
     _SyntaxHighlightRange,
 )
 
@@ -455,3 +456,157 @@ if __name__ == "__main__":
     rendered = render(markdown)
     print(rendered)
     print(repr(rendered))
+
+
+class CountingPythonLexer(PythonLexer):
+    get_tokens_count = 0
+
+    def get_tokens(self, text, unfiltered=False):
+        CountingPythonLexer.get_tokens_count += 1
+        return super().get_tokens(text, unfiltered=unfiltered)
+
+
+def test_token_cache(monkeypatch):
+    token_cache = TokenCache(maxsize=1)
+    monkeypatch.setattr(Syntax, "token_cache", token_cache)
+    CountingPythonLexer.get_tokens_count = 0
+    lexer = CountingPythonLexer()
+
+    text = Syntax(CODE, lexer).highlight(CODE)
+    assert (token_cache.hits, token_cache.misses) == (0, 1)
+    cached_text = Syntax(CODE, lexer, theme="default").highlight(CODE)
+    assert (token_cache.hits, token_cache.misses) == (1, 1)
+    assert CountingPythonLexer.get_tokens_count == 1
+    assert cached_text.plain == text.plain
+    assert Syntax(CODE, lexer).highlight(CODE) == text
+
+    Syntax("import this\n", lexer).highlight("import this\n")
+    assert CountingPythonLexer.get_tokens_count == 2
+    assert len(token_cache._streams) == 1
+
+    # Lexing stops at the end of the line range, and resumes when required
+    Syntax(CODE, lexer).highlight(CODE, line_range=(1, 2))
+    assert not token_cache._streams[TokenCache.get_key(lexer, CODE)].complete
+    assert Syntax(CODE, lexer).highlight(CODE) == text
+    assert CountingPythonLexer.get_tokens_count == 3
+
+    lexer.add_filter("keywordcase")
+    assert TokenCache.get_key(lexer, CODE) is None
+
+
+def test_token_cache_path(tmp_path):
+    lexer = PythonLexer()
+    key = TokenCache.get_key(lexer, CODE)
+    tokens = list(lexer.get_tokens(CODE))
+
+    TokenCache(path=tmp_path).set(key, tokens)
+    assert (tmp_path / f"{key}.json").exists()
+    token_cache = TokenCache(path=tmp_path)
+    assert token_cache.get(key) == tokens
+    assert token_cache.get(key)[0][0] is tokens[0][0]
+    assert token_cache.hits == 2
+
+    (tmp_path / f"{key}.json").write_text("not json")
+    assert TokenCache(path=tmp_path).get(key) is None
+
+
+def test_token_cache_disabled(monkeypatch):
+    monkeypatch.setattr(Syntax, "token_cache", None)
+    syntax = Syntax(CODE, "python")
+    assert syntax.highlight(CODE).plain == CODE + "\n"
+
+
+def test_token_cache_checkpoints(monkeypatch):
+    code = "".join(
+        f'def f{index}():\n    """doc\n    string"""\n    return {index}\n'
+        for index in range(100)
+    )
+    line_ranges = [(150, 160), (1, 3), (390, None), (203, 210)]
+    monkeypatch.setattr(Syntax, "token_cache", None)
+    expected = [
+        Syntax(code, "python").highlight(code, line_range=line_range)
+        for line_range in line_ranges
+    ]
+
+    # Without the token cache, checkpoints are kept by the instance
+    syntax = Syntax(code, "python")
+    result = [
+        syntax.highlight(code, line_range=line_range)
+        for line_range in line_ranges[:2]
+    ]
+    assert result == expected[:2]
+    assert syntax._token_stream is not None
+    stream = syntax._token_stream[1]
+    assert not stream.complete
+    assert stream.get_checkpoint(155)[1] == 100
+
+    syntax = Syntax(code, "python")
+
+    token_cache = TokenCache(checkpoint_lines=10)
+    monkeypatch.setattr(Syntax, "token_cache", token_cache)
+    result = [
+        syntax.highlight(code, line_range=line_range)
+        for line_range in line_ranges
+    ]
+    assert result == expected
+
+    stream = next(iter(token_cache._streams.values()))
+    assert stream.complete
+    token_index, line_no = stream.get_checkpoint(205)
+    assert 190 <= line_no <= 205
+    prefix = "".join(token for _, token in stream.tokens[:token_index])
+    assert prefix.count("\n") == line_no
+
+
+def test_split_code():
+    from rich._syntax_parallel import CHUNK_BOUNDARIES, split_code
+
+    code = "a = 1\n\nb = 2\n\n    c\n\nd = 4\n"
+    boundary = CHUNK_BOUNDARIES["python"]
+    assert split_code(code, boundary, 1) == [
+        "a = 1\n\n",
+        "b = 2\n\n    c\n\n",
+        "d = 4\n",
+    ]
+    assert split_code(code, boundary, 100) == [code]
+    assert split_code("", boundary, 1) == [""]
+
+
+def test_parallel_highlight(monkeypatch):
+    monkeypatch.setattr("rich.syntax.PARALLEL_MIN_SIZE", 0)
+    monkeypatch.setattr("rich.syntax.PARALLEL_CHUNK_SIZE", 100)
+    # Chunks are larger with fewer CPUs, so ensure the code is split
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    monkeypatch.setattr(Syntax, "token_cache", None)
+    import rich._syntax_parallel
+
+    lex_parallel = rich._syntax_parallel.lex_parallel
+    results = []
+
+    def spy_lex_parallel(*args, **kwargs):
+        tokens = lex_parallel(*args, **kwargs)
+        results.append(tokens)
+        return tokens
+
+    monkeypatch.setattr(
+        rich._syntax_parallel, "lex_parallel", spy_lex_parallel
+    )
+
+    code = "\n\n".join([CODE] * 4) + "\n"
+    expected = Syntax(code, "python").highlight(code)
+    assert Syntax(code, "python", parallel=True).highlight(code) == expected
+    # The code was lexed in parallel
+    assert len(results) == 1
+    assert results[0] is not None
+
+    # Fall back to serial lexing if a chunk ends within a string
+    code = f'"""\n\n{CODE}\n\n"""\n'
+    expected = Syntax(code, "python").highlight(code)
+    assert Syntax(code, "python", parallel=True).highlight(code) == expected
+    assert results[-1] is None
+
+    # Fall back to serial lexing for lexers which aren't chunk safe
+    code = "int main() {\n\n  return 0;\n\n}\n" * 10
+    expected = Syntax(code, "c").highlight(code)
+    assert Syntax(code, "c", parallel=True).highlight(code) == expected
+    assert results[-1] is None
@@ -1,6 +1,8 @@
 # encoding=utf-8
 
 import io
+import sqlite3
+from array import array
 from textwrap import dedent
 
 import pytest
@@ -8,8 +10,9 @@ import pytest
 from rich import box, errors
 from rich.console import Console
 from rich.measure import Measurement
+from rich.padding import Padding
 from rich.style import Style
-from rich.table import Column, Table
+from rich.table import Column, StreamingTable, Table, VirtualTable
 from rich.text import Text
 
 
@@ -407,6 +410,201 @@ def test_columns_highlight_added_by_add_row() -> None:
     assert output == expected
 
 
+def render_virtual(table: Table) -> str:
+    console = Console(width=60, file=io.StringIO(), legacy_windows=False)
+    console.print(table)
+    return console.file.getvalue()
+
+
+def test_virtual_table() -> None:
+    rows = [
+        (str(index), f"row {index}", None if index % 3 else "x" * index)
+        for index in range(10)
+    ]
+    table = Table("Index", "Name", "Extra", title="Virtual")
+    for row in rows:
+        table.add_row(*row)
+    virtual_table = VirtualTable(
+        "Index", "Name", "Extra", title="Virtual", rows=rows
+    )
+    assert render_virtual(virtual_table) == render_virtual(table)
+    assert virtual_table.row_count == 10
+    assert len(virtual_table.rows) == 10
+
+
+def test_virtual_table_render_rows() -> None:
+    console = Console(width=40, file=io.StringIO(), legacy_windows=False)
+    table = VirtualTable(
+        "Index",
+        "Square",
+        rows=lambda index: (str(index), str(index * index)),
+        row_count=1_000_000,
+        sample_size=10,
+    )
+    lines = table.render_rows(console, 1000, 1002)
+    text = "\n".join(
+        "".join(segment.text for segment in line) for line in lines
+    )
+    assert text == (
+        "┏━━━━━━━━┳━━━━━━━━━━━━━━┓\n"
+        "┃ Index  ┃ Square       ┃\n"
+        "┡━━━━━━━━╇━━━━━━━━━━━━━━┩\n"
+        "│ 1000   │ 1000000      │\n"
+        "│ 1001   │ 1002001      │\n"
+        "└────────┴──────────────┘"
+    )
+
+
+def test_virtual_table_sample() -> None:
+    table = VirtualTable("foo", rows=[("bar",)] * 1000, sample_size=5)
+    assert list(table._get_measure_row_indexes()) == [0, 250, 500, 749, 999]
+    table = VirtualTable("foo", rows=[("bar",)] * 3, sample_size=5)
+    assert list(table._get_measure_row_indexes()) == [0, 1, 2]
+
+
+def test_virtual_table_errors() -> None:
+    with pytest.raises(ValueError):
+        VirtualTable("foo", rows=lambda index: ("bar",))
+    table = VirtualTable("foo", rows=[])
+    with pytest.raises(TypeError):
+        table.add_row("bar")
+    with pytest.raises(TypeError):
+        table.add_rows([])
+    with pytest.raises(TypeError):
+        table.add_section()
+    table = VirtualTable("foo", rows=[(object(),)])
+    with pytest.raises(errors.NotRenderableError):
+        render_virtual(table)
+
+
+def test_measure_cache(monkeypatch) -> None:
+    measured = []
+    get = Measurement.get.__func__
+
+    def get_measurement(cls, console, options, renderable):
+        if isinstance(renderable, Padding):
+            measured.append(renderable.renderable)
+        return get(cls, console, options, renderable)
+
+    monkeypatch.setattr(Measurement, "get", classmethod(get_measurement))
+    table = Table("foo", "bar")
+    for index in range(10):
+        table.add_row(str(index), Text("bar"))
+    expected = render_virtual(table)
+    # Equal cells are measured once
+    assert len(measured) == 11 + 2
+    measured.clear()
+    assert render_virtual(table) == expected
+    assert not measured
+    table.columns[0]._cells[3] = "changed"
+    table.columns[1]._cells[0].append("baz")
+    table.add_row("new", "row")
+    assert "changed" in render_virtual(table)
+    assert measured == ["changed", "new", Text("barbaz"), "row"]
+
+
+def test_from_columns() -> None:
+    table = Table("Name", "Count", "Ratio", title="Columns")
+    for name, count, ratio in [("foo", 1, 0.5), ("bar", 2, None)]:
+        table.add_row(name, str(count), "" if ratio is None else str(ratio))
+    columns_table = Table.from_columns(
+        {
+            "Name": ["foo", "bar"],
+            "Count": array("l", [1, 2]),
+            "Ratio": (0.5, None),
+        },
+        title="Columns",
+    )
+    assert render_virtual(columns_table) == render_virtual(table)
+    columns_table = Table.from_columns(
+        [(Column("Name", justify="right"), ["foo", Text("bar")])]
+    )
+    assert columns_table.columns[0].justify == "right"
+    assert columns_table.columns[0]._cells == ["foo", Text("bar")]
+    assert len(columns_table.rows) == 2
+    with pytest.raises(ValueError):
+        Table.from_columns({"foo": [1, 2], "bar": [1]})
+    with pytest.raises(errors.NotRenderableError):
+        Table.from_columns({"foo": [object()]})
+
+
+def test_add_rows() -> None:
+    table = Table("foo")
+    table.add_row("first")
+    table.add_rows(
+        ((index, f"row {index}")[: index % 2 + 1] for index in range(5)),
+        style="bold",
+        batch_size=2,
+    )
+    assert len(table.columns) == 2
+    assert table.columns[0]._cells == ["first", "0", "1", "2", "3", "4"]
+    assert table.columns[1]._cells == ["", "", "row 1", "", "row 3", ""]
+    assert len(table.rows) == 6
+    assert table.rows[1].style == "bold"
+
+
+def test_add_rows_cursor() -> None:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE numbers (number, square)")
+    connection.executemany(
+        "INSERT INTO numbers VALUES (?, ?)",
+        [(number, number * number) for number in range(25)],
+    )
+    cursor = connection.execute("SELECT * FROM numbers")
+    table = Table("Number", "Square")
+    table.add_rows(cursor, batch_size=10)
+    connection.close()
+    assert len(table.rows) == 25
+    assert table.columns[1]._cells[-1] == "576"
+
+
+def test_streaming_table() -> None:
+    rows = [("foo", 1, "bar\nbaz"), ("[b]1", None, 2.5)]
+    table = Table("A", Column("B", footer="total"), "C", show_footer=True)
+    for row in rows:
+        table.add_row(*[None if cell is None else str(cell) for cell in row])
+    streaming_table = StreamingTable(
+        "A", Column("B", footer="total"), "C", show_footer=True, rows=rows
+    )
+    assert render_virtual(streaming_table) == render_virtual(table)
+    # A sequence may be rendered again
+    assert render_virtual(streaming_table) == render_virtual(table)
+
+
+def test_streaming_table_incremental() -> None:
+    read = []
+
+    def get_rows():
+        for index in range(3):
+            read.append(index)
+            yield (f"row {index}",)
+
+    table = StreamingTable(Column("foo", width=10), rows=get_rows())
+    console = Console(width=40, file=io.StringIO(), legacy_windows=False)
+    rendered = []
+    for segment in console.render(table):
+        if segment.text.startswith("row"):
+            # Each row is rendered before the next is read
+            assert read[-1] == int(segment.text.split()[1])
+            rendered.append(segment.text.strip())
+    assert rendered == ["row 0", "row 1", "row 2"]
+
+
+def test_streaming_table_sample() -> None:
+    rows = [("foo",), ("bar",), ("wider than the sample",)]
+    table = StreamingTable("x", rows=iter(rows), sample_size=2, box=None)
+    # Rows wider than the sample are wrapped to the sampled widths
+    assert render_virtual(table) == (
+        " x   \n foo \n bar \n wi… \n th… \n the \n sa… \n"
+    )
+    with pytest.raises(TypeError):
+        table.add_row("foo")
+    with pytest.raises(TypeError):
+        table.add_rows([])
+    with pytest.raises(TypeError):
+        table.add_section()
+
+
 if __name__ == "__main__":
     render = render_tables()
     print(render)
@@ -7,7 +7,7 @@ import pytest
 from rich.console import Console, Group
 from rich.measure import Measurement
 from rich.style import Style
-from rich.text import Span, Text
+from rich.text import COMPACT_STYLE_TABLE_SIZE, CompactSpans, Span, Text
 
 
 def test_span():
@@ -1088,3 +1088,75 @@ def test_append_loop_regression() -> None:
     b = Text("two", "blue")
     b.append_text(b)
     assert b.plain == "twotwo"
+
+
+def test_compact_spans():
+    bold = Style(bold=True)
+    spans = CompactSpans([Span(0, 2, "red"), Span(1, 3, bold)])
+    assert len(spans) == 2
+    assert spans == [Span(0, 2, "red"), Span(1, 3, bold)]
+    assert spans[1] == Span(1, 3, bold)
+    assert spans[1].style is bold
+    assert isinstance(spans[:1], CompactSpans)
+    assert spans[:1] == [Span(0, 2, "red")]
+
+    spans.append(Span(4, 5, "red"))
+    spans.insert(0, Span(0, 1, "green"))
+    spans[1] = Span(0, 3, "blue")
+    assert list(spans) == [
+        Span(0, 1, "green"),
+        Span(0, 3, "blue"),
+        Span(1, 3, bold),
+        Span(4, 5, "red"),
+    ]
+    assert spans._styles == ["red", bold, "green", "blue"]
+
+    spans[:] = [span.move(1) for span in spans]
+    assert spans[0] == Span(1, 2, "green")
+    del spans[1:3]
+    assert spans == [Span(1, 2, "green"), Span(5, 6, "red")]
+    assert repr(spans) == "[Span(1, 2, 'green'), Span(5, 6, 'red')]"
+
+    copy = spans.copy()
+    copy.clear()
+    assert not copy
+    assert len(spans) == 2
+    assert copy._styles is spans._styles
+
+
+def test_compact_spans_text():
+    spans = CompactSpans([Span(0, 5, "bold"), Span(6, 11, "italic")])
+    text = Text("Hello World", spans=spans)
+    assert text.spans is spans
+
+    text.stylize("red", 3, 8)
+    assert isinstance(text.spans, CompactSpans)
+    assert isinstance(text.copy().spans, CompactSpans)
+    assert isinstance(text.blank_copy().spans, CompactSpans)
+
+    list_text = Text("Hello World", spans=list(text.spans))
+    assert text == list_text
+
+    lines = text.divide([4, 7])
+    assert all(isinstance(line.spans, CompactSpans) for line in lines)
+    assert all(line.spans._styles is spans._styles for line in lines)
+    assert list(lines) == list(list_text.divide([4, 7]))
+
+    console = Console()
+    assert list(text.render(console)) == list(list_text.render(console))
+
+    text.right_crop(2)
+    list_text.right_crop(2)
+    assert text == list_text
+
+
+def test_compact_spans_style_table_size():
+    spans = CompactSpans([Span(0, 1, "bold")])
+    shared = spans.copy()
+    for index in range(COMPACT_STYLE_TABLE_SIZE * 3):
+        spans.append(Span(0, 1, f"style{index}"))
+        del spans[-1]
+    assert len(spans._styles) <= COMPACT_STYLE_TABLE_SIZE + 1
+    assert spans == [Span(0, 1, "bold")]
+    assert shared == [Span(0, 1, "bold")]
+    assert shared._styles is not spans._styles
@@ -1,4 +1,3 @@
-import subprocess
 from typing import List, Tuple
 import sys
 
@@ -74,16 +73,23 @@ def run():
     with progress:
         widths_table = make_widths_table()
         test(widths_table)
+    # A flat tuple of ints loads faster than a list of tuples
+    ranges = "\n".join(
+        f"    {start}, {end}, {width}," for start, end, width in widths_table
+    )
     table_file = f"""# Auto generated by make_terminal_widths.py
 
-CELL_WIDTHS = {widths_table!r}
-
+# Ranges of codepoints with a cell width other than 1, flattened in to (start, end, width)
+# triplets ordered by start. A width of -1 indicates a non-printable control code.
+# fmt: off
+CELL_WIDTH_RANGES = (
+{ranges}
+)
+# fmt: on
 """
     with open("../rich/_cell_widths.py", "wt") as fh:
         fh.write(table_file)
 
-    subprocess.run("black ../rich/_cell_widths.py", shell=True)
-
 
 if __name__ == "__main__":
     run()